@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Narrow-phase benchmark
+
+Times VectorSprite.checkPolygonCollision against narrowphase.polygonsCollide
+on sprite pairs placed close enough for their bounding circles to overlap,
+and checks the new test on the game's rock, ship, saucer and station shapes.
+
+    python benchmarks/bench_narrowphase.py --pairs 20000
+
+The reference counts a pair as colliding when two edges cross or touch
+(using exact integer orientation tests) or when one outline lies inside
+the other. The old test misses the second case, and its slope-intercept
+math gets some crossings wrong. The saucer and the space station are
+approximated by their convex hulls, so for them only missed collisions
+count as errors.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.entities.rock import Rock
+from src.entities.saucer import Saucer
+from src.entities.space_station import SpaceStation
+from src.util.narrowphase import convexPieces, polygonsCollide
+from src.util.vector2d import Vector2d
+from src.util.vectorsprites import VectorSprite, shapePrototype
+
+SHIP_POINTS = [(0, -10), (6, 10), (3, 7), (-3, 7), (-6, 10)]
+
+
+def gameShapes():
+    """(name, pointlist, exact) for every outline the game collides"""
+    shapes = []
+    for shape in range(1, 5):
+        points = Rock.createPointList(shape)
+        for rockType, scale in enumerate(Rock.scales):
+            shapes.append((f"rock{shape}/{rockType}", shapePrototype(points, scale), True))
+    shapes.append(("ship", SHIP_POINTS, True))
+    for saucerType, scale in enumerate(Saucer.scales):
+        shapes.append((f"saucer/{saucerType}", shapePrototype(Saucer.pointlist, scale), False))
+    shapes.append(("station", SpaceStation.pointlist, False))
+    return shapes
+
+
+def insideOutline(point, polygon):
+    """Even-odd point in polygon test"""
+    x, y = point
+    inside = False
+    for i in range(len(polygon)):
+        x1, y1 = polygon[i - 1]
+        x2, y2 = polygon[i]
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def orientation(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def segmentsTouch(p1, p2, p3, p4):
+    d1 = orientation(p3, p4, p1)
+    d2 = orientation(p3, p4, p2)
+    d3 = orientation(p1, p2, p3)
+    d4 = orientation(p1, p2, p4)
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return True
+
+    def within(a, b, p):
+        return (min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and
+                min(a[1], b[1]) <= p[1] <= max(a[1], b[1]))
+
+    return ((d1 == 0 and within(p3, p4, p1)) or (d2 == 0 and within(p3, p4, p2)) or
+            (d3 == 0 and within(p1, p2, p3)) or (d4 == 0 and within(p1, p2, p4)))
+
+
+def referenceCollide(sprite1, sprite2):
+    polygon1 = sprite1.worldPolygon()
+    polygon2 = sprite2.worldPolygon()
+    for i in range(len(polygon1)):
+        for j in range(len(polygon2)):
+            if segmentsTouch(polygon1[i - 1], polygon1[i], polygon2[j - 1], polygon2[j]):
+                return True
+    return insideOutline(polygon1[0], polygon2) or insideOutline(polygon2[0], polygon1)
+
+
+def buildPairs(shapes, count, rng):
+    pairs = []
+    for _ in range(count):
+        shape1 = rng.choice(shapes)
+        shape2 = rng.choice(shapes)
+        sprite1 = VectorSprite(Vector2d(0, 0), Vector2d(0, 0), shape1[1], rng.randrange(360))
+        reach = sprite1.getBoundingRadius()
+        sprite2 = VectorSprite(Vector2d(0, 0), Vector2d(0, 0), shape2[1], rng.randrange(360))
+        reach += sprite2.getBoundingRadius()
+        angle = rng.uniform(0, 2 * math.pi)
+        distance = rng.uniform(0, reach)
+        sprite2.position.x = round(distance * math.cos(angle))
+        sprite2.position.y = round(distance * math.sin(angle))
+        pairs.append((shape1, shape2, sprite1, sprite2))
+    return pairs
+
+
+def timeTest(test, pairs):
+    start = time.perf_counter()
+    for _, _, sprite1, sprite2 in pairs:
+        test(sprite1, sprite2)
+    return (time.perf_counter() - start) / len(pairs) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--pairs', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    shapes = gameShapes()
+    for name, points, _ in shapes:
+        print(f"{name:>10}: {len(points):>2} points, {len(convexPieces(points))} convex pieces")
+
+    pairs = buildPairs(shapes, args.pairs, rng)
+    old = timeTest(lambda a, b: a.checkPolygonCollision(b), pairs)
+    new = timeTest(polygonsCollide, pairs)
+    print(f"\n{'pairs':>8} {'old us':>8} {'new us':>8} {'speedup':>8}")
+    print(f"{len(pairs):>8} {old:>8.1f} {new:>8.1f} {old / new:>7.1f}x")
+
+    errors = 0
+    old_errors = 0
+    for shape1, shape2, sprite1, sprite2 in pairs:
+        expected = referenceCollide(sprite1, sprite2)
+        result = polygonsCollide(sprite1, sprite2)
+        if expected != (sprite1.checkPolygonCollision(sprite2) is not None):
+            old_errors += 1
+        exact = shape1[2] and shape2[2]
+        if result != expected and (exact or not result):
+            errors += 1
+            if errors <= 10:
+                print(f"mismatch: {shape1[0]} vs {shape2[0]} at "
+                      f"({sprite2.position.x}, {sprite2.position.y}) "
+                      f"angles {sprite1.angle}/{sprite2.angle}: expected {expected}")
+    print(f"\ncorrectness: {errors} mismatches "
+          f"(the old test disagrees with the reference on {old_errors} pairs)")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
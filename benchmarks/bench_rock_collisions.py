@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Rock collision kernel benchmark
+
+Runs the same seeded belt of rocks through the scalar pair-by-pair
+response and the vectorized NumPy kernel, checks that positions, headings
+and angles agree within tolerance, and times both at several rock counts.
+
+    python benchmarks/bench_rock_collisions.py --counts 1000 5000 20000
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.entities.rock import Rock
+from src.systems.universe import Universe
+from src.util.vector2d import Vector2d
+
+# Average spacing between rock centres, dense enough for frequent contacts
+SPACING = 90
+
+
+def buildUniverse(count, useRockStore, seed):
+    random.seed(seed)
+    side = int(math.sqrt(count) * SPACING)
+    universe = Universe(width=side, height=side, useRockStore=useRockStore)
+    for _ in range(count):
+        position = Vector2d(random.uniform(0, side), random.uniform(0, side))
+        universe.addObject(Rock(None, position, random.randrange(3)))
+    return universe
+
+
+def rockState(universe):
+    return [(float(rock.position.x), float(rock.position.y),
+             float(rock.heading.x), float(rock.heading.y), float(rock.angle))
+            for rock in universe.rocks]
+
+
+def run(universe, ticks, seed):
+    """Advance the universe, returning the mean collision time in ms"""
+    random.seed(seed)
+    spent = 0.0
+    for _ in range(ticks):
+        universe.updateObjects()
+        start = time.perf_counter()
+        universe.handleRockRockCollisions()
+        spent += time.perf_counter() - start
+    return spent / ticks * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000, 5000, 20000])
+    parser.add_argument('--ticks', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--tolerance', type=float, default=1e-6)
+    args = parser.parse_args()
+
+    print(f"{'rocks':>7} {'scalar ms':>10} {'kernel ms':>10} {'speedup':>8} {'max error':>10}  match")
+    for count in args.counts:
+        scalar = buildUniverse(count, False, args.seed)
+        kernel = buildUniverse(count, True, args.seed)
+
+        scalar_ms = run(scalar, args.ticks, args.seed)
+        kernel_ms = run(kernel, args.ticks, args.seed)
+
+        error = max(abs(a - b)
+                    for before, after in zip(rockState(scalar), rockState(kernel))
+                    for a, b in zip(before, after))
+        match = 'ok' if error <= args.tolerance else 'MISMATCH'
+        print(f"{count:>7} {scalar_ms:>10.2f} {kernel_ms:>10.2f} "
+              f"{scalar_ms / kernel_ms:>7.1f}x {error:>10.2e}  {match}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Rock store benchmark
+
+Times Universe.updateObjects with rocks moving one Python call at a time
+against the NumPy RockStore advancing them in a single vectorized step.
+
+    python benchmarks/bench_rock_store.py --counts 1000 10000 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.entities.rock import Rock
+from src.systems.universe import Universe
+from src.util.vector2d import Vector2d
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def buildUniverse(count, useRockStore, seed):
+    random.seed(seed)
+    universe = Universe(width=20000, height=20000, useRockStore=useRockStore)
+    for _ in range(count):
+        position = Vector2d(random.uniform(0, universe.width), random.uniform(0, universe.height))
+        universe.addObject(Rock(None, position, random.randrange(3)))
+    return universe
+
+
+def timeUpdates(universe, ticks):
+    start = time.perf_counter()
+    for _ in range(ticks):
+        universe.updateObjects()
+    return (time.perf_counter() - start) / ticks * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--ticks', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'rocks':>8} {'objects ms':>11} {'store ms':>9} {'speedup':>8} {'store fits 60 FPS':>18}")
+    for count in args.counts:
+        per_object = timeUpdates(buildUniverse(count, False, args.seed), args.ticks)
+        stored = buildUniverse(count, True, args.seed)
+        vectorized = timeUpdates(stored, args.ticks)
+        fits = 'yes' if vectorized < FRAME_BUDGET_MS else 'no'
+        print(f"{count:>8} {per_object:>11.2f} {vectorized:>9.2f} "
+              f"{per_object / vectorized:>7.1f}x {fits:>18}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Scenario benchmark suite
+
+Runs the whole game headless (one tick and one render per frame) through
+named load scenarios and reports the p50/p95/p99 frame time, objects
+processed per second and the mean time of each profiled stage.
+
+    python benchmarks/bench_scenarios.py --frames 300 --output results.json
+    python benchmarks/bench_scenarios.py --compare results.json
+
+Scenarios:
+    dense-belt       5000 rocks from Universe.createAsteroidBelts
+    chain-explosion  40 rocks a frame through Game.handleRockDestroyed
+    bullet-storm     ship fires 20 bullets a frame in every direction
+    crystal-flood    500 crystals dropped into the CrystalSystem bin
+    minimap-20k      mini map drawn over a 20000 rock universe
+
+The ship is invulnerable in every scenario so each frame measures the same
+game state. Results are written as JSON, tagged with the git commit, so
+runs can be compared across commits with --compare.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Null video and audio drivers unless a display was asked for explicitly
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from src.audio.soundManager import initSoundManager
+from src.core.headless import HeadlessGame
+from src.entities.shooter import Shooter
+from src.util.vector2d import Vector2d
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+class ScenarioGame(HeadlessGame):
+    """Headless game whose ship survives every hit.
+
+    Scenarios build their rocks across the whole universe themselves, so
+    chunk streaming is off.
+    """
+
+    useChunks = False
+
+    def killShip(self):
+        pass
+
+
+def setupDenseBelt(game):
+    game.universe.createAsteroidBelts(25, 200)
+
+
+def setupChainExplosion(game):
+    game.universe.createAsteroidBelts(10, 200)
+
+
+def chainExplosionFrame(game, frame):
+    for rock in game.universe.rocks[:40]:
+        game.handleRockDestroyed(rock)
+
+
+def setupBulletStorm(game):
+    game.universe.createRockBelt(game.ship.position, 700, 600)
+    game.ship.maxBullets = 10000
+
+
+def bulletStormFrame(game, frame):
+    ship = game.ship
+    for shot in range(20):
+        angle = (frame * 7 + shot * 18) * math.pi / 180
+        heading = Vector2d(math.sin(angle) * ship.bulletVelocity,
+                           -math.cos(angle) * ship.bulletVelocity)
+        Shooter.fireBullet(ship, heading, ship.bulletTtl, ship.bulletVelocity)
+
+
+def crystalFloodFrame(game, frame):
+    # 500 crystals over the first 50 frames
+    if frame < 50:
+        for drop in range(10):
+            game.crystalSystem.addCrystal((frame + drop) % 3)
+
+
+def setupMinimap(game):
+    game.universe.createAsteroidBelts(40, 500)
+    game.showMiniMap = True
+
+
+# name -> (setup, per-frame action)
+SCENARIOS = {
+    "dense-belt": (setupDenseBelt, None),
+    "chain-explosion": (setupChainExplosion, chainExplosionFrame),
+    "bullet-storm": (setupBulletStorm, bulletStormFrame),
+    "crystal-flood": (None, crystalFloodFrame),
+    "minimap-20k": (setupMinimap, None),
+}
+
+
+def percentile(ordered, fraction):
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def runScenario(name, frames, warmup, seed):
+    setup, action = SCENARIOS[name]
+    random.seed(seed)
+    game = ScenarioGame()
+    game.initialiseGame()
+    if setup is not None:
+        setup(game)
+
+    times = []
+    objects = 0
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            game.profiler.reset()
+        start = time.perf_counter()
+        if action is not None:
+            action(game, frame)
+        game.tick()
+        game.render(1.0)
+        elapsed = time.perf_counter() - start
+        if frame >= warmup:
+            times.append(elapsed)
+            objects += len(game.universe.objects) + len(game.crystalSystem.bin_crystals)
+
+    ordered = sorted(times)
+    total = sum(times)
+    return {
+        "frames": frames,
+        "p50_ms": percentile(ordered, 0.50) * 1000,
+        "p95_ms": percentile(ordered, 0.95) * 1000,
+        "p99_ms": percentile(ordered, 0.99) * 1000,
+        "mean_ms": total / frames * 1000,
+        "objects": objects / frames,
+        "objects_per_sec": objects / total,
+        "stages_ms": {section: mean * 1000 for section, _, _, mean, _ in game.profiler.report()},
+    }
+
+
+def gitCommit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="JSON results of an earlier run to compare p50/p95 with")
+    args = parser.parse_args()
+
+    initSoundManager(enabled=False)
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as previous:
+            baseline = json.load(previous)["scenarios"]
+
+    results = {}
+    print(f"{'scenario':<16} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'objects':>8} "
+          f"{'objects/s':>11}  slowest stages")
+    for name in args.scenarios:
+        result = runScenario(name, args.frames, args.warmup, args.seed)
+        results[name] = result
+        slowest = sorted(result["stages_ms"].items(), key=lambda item: item[1], reverse=True)[:3]
+        stages = ", ".join(f"{stage} {ms:.2f}" for stage, ms in slowest)
+        print(f"{name:<16} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+              f"{result['p99_ms']:>8.2f} {result['objects']:>8.0f} "
+              f"{result['objects_per_sec']:>11.0f}  {stages}")
+        if name in baseline:
+            before = baseline[name]
+            print(f"{'':<16} {before['p50_ms'] / result['p50_ms']:>7.2f}x "
+                  f"{before['p95_ms'] / result['p95_ms']:>7.2f}x  speedup over {args.compare}")
+
+    if args.output:
+        report = {
+            "commit": gitCommit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "scenarios": results,
+        }
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Spatial index benchmark
+
+Times region, radius and k-nearest queries against the grid index and the
+brute-force reference as the object count grows, and checks that both return
+the same objects. The area around the query point always holds the same
+number of objects, so a flat grid column means query cost depends on what is
+on screen rather than on everything alive.
+
+    python benchmarks/bench_spatial_index.py --counts 1000 10000 50000
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.systems.spatial_index import BruteForceIndex, UniformGridIndex
+from src.util.vector2d import Vector2d
+
+WORLD_SIZE = 20000
+VIEW_WIDTH = 1024
+VIEW_HEIGHT = 768
+LOCAL_OBJECTS = 150
+
+
+class Probe:
+    """Minimal stand-in for a game object"""
+
+    def __init__(self, x, y):
+        self.position = Vector2d(x, y)
+
+
+def buildObjects(count, rng):
+    """Scatter objects in belts, keeping a fixed population near the centre"""
+    center = WORLD_SIZE / 2
+    objects = [Probe(rng.uniform(center - VIEW_WIDTH / 2, center + VIEW_WIDTH / 2),
+                     rng.uniform(center - VIEW_HEIGHT / 2, center + VIEW_HEIGHT / 2))
+               for _ in range(min(LOCAL_OBJECTS, count))]
+
+    belts = []
+    while len(belts) < 8:
+        bx = rng.uniform(WORLD_SIZE * 0.1, WORLD_SIZE * 0.9)
+        by = rng.uniform(WORLD_SIZE * 0.1, WORLD_SIZE * 0.9)
+        if math.hypot(bx - center, by - center) > 3000:
+            belts.append((bx, by, rng.uniform(300, 800)))
+
+    while len(objects) < count:
+        bx, by, radius = belts[len(objects) % len(belts)]
+        angle = rng.uniform(0, 2 * math.pi)
+        distance = rng.uniform(radius * 0.3, radius * 1.2)
+        objects.append(Probe(bx + distance * math.cos(angle),
+                             by + distance * math.sin(angle)))
+    return objects
+
+
+def timeQueries(index, queries, repeats):
+    """Return the mean time per query in microseconds for each query kind"""
+    results = {}
+    for name, query in queries.items():
+        start = time.perf_counter()
+        for _ in range(repeats):
+            query(index)
+        results[name] = (time.perf_counter() - start) / repeats * 1e6
+    return results
+
+
+def sameObjects(a, b):
+    return set(map(id, a)) == set(map(id, b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--counts', type=int, nargs='+',
+                        default=[1000, 5000, 10000, 25000, 50000])
+    parser.add_argument('--repeats', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    center = WORLD_SIZE / 2
+    queries = {
+        'region': lambda index: index.queryRegion(center - VIEW_WIDTH / 2, center - VIEW_HEIGHT / 2,
+                                                  VIEW_WIDTH, VIEW_HEIGHT),
+        'radius': lambda index: index.queryRadius(center, center, 300),
+        'nearest': lambda index: index.queryNearest(center, center, 8),
+    }
+
+    print(f"{'objects':>8} {'query':>8} {'grid us':>10} {'brute us':>10} {'speedup':>8}  match")
+    for count in args.counts:
+        rng = random.Random(args.seed)
+        objects = buildObjects(count, rng)
+
+        grid = UniformGridIndex()
+        brute = BruteForceIndex()
+        for obj in objects:
+            grid.insert(obj)
+            brute.insert(obj)
+
+        # Move everything a little so the incremental path is exercised
+        for obj in objects:
+            obj.position.x += rng.uniform(-40, 40)
+            obj.position.y += rng.uniform(-40, 40)
+            grid.update(obj)
+
+        brute_repeats = max(1, args.repeats // 20)
+        grid_times = timeQueries(grid, queries, args.repeats)
+        brute_times = timeQueries(brute, queries, brute_repeats)
+
+        for name, query in queries.items():
+            grid_result = query(grid)
+            brute_result = query(brute)
+            if name == 'nearest':
+                # Ties may be ordered differently, so compare the distances
+                distance = lambda obj: math.hypot(obj.position.x - center, obj.position.y - center)
+                match = [distance(o) for o in grid_result] == [distance(o) for o in brute_result]
+            else:
+                match = sameObjects(grid_result, brute_result)
+            speedup = brute_times[name] / grid_times[name]
+            print(f"{count:>8} {name:>8} {grid_times[name]:>10.1f} {brute_times[name]:>10.1f} "
+                  f"{speedup:>7.1f}x  {'ok' if match else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Sprite atlas benchmark
+
+Times Stage.drawSprites with spinning on-screen rocks drawn as aalines
+outlines against the same rocks blitted from a warmed-up SpriteAtlas.
+
+    python benchmarks/bench_sprite_atlas.py --counts 500 1000 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Render off-screen unless a display was asked for explicitly
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from src.entities.rock import Rock
+from src.ui.sprite_atlas import SpriteAtlas
+from src.ui.stage import Stage
+from src.util.vector2d import Vector2d
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def buildRocks(count, width, height, seed):
+    random.seed(seed)
+    return [Rock(None, Vector2d(random.uniform(0, width), random.uniform(0, height)),
+                 random.randrange(3)) for _ in range(count)]
+
+
+def timeFrames(stage, rocks, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        for rock in rocks:
+            rock.angle += 1
+        stage.drawSprites(rocks)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[500, 1000, 2000])
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--angle-step', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    stage = Stage("Sprite atlas benchmark", (1024, 768))
+    atlas = SpriteAtlas(args.angle_step)
+
+    print(f"{'rocks':>8} {'aalines ms':>11} {'atlas ms':>9} {'speedup':>8} {'atlas fits 60 FPS':>18}")
+    for count in args.counts:
+        rocks = buildRocks(count, stage.width, stage.height, args.seed)
+
+        stage.atlas = None
+        outlines = timeFrames(stage, rocks, args.frames)
+
+        stage.atlas = atlas
+        timeFrames(stage, rocks, 360 // args.angle_step)  # render every angle once
+        blitted = timeFrames(stage, rocks, args.frames)
+
+        fits = 'yes' if blitted < FRAME_BUDGET_MS else 'no'
+        print(f"{count:>8} {outlines:>11.2f} {blitted:>9.2f} "
+              f"{outlines / blitted:>7.1f}x {fits:>18}")
+
+    stats = atlas.stats()
+    print(f"atlas: {stats['images']} images, {stats['bytes'] / 1024:.0f} KiB, "
+          f"hit rate {stats['hitRate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+World generation benchmark
+
+Times Universe.createAsteroidBelts placing rocks one at a time with the
+random module against the WorldGenerator sampling whole belts as arrays,
+both as packed records, as live rocks and packed away into chunks.
+
+    python benchmarks/bench_worldgen.py --counts 10000 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.systems.biomes import BiomeMap
+from src.systems.universe import Universe
+
+ROCKS_PER_BELT = 500
+TARGET_SECONDS = 1.0
+
+
+def timeBelts(universe, count, seed):
+    random.seed(seed)
+    start = time.perf_counter()
+    universe.createAsteroidBelts(max(count // ROCKS_PER_BELT, 1), ROCKS_PER_BELT)
+    return time.perf_counter() - start
+
+
+def timeRecords(universe, count, seed):
+    random.seed(seed)
+    start = time.perf_counter()
+    universe.worldgen.belts(universe.worldgen.newRng(), max(count // ROCKS_PER_BELT, 1),
+                            ROCKS_PER_BELT)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help="don't time the one-rock-at-a-time generator")
+    args = parser.parse_args()
+
+    biome_map = BiomeMap(args.seed)
+    print(f"{'rocks':>8} {'legacy s':>9} {'records s':>10} {'live s':>7} {'chunked s':>10} "
+          f"{'chunked under 1 s':>17}")
+    for count in args.counts:
+        legacy = float('nan')
+        if not args.skip_legacy:
+            legacy = timeBelts(Universe(20000, 20000, useWorldgen=False), count, args.seed)
+        generator = Universe(20000, 20000, biomeMap=biome_map)
+        records = timeRecords(generator, count, args.seed)
+        live = timeBelts(Universe(20000, 20000, biomeMap=biome_map), count, args.seed)
+        chunked_universe = Universe(20000, 20000, biomeMap=biome_map)
+        chunked_universe.enableChunks(args.seed)
+        chunked = timeBelts(chunked_universe, count, args.seed)
+        fits = 'yes' if chunked < TARGET_SECONDS else 'no'
+        print(f"{count:>8} {legacy:>9.3f} {records:>10.3f} {live:>7.3f} {chunked:>10.3f} "
+              f"{fits:>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,57 @@
 #!/usr/bin/env python3
 
-import pygame
+import argparse
 import sys
 import os
 
 # Add the src directory to the Python path so we can import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.core.game import Game
-from src.audio.soundManager import initSoundManager
+
+def parseArgs():
+    parser = argparse.ArgumentParser(description="New Kingdom asteroids game")
+    parser.add_argument('--headless', action='store_true',
+                        help="run without a window or audio and print timings")
+    parser.add_argument('--frames', type=int, default=1000,
+                        help="frames to run in headless mode")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="random seed for the universe and random input")
+    parser.add_argument('--script', default=None,
+                        help="JSON input script to replay instead of random input")
+    parser.add_argument('--no-input', action='store_true',
+                        help="headless mode without any input (the ship drifts)")
+    return parser.parse_args()
+
 
 def main():
+    args = parseArgs()
+    if args.headless:
+        # Null video and audio drivers; must be set before pygame starts
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    import pygame
+    from src.core.game import Game
+    from src.audio.soundManager import initSoundManager
+
+    if args.headless:
+        from src.core.headless import runHeadless
+        initSoundManager(enabled=False)
+        runHeadless(args.frames, args.seed, args.script, not args.no_input)
+        return
+
     # Check for pygame components
     if not pygame.font:
         print('Warning, fonts disabled')
     if not pygame.mixer:
         print('Warning, sound disabled')
-    
+
     # Initialize sound system
     initSoundManager()
-    
+
     # Create and run the game
     game = Game()
     game.playGame()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -8,7 +8,22 @@ from ..config.config import SOUND_FILES
 sounds = {}  # create empty dictionary of sounds
 
 
-def initSoundManager():
+class NullSound:
+    """Silent stand-in for a pygame Sound when running without audio"""
+
+    def play(self, loops=0):
+        return None
+
+    def stop(self):
+        return None
+
+
+def initSoundManager(enabled=True):
+    if not enabled:
+        # No audio device needed; every sound is silent
+        for sound_name in SOUND_FILES:
+            sounds[sound_name] = NullSound()
+        return
     pygame.mixer.init()
     # Load sounds using paths from config
     for sound_name, sound_path in SOUND_FILES.items():
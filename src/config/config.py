@@ -10,6 +10,9 @@ UNIVERSE_HEIGHT = 20000
 # Screen Settings
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
+# Only restore and update the changed parts of the screen while the camera is still
+DIRTY_RECTS_ENABLED = True
+DIRTY_RECTS_MAX_COVERAGE = 0.5  # flip instead once a frame touches this much of the screen
 
 # Ship Settings
 SHIP_ACCELERATION = 0.2
@@ -23,18 +26,109 @@ SHIP_BULLET_TTL = 35
 # Camera Settings
 CAMERA_FOLLOW_SPEED = 0.1
 
+# Spatial Index Settings
+SPATIAL_INDEX_TYPE = "grid"  # "grid" or "brute" (reference scan, for checking the grid)
+SPATIAL_GRID_CELL_SIZE = 256
+VISIBILITY_PADDING = 50
+
+# Mini Map Settings
+# Rocks and the station are drawn into a cached layer redrawn this often
+# (in frames); the ship, saucer and debris are drawn over it every frame.
+# With NumPy a redraw is spread over about 15 frames, one marker colour each
+MINIMAP_REFRESH_INTERVAL = 30
+
+# Biome Settings
+WORLD_SEED = None  # fixed seed for biomes, None for a new world each run
+BIOME_SCALE = 4000  # world pixels across a typical biome
+BIOME_DETAIL_SCALE = 900  # size of the nebula clouds inside a biome
+BIOME_BLEND = 0.15  # width of the blend between neighbouring biomes (noise units)
+# Indexed heat * 2 + density; nebula is the tint of the background, stars
+# the number of background stars per million square pixels, belts scales the
+# chance of a chunk holding a belt and materials weighs (coal, iron, gold)
+BIOMES = (
+    {"name": "Void", "nebula": (6, 6, 18), "stars": 150,
+     "belts": 0.5, "materials": (0.6, 0.3, 0.1)},
+    {"name": "Azure Nebula", "nebula": (18, 32, 72), "stars": 450,
+     "belts": 1.0, "materials": (0.4, 0.5, 0.1)},
+    {"name": "Ember Drift", "nebula": (58, 18, 26), "stars": 250,
+     "belts": 1.0, "materials": (0.35, 0.3, 0.35)},
+    {"name": "Verdant Cloud", "nebula": (14, 52, 44), "stars": 600,
+     "belts": 1.5, "materials": (0.75, 0.2, 0.05)},
+)
+# World-anchored background tiles generated from the biome map and kept in
+# an LRU cache; tiles in the camera's path are generated a few per frame
+BIOME_TILES_ENABLED = True
+BIOME_TILE_SIZE = 256
+BIOME_TILE_SAMPLE_STEP = 16  # pixels between noise samples, interpolated in between
+BIOME_TILE_CACHE_BYTES = 24 * 1024 * 1024
+BIOME_TILE_LOOKAHEAD = 45  # ticks of camera motion to generate tiles ahead of
+BIOME_TILES_PER_FRAME = 1
+
+# Chunk Settings
+# Rocks are generated per chunk from the world seed and kept packed away;
+# a chunk's rocks come alive when the camera comes within CHUNK_LOAD_RADIUS
+# of it and are packed away again once it is further than
+# CHUNK_UNLOAD_RADIUS, so only rocks near the player simulate
+CHUNKS_ENABLED = True
+CHUNK_SIZE = 2000
+CHUNK_LOAD_RADIUS = 2500
+CHUNK_UNLOAD_RADIUS = 3500
+CHUNK_UPDATE_INTERVAL = 15  # ticks between load/unload passes
+CHUNK_BELT_CHANCE = 0.1  # chance of a chunk holding a belt (and of each further one)
+CHUNK_ROCKS_PER_BELT = 15
+CHUNK_SPAWN_CLEARANCE = 1000  # no belts this close to the spawn point
+
+# Level Of Detail Settings
+# Rocks are simulated at a rate set by their distance from the camera
+# centre: (radius, ticks between updates) per band, nearest first. A rock
+# that skipped ticks moves by all of them at once when it is next updated.
+# Rocks beyond the last radius are frozen until they come back into range or
+# are looked up. The first radius should cover the screen; intervals work
+# best as multiples of each other, so rocks of neighbouring bands still
+# collide on the ticks they share
+LOD_ENABLED = True
+LOD_BANDS = ((1200, 1), (2500, 2), (4000, 4))
+
+# World Generation Settings
+# Belts are sampled as whole arrays of rocks, their materials weighted by the
+# biome map (needs NumPy, otherwise rocks are placed one by one)
+WORLDGEN_ENABLED = True
+# Gold grows more likely and coal less with distance from the spawn point:
+# at the universe's edge gold weighs (1 + this) times its biome weight
+WORLDGEN_DEPTH_RICHNESS = 2.0
+
+# Sprite Atlas Settings
+# Blit rocks, ship, saucers and the station from pre-rendered rotations
+# instead of drawing their outlines with aalines every frame
+SPRITE_ATLAS_ENABLED = False
+SPRITE_ATLAS_ANGLE_STEP = 3  # degrees between cached rotations
+SPRITE_ATLAS_MAX_BYTES = 32 * 1024 * 1024
+
 # Rock Settings
 ROCK_LARGE_TYPE = 0
 ROCK_MEDIUM_TYPE = 1
 ROCK_SMALL_TYPE = 2
 ROCK_VELOCITIES = (1.5, 3.0, 4.5)
 ROCK_SCALES = (2.5, 1.5, 0.6)
+# Approximate collision radius per rock type used by rock-rock physics
+ROCK_RADII = (35, 22, 12)
 ROCK_SCORES = {
     ROCK_LARGE_TYPE: 50,
     ROCK_MEDIUM_TYPE: 100,
     ROCK_SMALL_TYPE: 200
 }
 
+# Extra reach given to the rock-rock broadphase so pairs pushed into contact
+# by an earlier separation in the same pass are still resolved. Separating a
+# pair moves each rock by half their overlap, at most the largest radius, so
+# two rocks pushed towards each other close a gap of up to twice that. Longer
+# chains of pushes in one pass could still close a wider gap; such pairs are
+# resolved on the next tick instead
+ROCK_BROADPHASE_MARGIN = 2 * max(ROCK_RADII)
+
+# Keep rock state in NumPy arrays and move all rocks in one step (needs NumPy)
+ROCK_STORE_ENABLED = True
+
 # Rock sounds
 ROCK_SOUNDS = {
     ROCK_LARGE_TYPE: "explode1",
@@ -55,6 +149,9 @@ SAUCER_BULLET_VELOCITY = 5
 # Debris Settings
 DEBRIS_COUNT = 25
 DEBRIS_TTL = 50
+# Draw explosion debris from a pooled particle system (needs NumPy)
+PARTICLES_ENABLED = True
+PARTICLE_CAPACITY = 4096
 
 # Game Settings
 INITIAL_ROCKS = 8
@@ -62,6 +159,13 @@ EXPLODING_TTL = 180
 INITIAL_LIVES = 5
 EXTRA_LIFE_SCORE = 10000
 SAUCER_SPAWN_INTERVAL = 2000
+# The simulation advances in fixed ticks; rendering runs at whatever rate the
+# display manages and interpolates sprite positions between ticks
+SIMULATION_TICK_RATE = 60  # ticks per second of game time
+SIMULATION_SPEED = 1.0  # game time per real second
+MAX_TICKS_PER_FRAME = 5  # a slower frame drops the rest of its backlog
+RENDER_INTERPOLATION = True
+FRAME_RATE_LIMIT = 120  # frames per second, 0 for no limit
 
 # Sound Settings
 SOUND_FILES = {
@@ -199,14 +199,16 @@ class BinCrystal:
             self.vx = 0
             self.vy = 0
             
-    def draw(self, screen):
-        """Draw the crystal as a diamond"""
+    def draw(self, screen, offset_x=0, offset_y=0):
+        """Draw the crystal as a diamond, shifted by the offset"""
         size = self.radius - 2
+        x = self.x + offset_x
+        y = self.y + offset_y
         crystal_points = [
-            (self.x, self.y - size),      # top
-            (self.x + size, self.y),      # right
-            (self.x, self.y + size),      # bottom
-            (self.x - size, self.y)       # left
+            (x, y - size),      # top
+            (x + size, y),      # right
+            (x, y + size),      # bottom
+            (x - size, y)       # left
         ]
         pygame.draw.polygon(screen, self.color, crystal_points)
         pygame.draw.polygon(screen, (255, 255, 255), crystal_points, 1)
@@ -3,7 +3,7 @@ import math
 import random
 
 from core.crystal_system.bin_crystal import BinCrystal
-from ...config.config import FONT_PATH, FONT_SIZES
+from ...ui.text_cache import textCache
 from ...entities.crystal import Crystal
 
 class CrystalSystem:
@@ -27,6 +27,15 @@ class CrystalSystem:
         self.bin_inner_width = self.bin_width - 10
         self.bin_inner_height = self.bin_height - 35
         
+        # The bin is repainted only while crystals move, the counts only
+        # when they change
+        self.binWidget = game.hud.widget(
+            "crystal_bin", (self.bin_x, self.bin_y, self.bin_width, self.bin_height),
+            self.binState, self.paintBin, transparent=False)
+        self.countsWidget = game.hud.widget(
+            "crystal_counts", (self.bin_x, self.bin_y + self.bin_height + 5, self.bin_width, 20),
+            self.countsState, self.paintCounts)
+        
     def addCrystal(self, crystal_type, amount=1):
         """Add crystals to the bin with physics"""
         for _ in range(amount):
@@ -54,48 +63,53 @@ class CrystalSystem:
                 
         return collected_crystals
     
+    def updateCrystalBin(self):
+        """Advance the bin crystal physics by one simulation tick"""
+        bin_bounds = (self.bin_inner_x, self.bin_inner_y, self.bin_inner_width, self.bin_inner_height)
+        for crystal in self.bin_crystals:
+            crystal.update(bin_bounds, self.bin_crystals)
+
     def displayCrystalBin(self):
         """Display the physics-based crystal bin"""
+        self.game.stage.markDirty(self.binWidget.draw(self.game.stage.screen))
+        
+        # Draw crystal count summary in corner
+        self.drawCrystalCounts()
+    
+    def binState(self):
+        """Pixel positions of the bin crystals; the bin repaints when any moves"""
+        return tuple((int(crystal.x), int(crystal.y), crystal.crystal_type)
+                     for crystal in self.bin_crystals)
+    
+    def paintBin(self, surface, state):
         # Draw bin background
-        pygame.draw.rect(self.game.stage.screen, (40, 40, 40),
-                        (self.bin_x, self.bin_y, self.bin_width, self.bin_height))
-        pygame.draw.rect(self.game.stage.screen, (100, 100, 100),
-                        (self.bin_x, self.bin_y, self.bin_width, self.bin_height), 2)
+        surface.fill((40, 40, 40))
+        pygame.draw.rect(surface, (100, 100, 100), (0, 0, self.bin_width, self.bin_height), 2)
         
         # Draw bin title
-        font_small = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
-        title_text = font_small.render("CRYSTAL COLLECTION BIN", True, (255, 255, 255))
-        title_rect = title_text.get_rect(centerx=self.bin_x + self.bin_width//2, y=self.bin_y + 5)
-        self.game.stage.screen.blit(title_text, title_rect)
-        
-        # Update and draw all bin crystals
-        bin_bounds = (self.bin_inner_x, self.bin_inner_y, self.bin_inner_width, self.bin_inner_height)
+        title_text = textCache.render("CRYSTAL COLLECTION BIN", (255, 255, 255), "small")
+        surface.blit(title_text, title_text.get_rect(centerx=self.bin_width//2, y=5))
         
+        # Draw all bin crystals (updateCrystalBin moves them)
         for crystal in self.bin_crystals:
-            crystal.update(bin_bounds, self.bin_crystals)
-            crystal.draw(self.game.stage.screen)
-        
-        # Draw crystal count summary in corner
-        self.drawCrystalCounts()
+            crystal.draw(surface, -self.bin_x, -self.bin_y)
     
     def drawCrystalCounts(self):
         """Draw a small summary of crystal counts"""
-        font_tiny = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
-        
-        # Count crystals by type
-        counts = {Crystal.COAL: 0, Crystal.IRON: 0, Crystal.GOLD: 0}
-        for crystal in self.bin_crystals:
-            counts[crystal.crystal_type] += 1
-        
-        # Draw counts
-        y_offset = self.bin_y + self.bin_height + 5
-        for i, (crystal_type, count) in enumerate(counts.items()):
+        self.game.stage.markDirty(self.countsWidget.draw(self.game.stage.screen))
+    
+    def countsState(self):
+        counts = self.getCrystalCounts()
+        return counts[Crystal.COAL], counts[Crystal.IRON], counts[Crystal.GOLD]
+    
+    def paintCounts(self, surface, counts):
+        crystal_types = (Crystal.COAL, Crystal.IRON, Crystal.GOLD)
+        for i, (crystal_type, count) in enumerate(zip(crystal_types, counts)):
             color = Crystal.crystal_types[crystal_type]["color"]
             name = Crystal.crystal_types[crystal_type]["name"]
             
-            count_text = font_tiny.render(f"{name}: {count}", True, color)
-            count_rect = count_text.get_rect(x=self.bin_x + (i * 80), y=y_offset)
-            self.game.stage.screen.blit(count_text, count_rect)
+            count_text = textCache.render(f"{name}: {count}", color, "small")
+            surface.blit(count_text, (i * 80, 0))
     
     def getTotalValue(self):
         """Get total value of all crystals in the bin"""
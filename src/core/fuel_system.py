@@ -1,5 +1,5 @@
 import pygame
-from ..config.config import FONT_PATH, FONT_SIZES
+from ..ui.text_cache import textCache
 
 class FuelSystem:
     """Handles fuel display and fuel status management"""
@@ -7,26 +7,22 @@ class FuelSystem:
     def __init__(self, game):
         self.game = game
         
-    def displayFuelBar(self):
-        """Display the fuel bar on screen"""
-        if not self.game.ship:
-            return
-            
-        font = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
-        
         # Fuel bar dimensions and position
-        bar_width = 200
-        bar_height = 20
-        bar_x = self.game.stage.width - bar_width - 20
-        bar_y = 20
-        
-        # Draw fuel bar background
-        pygame.draw.rect(self.game.stage.screen, (100, 100, 100), 
-                        (bar_x, bar_y, bar_width, bar_height))
+        self.bar_width = 200
+        self.bar_height = 20
+        self.bar_x = game.stage.width - self.bar_width - 20
+        self.bar_y = 20
+        # The widget also covers the label left of the bar
+        self.label_width = 140
+        self.widget = game.hud.widget(
+            "fuel", (self.bar_x - self.label_width, self.bar_y,
+                     self.label_width + self.bar_width, self.bar_height),
+            self.fuelState, self.paintFuelBar)
         
-        # Calculate fuel bar fill
+    def fuelState(self):
+        """(percent shown, fill width, fill colour) of the fuel bar"""
         fuel_percentage = self.game.ship.getFuelPercentage()
-        fill_width = int((fuel_percentage / 100) * bar_width)
+        fill_width = int((fuel_percentage / 100) * self.bar_width)
         
         # Choose color based on fuel level
         if fuel_percentage > 60:
@@ -35,22 +31,31 @@ class FuelSystem:
             fuel_color = (255, 255, 0)  # Yellow
         else:
             fuel_color = (255, 0, 0)  # Red
+        return int(fuel_percentage), fill_width, fuel_color
+        
+    def paintFuelBar(self, surface, state):
+        percent, fill_width, fuel_color = state
+        bar_x = self.label_width
+        
+        # Draw fuel bar background
+        pygame.draw.rect(surface, (100, 100, 100), (bar_x, 0, self.bar_width, self.bar_height))
             
         # Draw fuel fill
         if fill_width > 0:
-            pygame.draw.rect(self.game.stage.screen, fuel_color,
-                           (bar_x, bar_y, fill_width, bar_height))
+            pygame.draw.rect(surface, fuel_color, (bar_x, 0, fill_width, self.bar_height))
         
         # Draw fuel bar border
-        pygame.draw.rect(self.game.stage.screen, (255, 255, 255),
-                        (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, (255, 255, 255), (bar_x, 0, self.bar_width, self.bar_height), 2)
         
         # Draw fuel text
-        fuel_text = font.render(f"FUEL: {int(fuel_percentage)}%", True, (255, 255, 255))
-        fuel_text_rect = fuel_text.get_rect()
-        fuel_text_rect.right = bar_x - 10
-        fuel_text_rect.centery = bar_y + bar_height // 2
-        self.game.stage.screen.blit(fuel_text, fuel_text_rect)
+        textCache.blitGlyphs(surface, f"FUEL: {percent}%", (255, 255, 255), "small",
+                             right=bar_x - 10, centery=self.bar_height // 2)
+        
+    def displayFuelBar(self):
+        """Display the fuel bar on screen"""
+        if not self.game.ship:
+            return
+        self.game.stage.markDirty(self.widget.draw(self.game.stage.screen))
         
     def checkFuelStatus(self):
         """Check if player has run out of fuel"""
@@ -12,14 +12,21 @@ from ..entities.rock import Rock
 from ..entities.saucer import Saucer
 from ..entities.debris import Debris
 from ..entities.space_station import SpaceStation
-from ..entities.crystal import Crystal
+from ..entities.crystal import Crystal, crystalPool
 from ..entities.shooter import *
 from ..audio.soundManager import *
 from ..systems.universe import Universe
 from ..systems.camera import Camera
 from ..systems.background import BackgroundManager
+from ..systems.biomes import BiomeMap, biomesAvailable
 from ..systems.minimap import MiniMap
-from ..config.config import FONT_PATH, FONT_SIZES
+from ..util.profiler import Profiler
+from ..ui.profiler_overlay import ProfilerOverlay
+from ..ui.text_cache import textCache
+from ..ui.hud import HudLayers
+from ..config.config import (FONT_PATH, FONT_SIZES, DEBRIS_COUNT, SIMULATION_TICK_RATE,
+                             SIMULATION_SPEED, MAX_TICKS_PER_FRAME, RENDER_INTERPOLATION,
+                             FRAME_RATE_LIMIT, WORLD_SEED, BIOME_TILES_ENABLED, CHUNKS_ENABLED)
 from .shop import Shop
 from .fuel_system import FuelSystem
 from .rescue_system import RescueSystem
@@ -30,14 +37,22 @@ from .crystal_system.crystal_system import CrystalSystem
 class Game():
 
     explodingTtl = 180
+    # Stream rocks in by chunk around the camera instead of creating them all up front
+    useChunks = CHUNKS_ENABLED
 
     def __init__(self):
         # Screen dimensions
         self.screen_width = 1024
         self.screen_height = 768
         
+        # Biomes and chunks come from the world seed, so a seeded run sees
+        # the same sky and the same belts
+        self.worldSeed = WORLD_SEED if WORLD_SEED is not None else random.getrandbits(32)
+        # Shapes the sky and what the belts are made of
+        self.biomeMap = BiomeMap(self.worldSeed) if biomesAvailable() else None
+        
         # Create universe (much larger than screen)
-        self.universe = Universe(width=20000, height=20000)
+        self.universe = self.createUniverse()
         
         # Create camera
         self.camera = Camera(self.screen_width, self.screen_height, 
@@ -48,12 +63,14 @@ class Game():
         self.stage.setCamera(self.camera)
         
         # Create background manager
-        self.background = BackgroundManager(self.camera)
+        self.background = BackgroundManager(self.camera,
+                                            self.biomeMap if BIOME_TILES_ENABLED else None)
         
         # Create mini map
         self.minimap = MiniMap(self.universe, self.screen_width, self.screen_height)
         
         # Initialize UI and game systems
+        self.hud = HudLayers()
         self.shop = Shop(self)
         self.fuelSystem = FuelSystem(self)
         self.rescueSystem = RescueSystem(self)
@@ -63,6 +80,7 @@ class Game():
         # Game state
         self.paused = False
         self.showingFPS = False
+        self.fps = 0.0
         self.frameAdvance = False
         self.gameState = "attract_mode"
         self.secondsCount = 1
@@ -80,15 +98,23 @@ class Game():
         self.showRescuePrompt = False
         # Mini map control
         self.showMiniMap = True
+        # Per-stage frame timings; only recorded while the overlay (F3) is
+        # shown or the headless runner is profiling
+        self.profiler = Profiler(enabled=False)
+        self.profilerOverlay = ProfilerOverlay(self)
+        self.showProfiler = False
         
         # Create initial asteroid belts for the attract mode display
-        self.universe.createAsteroidBelts(6, 20)  # 6 belts with 20 rocks each
+        if self.universe.chunks is None:
+            self.universe.createAsteroidBelts(6, 20)  # 6 belts with 20 rocks each
 
     def initialiseGame(self):
         self.gameState = 'playing'
         
-        # Clear universe
-        self.universe = Universe(width=20000, height=20000)
+        # Clear universe; the pools outlive it, so hand its bullets and
+        # crystals back first
+        self.universe.releasePooledObjects()
+        self.universe = self.createUniverse()
         
         # Recreate mini map with new universe
         self.minimap = MiniMap(self.universe, self.screen_width, self.screen_height)
@@ -107,6 +133,13 @@ class Game():
         self.createAsteroidBelts()
         self.createSpaceStation()
 
+    def createUniverse(self):
+        """Empty universe, chunked when useChunks is set"""
+        universe = Universe(width=20000, height=20000, biomeMap=self.biomeMap)
+        if self.useChunks:
+            universe.enableChunks(self.worldSeed)
+        return universe
+
     def createSpaceStation(self):
         """Create space station near the center of the universe (spawn point)"""
         center_x = self.universe.width // 2
@@ -150,6 +183,9 @@ class Game():
 
     def createAsteroidBelts(self):
         """Create asteroid belts throughout the universe"""
+        if self.universe.chunks is not None:
+            # Belts are generated chunk by chunk as the camera reaches them
+            return
         # Calculate number of belts and rocks per belt
         num_belts = 8
         rocks_per_belt = self.numRocks // num_belts
@@ -158,6 +194,9 @@ class Game():
     def playGame(self):
 
         clock = pygame.time.Clock()
+        tickLength = 1000.0 / SIMULATION_TICK_RATE
+        # Game time not yet simulated, in milliseconds
+        accumulator = 0.0
 
         frameCount = 0.0
         timePassed = 0.0
@@ -166,7 +205,8 @@ class Game():
         while True:
 
             # calculate fps
-            timePassed += clock.tick(60)
+            elapsed = clock.tick(FRAME_RATE_LIMIT)
+            timePassed += elapsed
             frameCount += 1
             if frameCount % 10 == 0:  # every 10 frames
                 # nearest integer
@@ -175,74 +215,132 @@ class Game():
                 timePassed = 0
                 frameCount = 0
 
-            self.secondsCount += 1
-
-            self.input(pygame.event.get())
+            with self.profiler.section("input"):
+                self.input(pygame.event.get())
 
             # pause
             if self.paused and not self.frameAdvance:
+                accumulator = 0.0
                 self.uiManager.displayPaused()
+                self.stage.presentFrame()
                 continue
 
-            # Update camera
+            if self.paused:
+                # Frame advance steps exactly one tick
+                self.tick()
+                alpha = 1.0
+            else:
+                accumulator += elapsed * SIMULATION_SPEED
+                ticks = 0
+                while accumulator >= tickLength and ticks < MAX_TICKS_PER_FRAME:
+                    self.tick()
+                    accumulator -= tickLength
+                    ticks += 1
+                if accumulator >= tickLength:
+                    # Too far behind to catch up, let the game slow down instead
+                    accumulator %= tickLength
+                alpha = accumulator / tickLength if RENDER_INTERPOLATION else 1.0
+
+            self.render(alpha)
+            textCache.endFrame()
+            self.hud.endFrame()
+            if self.profiler.enabled:
+                self.profiler.endFrame()
+
+    def tick(self):
+        """Advance the game by one fixed simulation step"""
+        profiler = self.profiler
+        self.secondsCount += 1
+
+        # Update camera
+        with profiler.section("camera"):
             self.camera.update()
-            
-            # Update background
-            self.background.update()
-            
-            # Draw background first
-            self.background.draw(self.stage.screen)
-            
-            # Update universe (all objects move)
+
+        with profiler.section("chunks"):
+            self.universe.updateChunks(self.camera.x, self.camera.y)
+
+        # Update universe (all objects move, distant rocks less often)
+        with profiler.section("universe"):
+            self.universe.setLodFocus(self.camera.x, self.camera.y)
             self.universe.updateObjects()
-            
-            # Get visible objects from universe
+
+        with profiler.section("logic"):
+            self.doSaucerLogic()
+            self.uiManager.checkDocking()
+            self.checkMoney()
+        with profiler.section("crystals"):
+            self.crystalSystem.updateCrystalBin()
+
+        # Process keys
+        if self.gameState == 'playing':
+            self.playing()
+        elif self.gameState == 'exploding':
+            self.exploding()
+
+    def render(self, alpha=1.0):
+        """Draw a frame alpha of a tick on from the previous simulation tick"""
+        profiler = self.profiler
+
+        with profiler.section("background"):
+            # Update background
+            backgroundChanged = self.background.update(alpha)
+
+            # Draw background first (only where last frame drew, unless the
+            # camera scrolled)
+            self.stage.beginFrame(self.background, backgroundChanged, alpha)
+
+        # Get visible objects from universe
+        with profiler.section("visibility"):
             view_x, view_y, view_width, view_height = self.camera.getVisibleRegion()
             visible_objects = self.universe.getObjectsInRegion(view_x, view_y, view_width, view_height)
-            
-            # Draw visible objects
+
+        # Draw visible objects
+        with profiler.section("draw"):
             self.stage.drawSprites(visible_objects)
-            
-            self.doSaucerLogic()
-            self.uiManager.checkDocking()
+            if self.universe.particles is not None:
+                self.stage.drawParticles(self.universe.particles)
+
+        with profiler.section("hud"):
             self.crystalSystem.displayCrystalBin()
             self.uiManager.displayMoney()
             self.fuelSystem.displayFuelBar()
             self.uiManager.displayDockingPrompt()
             self.rescueSystem.displayRescuePrompt()
             self.shop.display()
-            # Draw mini map (show in all game states)
-            if self.showMiniMap:
-                self.minimap.draw(self.stage.screen)
             if self.showingFPS:
                 self.uiManager.displayFps()  # for debug
-            self.checkMoney()
-
-            # Process keys
-            if self.gameState == 'playing':
-                self.playing()
-            elif self.gameState == 'exploding':
-                self.exploding()
-            else:
+            if self.gameState not in ('playing', 'exploding'):
                 self.uiManager.displayGameText()
-                # Also show mini map in attract mode to see the galaxy
-                if self.showMiniMap:
-                    self.minimap.draw(self.stage.screen)
 
-            # Double buffer draw
-            pygame.display.flip()
+        # Draw mini map (show in all game states, attract mode included so
+        # the galaxy can be seen)
+        if self.showMiniMap:
+            with profiler.section("minimap"):
+                self.stage.markDirty(self.minimap.draw(self.stage.screen))
+
+        if self.showProfiler:
+            self.stage.markDirty(self.profilerOverlay.draw(self.stage.screen))
+
+        # Double buffer draw (partial when little changed)
+        with profiler.section("flip"):
+            self.stage.presentFrame()
 
     def playing(self):
         if self.lives == 0:
             self.gameState = 'attract_mode'
         else:
             self.fuelSystem.checkFuelStatus()
-            self.processKeys()
-            self.checkCollisions()
+            with self.profiler.section("input"):
+                self.processKeys()
+            with self.profiler.section("collisions"):
+                self.checkCollisions()
             # Collect nearby crystals
             if self.ship:
-                self.crystalSystem.collectNearbyCrystals(self.ship)
-            if len(self.universe.rocks) == 0:
+                with self.profiler.section("crystals"):
+                    self.crystalSystem.collectNearbyCrystals(self.ship)
+            # Drop what was destroyed or picked up before it is drawn again
+            self.universe.flushRemovals()
+            if self.universe.isCleared():
                 self.levelUp()
 
     def doSaucerLogic(self):
@@ -362,12 +460,22 @@ class Game():
                     else:
                         self.showingFPS = True
 
+                if event.key == K_F3:
+                    # Toggle the profiler overlay; timings are only taken while it shows
+                    self.showProfiler = not self.showProfiler
+                    self.profiler.enabled = self.showProfiler
+                    self.profiler.reset()
+
                 if event.key == K_m:
                     # Toggle mini map
                     self.showMiniMap = not self.showMiniMap
+                    if self.showMiniMap:
+                        # Rocks moved while it was hidden
+                        self.minimap.invalidate()
 
                 if event.key == K_f:
                     pygame.display.toggle_fullscreen()
+                    self.stage.invalidate()
 
                 # if event.key == K_k:
                     # self.killShip()
@@ -386,7 +494,7 @@ class Game():
         if self.showRescuePrompt:
             return
             
-        key = pygame.key.get_pressed()
+        key = self.getPressedKeys()
 
         if key[K_LEFT] or key[K_z]:
             self.ship.rotateLeft()
@@ -403,6 +511,10 @@ class Game():
         else:
             self.ship.thrustJet.accelerating = False
 
+    def getPressedKeys(self):
+        """Key state for the ship controls, indexed by pygame key constant"""
+        return pygame.key.get_pressed()
+
     def checkCollisions(self):
         """Check for collisions using the universe system"""
         collisions = self.universe.checkCollisions()
@@ -504,7 +616,11 @@ class Game():
             self.universe.removeObject(self.universe.saucer)
 
     def createDebris(self, sprite):
-        for _ in range(25):
+        if self.universe.particles is not None:
+            self.universe.particles.emit(sprite.position.x, sprite.position.y, DEBRIS_COUNT)
+            return
+            
+        for _ in range(DEBRIS_COUNT):
             position = Vector2d(sprite.position.x + random.randrange(-10, 10), 
                               sprite.position.y + random.randrange(-10, 10))
             debris = Debris(position, self.stage)
@@ -518,7 +634,7 @@ class Game():
         for _ in range(num_crystals):
             position = Vector2d(rock.position.x + random.randrange(-15, 15), 
                               rock.position.y + random.randrange(-15, 15))
-            crystal = Crystal(position, self.stage, rock.materialType)
+            crystal = crystalPool.acquire(position, self.stage, rock.materialType)
             self.universe.addObject(crystal)
 
 
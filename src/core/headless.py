@@ -0,0 +1,178 @@
+"""
+Headless Runner
+Runs the game without a window, audio device or keyboard for profiling and soak tests
+"""
+
+import json
+import random
+import time
+
+import pygame
+from pygame.locals import *
+
+from .game import Game
+from ..ui.text_cache import textCache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Names used by input scripts for the keys the game reads
+KEY_NAMES = {
+    "left": K_LEFT,
+    "right": K_RIGHT,
+    "up": K_UP,
+    "fire": K_SPACE,
+    "hyperspace": K_h,
+    "dock": K_d,
+    "start": K_RETURN,
+}
+
+
+class HeldKeys:
+    """Key state in the shape of pygame.key.get_pressed()"""
+
+    def __init__(self, keys=()):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+class ScriptedInput:
+    """Replays a list of input steps.
+
+    Each step is ``{"frames": n, "hold": [...], "press": [...]}``: the held
+    keys stay down for n frames and the pressed keys are tapped on the first
+    of them. Key names come from KEY_NAMES. Once the script runs out no keys
+    are held.
+    """
+
+    def __init__(self, steps):
+        self.frames = []
+        for step in steps:
+            hold = frozenset(KEY_NAMES[name] for name in step.get("hold", ()))
+            press = [KEY_NAMES[name] for name in step.get("press", ())]
+            for frame in range(max(1, int(step.get("frames", 1)))):
+                self.frames.append((hold, press if frame == 0 else []))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as script:
+            return cls(json.load(script))
+
+    def next(self, game, frame):
+        """(held keys, pressed keys) for this frame"""
+        if frame < len(self.frames):
+            return self.frames[frame]
+        return frozenset(), []
+
+
+class RandomInput:
+    """Holds a random mix of turn and thrust keys for a while, firing now and then"""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.held = frozenset()
+        self.holdFrames = 0
+
+    def next(self, game, frame):
+        rng = self.rng
+        if game.gameState == 'attract_mode':
+            # Out of lives; start another game
+            return frozenset(), [K_RETURN]
+        if self.holdFrames <= 0:
+            held = set()
+            turn = rng.random()
+            if turn < 0.3:
+                held.add(K_LEFT)
+            elif turn < 0.6:
+                held.add(K_RIGHT)
+            if rng.random() < 0.5:
+                held.add(K_UP)
+            self.held = frozenset(held)
+            self.holdFrames = rng.randrange(10, 90)
+        self.holdFrames -= 1
+        pressed = [K_SPACE] if rng.random() < 0.1 else []
+        return self.held, pressed
+
+
+class HeadlessGame(Game):
+    """Game whose ship controls come from a scripted or random input source"""
+
+    def __init__(self, inputSource=None):
+        Game.__init__(self)
+        self.inputSource = inputSource
+        self.heldKeys = HeldKeys()
+        self.profiler.enabled = True
+
+    def getPressedKeys(self):
+        return self.heldKeys
+
+    def runFrames(self, frames):
+        """Run one tick and one render per frame, as fast as possible; returns the seconds taken"""
+        profiler = self.profiler
+        start = time.perf_counter()
+        for frame in range(frames):
+            events = []
+            if self.inputSource is not None:
+                held, pressed = self.inputSource.next(self, frame)
+                self.heldKeys.keys = held
+                events = [pygame.event.Event(KEYDOWN, key=key) for key in pressed]
+            with profiler.section("input"):
+                self.input(events)
+            self.tick()
+            self.render(1.0)
+            textCache.endFrame()
+            self.hud.endFrame()
+            profiler.endFrame()
+        return time.perf_counter() - start
+
+
+def runHeadless(frames=1000, seed=None, script=None, randomInput=True, startGame=True):
+    """Run the game for a number of frames without a display and print the timings.
+
+    Expects SDL_VIDEODRIVER to point at a null video driver (main.py sets
+    "dummy" before pygame starts) and the sound manager to be initialised
+    without audio.
+    """
+    if seed is not None:
+        random.seed(seed)
+        if np is not None:
+            np.random.seed(seed)
+
+    if script is not None:
+        inputSource = ScriptedInput.load(script)
+    elif randomInput:
+        inputSource = RandomInput(random.Random(seed))
+    else:
+        inputSource = None
+
+    game = HeadlessGame(inputSource)
+    if startGame:
+        game.initialiseGame()
+    game.profiler.reset()
+    elapsed = game.runFrames(frames)
+
+    print(f"{frames} ticks in {elapsed:.2f} s: {frames / elapsed:.1f} ticks/sec, "
+          f"{len(game.universe.objects)} objects at the end")
+    print(f"{'stage':<12} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'max ms':>8} {'share':>7}")
+    for name, calls, total, mean, longest in game.profiler.report():
+        print(f"{name:<12} {calls:>7} {total * 1000:>10.1f} {mean * 1000:>9.3f} "
+              f"{longest * 1000:>8.2f} {total / elapsed:>6.1%}")
+    chunks = game.universe.chunks
+    if chunks is not None:
+        stats = chunks.stats()
+        print(f"chunks: {stats['active']} active, {stats['dormant']} dormant holding "
+              f"{stats['dormantRocks']} rocks in {stats['dormantBytes']} bytes; "
+              f"{stats['loads']} loads (mean {stats['meanLoadMs']:.2f} ms, max {stats['maxLoadMs']:.2f} ms), "
+              f"{stats['unloads']} unloads (mean {stats['meanUnloadMs']:.2f} ms, "
+              f"max {stats['maxUnloadMs']:.2f} ms)")
+    lod = game.universe.lod
+    if lod is not None:
+        stats = lod.stats()
+        bands = ", ".join(f"{name} {count}" for name, count in stats["bands"])
+        print(f"lod: {bands}; {stats['meanAdvanced']:.0f} of {stats['meanRocks']:.0f} rocks "
+              f"advanced per tick ({stats['updateRatio']:.0%})")
+    return game
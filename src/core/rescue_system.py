@@ -20,11 +20,9 @@ class RescueSystem:
         if not self.game.showRescuePrompt:
             return
             
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.game.stage.width, self.game.stage.height))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        self.game.stage.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, allocated once
+        overlay = self.game.hud.overlay((self.game.stage.width, self.game.stage.height), (0, 0, 0), 150)
+        self.game.stage.markDirty(self.game.stage.screen.blit(overlay, (0, 0)))
         
         # Delegate drawing to UI
         self.ui.draw(self.game.stage.screen)
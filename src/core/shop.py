@@ -1,7 +1,7 @@
 import pygame
 
 # Local imports
-from ..config.config import FONT_PATH, FONT_SIZES
+from ..ui.text_cache import textCache
 from ..entities.crystal import Crystal
 
 # UI
@@ -20,45 +20,46 @@ class Shop:
         self.buy_ui = ShopBuyUI(self)
         self.sell_ui = ShopSellUI(self)
         
+        # Shop window
+        self.shop_width = 400
+        self.shop_height = 300
+        self.shop_x = (game.stage.width - self.shop_width) // 2
+        self.shop_y = (game.stage.height - self.shop_height) // 2
+        # Window frame, title and close hint; only the title changes, with the mode
+        self.windowWidget = game.hud.widget(
+            "shop_window", (self.shop_x, self.shop_y, self.shop_width, self.shop_height),
+            lambda: self.shop_mode, self.paintWindow, transparent=False)
+        
+    def paintWindow(self, surface, shop_mode):
+        surface.fill((50, 50, 50))
+        pygame.draw.rect(surface, (0, 255, 255), (0, 0, self.shop_width, self.shop_height), 3)
+        
+        # Shop title
+        mode_text = "BUY" if shop_mode == "buy" else "SELL"
+        title_text = textCache.render(f"SPACE STATION - {mode_text}", (0, 255, 255), "subtitle")
+        surface.blit(title_text, title_text.get_rect(centerx=self.shop_width//2, y=20))
+        
+        # Close instruction (ESC still works)
+        close_text = textCache.render("Press ESC to close", (200, 200, 200), "small")
+        surface.blit(close_text, (40, self.shop_height - 30))
+        
     def display(self):
         """Display the shop interface"""
         if not self.game.showShop:
             return
             
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.game.stage.width, self.game.stage.height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.game.stage.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, allocated once
+        overlay = self.game.hud.overlay((self.game.stage.width, self.game.stage.height), (0, 0, 0), 180)
+        self.game.stage.markDirty(self.game.stage.screen.blit(overlay, (0, 0)))
         
-        # Shop window
-        shop_width = 400
-        shop_height = 300
-        shop_x = (self.game.stage.width - shop_width) // 2
-        shop_y = (self.game.stage.height - shop_height) // 2
-        
-        pygame.draw.rect(self.game.stage.screen, (50, 50, 50),
-                        (shop_x, shop_y, shop_width, shop_height))
-        pygame.draw.rect(self.game.stage.screen, (0, 255, 255),
-                        (shop_x, shop_y, shop_width, shop_height), 3)
-        
-        # Shop title
-        title_font = pygame.font.Font(FONT_PATH, FONT_SIZES["subtitle"])
-        mode_text = "BUY" if self.shop_mode == "buy" else "SELL"
-        title_text = title_font.render(f"SPACE STATION - {mode_text}", True, (0, 255, 255))
-        title_rect = title_text.get_rect(centerx=shop_x + shop_width//2, y=shop_y + 20)
-        self.game.stage.screen.blit(title_text, title_rect)
+        self.windowWidget.draw(self.game.stage.screen)
         
         # Display UI for current mode
+        shop_x, shop_y = self.shop_x, self.shop_y
         if self.shop_mode == "buy":
-            self.buy_ui.draw(self.game.stage.screen, shop_x, shop_y, shop_width, shop_height)
+            self.buy_ui.draw(self.game.stage.screen, shop_x, shop_y, self.shop_width, self.shop_height)
         else:
-            self.sell_ui.draw(self.game.stage.screen, shop_x, shop_y, shop_width, shop_height)
-        
-        # Close instruction (ESC still works)
-        instruction_font = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
-        close_text = instruction_font.render("Press ESC to close", True, (200, 200, 200))
-        self.game.stage.screen.blit(close_text, (shop_x + 40, shop_y + shop_height - 30))
+            self.sell_ui.draw(self.game.stage.screen, shop_x, shop_y, self.shop_width, self.shop_height)
     
     def handleFuelPurchase(self):
         """Handle fuel purchase transaction"""
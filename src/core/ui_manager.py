@@ -1,72 +1,71 @@
 import pygame
-from ..config.config import FONT_PATH, FONT_SIZES
+from ..ui.text_cache import textCache
 
 class UIManager:
     """Handles general UI elements like money display and docking prompts"""
     
     def __init__(self, game):
         self.game = game
+        # Money panel, repainted only when the balance changes
+        self.moneyWidget = game.hud.widget("money", (0, 25, 200, 40),
+                                           lambda: self.game.money, self.paintMoney)
         
+    def paintMoney(self, surface, money):
+        textCache.blitGlyphs(surface, "$" + str(money), (200, 200, 200), "subtitle",
+                             centerx=100, centery=20)
+
     def displayMoney(self):
         """Display the money on screen"""
-        font1 = pygame.font.Font(FONT_PATH, FONT_SIZES["subtitle"])
-        moneyStr = "$" + str(self.game.money)
-        moneyText = font1.render(moneyStr, True, (200, 200, 200))
-        moneyTextRect = moneyText.get_rect(centerx=100, centery=45)
-        self.game.stage.screen.blit(moneyText, moneyTextRect)
+        self.game.stage.markDirty(self.moneyWidget.draw(self.game.stage.screen))
         
     def displayDockingPrompt(self):
         """Display docking prompt when near space station"""
         if not self.game.nearStation or self.game.showRescuePrompt:
             return
             
-        font = pygame.font.Font(FONT_PATH, FONT_SIZES["normal"])
-        prompt_text = font.render("Press D to Dock", True, (0, 255, 255))
+        prompt_text = textCache.render("Press D to Dock", (0, 255, 255), "normal")
         prompt_rect = prompt_text.get_rect(centerx=self.game.stage.width//2, centery=self.game.stage.height//2 + 100)
-        self.game.stage.screen.blit(prompt_text, prompt_rect)
+        self.game.stage.markDirty(self.game.stage.screen.blit(prompt_text, prompt_rect))
         
     def displayGameText(self):
         """Display attract mode text"""
-        font1 = pygame.font.Font(FONT_PATH, FONT_SIZES["title"])
-        font2 = pygame.font.Font(FONT_PATH, FONT_SIZES["normal"])
-        font3 = pygame.font.Font(FONT_PATH, FONT_SIZES["subtitle"])
-
-        titleText = font1.render('Asteroids', True, (180, 180, 180))
+        titleText = textCache.render('Asteroids', (180, 180, 180), "title")
         titleTextRect = titleText.get_rect(centerx=self.game.stage.width/2)
         titleTextRect.y = self.game.stage.height/2 - titleTextRect.height*2
-        self.game.stage.screen.blit(titleText, titleTextRect)
+        self.game.stage.markDirty(self.game.stage.screen.blit(titleText, titleTextRect))
 
-        keysText = font2.render(
-            '(C) 1979 Atari INC.', True, (255, 255, 255))
+        keysText = textCache.render('(C) 1979 Atari INC.', (255, 255, 255), "normal")
         keysTextRect = keysText.get_rect(centerx=self.game.stage.width/2)
         keysTextRect.y = self.game.stage.height - keysTextRect.height - 20
-        self.game.stage.screen.blit(keysText, keysTextRect)
+        self.game.stage.markDirty(self.game.stage.screen.blit(keysText, keysTextRect))
 
-        instructionText = font3.render(
-            'Press start to Play', True, (200, 200, 200))
+        instructionText = textCache.render('Press start to Play', (200, 200, 200), "subtitle")
         instructionTextRect = instructionText.get_rect(
             centerx=self.game.stage.width/2)
         instructionTextRect.y = self.game.stage.height/2 - instructionTextRect.height
-        self.game.stage.screen.blit(instructionText, instructionTextRect)
+        self.game.stage.markDirty(self.game.stage.screen.blit(instructionText, instructionTextRect))
         
     def displayPaused(self):
         """Display paused screen"""
         if self.game.paused:
-            font1 = pygame.font.Font(FONT_PATH, FONT_SIZES["subtitle"])
-            pausedText = font1.render("Paused", True, (255, 255, 255))
+            pausedText = textCache.render("Paused", (255, 255, 255), "subtitle")
             textRect = pausedText.get_rect(
                 centerx=self.game.stage.width/2, centery=self.game.stage.height/2)
-            self.game.stage.screen.blit(pausedText, textRect)
-            pygame.display.update()
+            self.game.stage.markDirty(self.game.stage.screen.blit(pausedText, textRect))
             
     def displayFps(self):
         """Display FPS counter"""
-        font2 = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
         fpsStr = str(self.game.fps)+(' FPS')
-        scoreText = font2.render(fpsStr, True, (255, 255, 255))
-        scoreTextRect = scoreText.get_rect(
-            centerx=(self.game.stage.width/2), centery=15)
-        self.game.stage.screen.blit(scoreText, scoreTextRect)
+        if self.game.stage.renderer:
+            # Pixels pushed to the display last frame
+            fpsStr += '  ' + str(self.game.stage.renderer.pixelsUpdated) + ' PX'
+        # Font loads and text renders during the last frame
+        fpsStr += '  %d FL %d TR' % (textCache.lastFrameFontLoads, textCache.lastFrameRenders)
+        # HUD widgets repainted during the last frame
+        fpsStr += '  %d HUD' % self.game.hud.lastFrameRenders
+        self.game.stage.markDirty(textCache.blitGlyphs(
+            self.game.stage.screen, fpsStr, (255, 255, 255), "small",
+            centerx=self.game.stage.width // 2, centery=15))
         
     def checkDocking(self):
         """Check if player is near space station for docking"""
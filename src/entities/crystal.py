@@ -2,6 +2,7 @@ import random
 import math
 from util.vector2d import Vector2d
 from util.vectorsprites import VectorSprite
+from util.pool import ObjectPool
 
 class Crystal(VectorSprite):
     """Collectible crystals that drop from destroyed small rocks"""
@@ -18,11 +19,6 @@ class Crystal(VectorSprite):
     }
     
     def __init__(self, position, stage, crystal_type=COAL):
-        # Random velocity for crystal scatter (reduced for easier collection)
-        velocity = random.uniform(0.5, 1.5)
-        angle = random.uniform(0, 2 * math.pi)
-        heading = Vector2d(velocity * math.cos(angle), velocity * math.sin(angle))
-        
         # Create diamond shape pointlist
         size = 4
         diamond_points = [
@@ -32,8 +28,26 @@ class Crystal(VectorSprite):
             (-size, 0)       # left
         ]
         
-        VectorSprite.__init__(self, position, heading, diamond_points)
+        VectorSprite.__init__(self, position, self.scatterHeading(), diamond_points)
+        self.setup(stage, crystal_type)
+        
+    def reset(self, position, stage, crystal_type=COAL):
+        """Reinitialise a recycled crystal in place"""
+        self.position = position
+        self.heading = self.scatterHeading()
+        self.angle = 0
+        self.transformedPointlist = []
+        self.polygonKey = None
+        self.setup(stage, crystal_type)
+        
+    @staticmethod
+    def scatterHeading():
+        # Random velocity for crystal scatter (reduced for easier collection)
+        velocity = random.uniform(0.5, 1.5)
+        angle = random.uniform(0, 2 * math.pi)
+        return Vector2d(velocity * math.cos(angle), velocity * math.sin(angle))
         
+    def setup(self, stage, crystal_type):
         self.stage = stage
         self.crystal_type = crystal_type
         self.color = Crystal.crystal_types[crystal_type]["color"]
@@ -81,5 +95,7 @@ class Crystal(VectorSprite):
         """Mark this crystal as collected"""
         self.collected = True
         self.ttl = 0  # Remove from game
-        
- 
\ No newline at end of file
+
+
+# Crystals are recycled once collected or expired
+crystalPool = ObjectPool("crystals", Crystal)
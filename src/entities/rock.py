@@ -1,5 +1,6 @@
 import random
 from ..util.vectorsprites import *
+from ..config.config import ROCK_RADII
 
 # Four different shape of rock each of which can be small, medium or large.
 # Smaller rocks are faster.
@@ -23,32 +24,63 @@ class Rock(VectorSprite):
     
     velocities = (1.5, 3.0, 2.5)  # Reduced small rock speed from 4.5 to 2.5    
     scales = (2.5, 1.5, 0.6)
+    
+    # Approximate collision radius and mass used by rock-rock physics
+    radii = ROCK_RADII
+    masses = (3.0, 2.0, 1.0)
 
     # tracks the last rock shape to be generated
     rockShape = 1    
     
-    # Create the rock polygon to the given scale
-    def __init__(self, stage, position, rockType):
+    # Shared outline per (shape, rockType), so creating a rock skips rebuilding it
+    outlines = {}
+    
+    # Set while the rock's state lives in a RockStore (see systems/rock_store.py)
+    store = None
+    storeSlot = None
+    
+    # Tick the rock was last moved on while a LodScheduler moves it (see systems/lod.py)
+    lodTick = 0
+    
+    atlasSprite = True
+    
+    # Create the rock polygon to the given scale. heading, materialType and
+    # shape are picked at random unless given (e.g. when a rock is restored)
+    def __init__(self, stage, position, rockType, heading=None, materialType=None, shape=None):
         
         scale = Rock.scales[rockType]
-        velocity = Rock.velocities[rockType]                
-        heading = Vector2d(random.uniform(-velocity, velocity), random.uniform(-velocity, velocity))
-        
-        # Ensure that the rocks don't just sit there or move along regular lines
-        if heading.x == 0:
-            heading.x = 0.1
-        
-        if heading.y == 0:
-            heading.y = 0.1
+        if heading is None:
+            velocity = Rock.velocities[rockType]                
+            heading = Vector2d(random.uniform(-velocity, velocity), random.uniform(-velocity, velocity))
+            
+            # Ensure that the rocks don't just sit there or move along regular lines
+            if heading.x == 0:
+                heading.x = 0.1
+            
+            if heading.y == 0:
+                heading.y = 0.1
                         
+        # Set up front so joining a RockStore does not have to grow the instance dict
+        self.store = None
+        self.storeSlot = None
         self.rockType = rockType
-        self.materialType = self.determineMaterialType()
+        self.radius = Rock.radii[rockType]
+        self.mass = Rock.masses[rockType]
+        if materialType is None:
+            materialType = self.determineMaterialType()
+        self.materialType = materialType
         self.color = Rock.material_types[self.materialType]["color"]
         self.materialName = Rock.material_types[self.materialType]["name"]
         
-        pointlist = self.createPointList()
-        newPointList = [self.scale(point, scale) for point in pointlist]        
-        VectorSprite.__init__(self, position, heading, newPointList)
+        # Rocks of the same shape and size share one outline
+        if shape is None:
+            shape = Rock.nextShape()
+        pointlist = Rock.outlines.get((shape, rockType))
+        if pointlist is None:
+            pointlist = shapePrototype(Rock.createPointList(shape), scale)
+            Rock.outlines[(shape, rockType)] = pointlist
+        self.shape = shape
+        VectorSprite.__init__(self, position, heading, pointlist)
     
     def determineMaterialType(self):
         """Determine rock material type based on rarity"""
@@ -62,29 +94,49 @@ class Rock(VectorSprite):
             return Rock.COAL
                 
     
-    # Create different rock type pointlists    
-    def createPointList(self):
+    # The angle lives in the store's array while the rock is stored there
+    @property
+    def angle(self):
+        if self.store is None:
+            return self._angle
+        return self.store.angles[self.storeSlot]
+    
+    @angle.setter
+    def angle(self, value):
+        if self.store is None:
+            self._angle = value
+        else:
+            self.store.angles[self.storeSlot] = value
+    
+    # Cycle through the shapes for rocks that don't ask for one
+    @staticmethod
+    def nextShape():
+        shape = Rock.rockShape
+        Rock.rockShape += 1
+        if (Rock.rockShape == 5):
+            Rock.rockShape = 1
+        return shape
+    
+    # Create the pointlist of one of the rock shapes (1-4)
+    @staticmethod
+    def createPointList(shape):
         
-        if (Rock.rockShape == 1):
+        if (shape == 1):
             pointlist = [(-4,-12), (6,-12), (13, -4), (13, 5), (6, 13), (0,13), (0,4),\
                      (-8,13), (-15, 4), (-7,1), (-15,-3)]
  
-        elif (Rock.rockShape == 2):
+        elif (shape == 2):
             pointlist = [(-6,-12), (1,-5), (8, -12), (15, -5), (12,0), (15,6), (5,13),\
                          (-7,13), (-14,7), (-14,-5)]
             
-        elif (Rock.rockShape == 3):
+        elif (shape == 3):
             pointlist = [(-7,-12), (1,-9), (8,-12), (15,-5), (8,-3), (15,4), (8,12),\
                          (-3,10), (-6,12), (-14,7), (-10,0), (-14,-5)]            
 
-        elif (Rock.rockShape == 4):
+        elif (shape == 4):
             pointlist = [(-7,-11), (3,-11), (13,-5), (13,-2), (2,2), (13,8), (6,14),\
                          (2,10), (-7,14), (-15,5), (-15,-5), (-5,-5), (-7,-11)]
 
-        Rock.rockShape += 1
-        if (Rock.rockShape == 5):
-            Rock.rockShape = 1
-
         return pointlist
     
     # Spin the rock when it moves
@@ -92,4 +144,10 @@ class Rock(VectorSprite):
         VectorSprite.move(self)                        
         
         # Original Asteroid didn't have spinning rocks but they look nicer
-        self.angle += 1 
\ No newline at end of file
+        self.angle += 1
+    
+    # Move as far as the given number of calls to move() would
+    def advance(self, ticks):
+        self.position.x += self.heading.x * ticks
+        self.position.y += self.heading.y * ticks
+        self.angle += (self.vAngle + 1) * ticks 
\ No newline at end of file
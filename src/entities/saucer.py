@@ -16,6 +16,7 @@ class Saucer(Shooter):
     scores = (500, 1000)
     pointlist = [(-9,0), (-3,-3), (-2,-6), (-2,-6), (2,-6), (3,-3), (9,0), (-9,0), (-3,4), (3,4), (9,0)]
     maxBullets = 1
+    atlasSprite = True
     bulletTtl = [60, 90]
     bulletVelocity = 5  
     
@@ -35,7 +36,7 @@ class Saucer(Shooter):
         self.lastx = 0
         
         # Scale the shape and create the VectorSprite
-        newPointList = [self.scale(point, self.scales[saucerType]) for point in self.pointlist]
+        newPointList = shapePrototype(self.pointlist, self.scales[saucerType])
         Shooter.__init__(self, position, heading, newPointList, stage)
         
     def move(self):        
@@ -14,9 +14,13 @@ class Ship(Shooter):
     bulletVelocity = 13.0
     maxBullets = 4
     bulletTtl = 35
+    atlasSprite = True
     # Fuel system attributes
     maxFuel = 100
     fuelConsumptionRate = 0.3
+    # Hyperspace lands at most this far from where the ship vanished on
+    # each axis, about half a screen, like the classic screen-wide jump
+    hyperSpaceRange = 500
 
     def __init__(self, stage):
 
@@ -35,28 +39,32 @@ class Ship(Shooter):
         Shooter.__init__(self, position, heading, pointlist, stage)
 
     def draw(self):
-        if self.visible:
-            if not self.inHyperSpace:
-                VectorSprite.draw(self)
-            else:
-                self.hyperSpaceTtl -= 1
-                if self.hyperSpaceTtl == 0:
-                    self.inHyperSpace = False
-                    self.color = (255, 255, 255)
-                    self.thrustJet.color = (255, 255, 255)
-                    # Teleport to a random location in the universe
-                    if self.universe:
-                        self.position.x = random.randrange(100, self.universe.width - 100)
-                        self.position.y = random.randrange(100, self.universe.height - 100)
-                    else:
-                        # Fallback to stage dimensions
-                        self.position.x = random.randrange(0, self.stage.width)
-                        self.position.y = random.randrange(0, self.stage.height)
-                    position = Vector2d(self.position.x, self.position.y)
-                    self.thrustJet.position = position
+        if self.visible and not self.inHyperSpace:
+            VectorSprite.draw(self)
 
         return self.transformedPointlist
 
+    # Count down the time in hyperspace once per tick, then reappear
+    def updateHyperSpace(self):
+        self.hyperSpaceTtl -= 1
+        if self.hyperSpaceTtl == 0:
+            self.inHyperSpace = False
+            self.color = (255, 255, 255)
+            self.thrustJet.color = (255, 255, 255)
+            # Teleport to a random location nearby, kept inside the universe
+            if self.universe:
+                reach = self.hyperSpaceRange
+                x = self.position.x + random.uniform(-reach, reach)
+                y = self.position.y + random.uniform(-reach, reach)
+                self.position.x = min(max(x, 100), self.universe.width - 100)
+                self.position.y = min(max(y, 100), self.universe.height - 100)
+            else:
+                # Fallback to stage dimensions
+                self.position.x = random.randrange(0, self.stage.width)
+                self.position.y = random.randrange(0, self.stage.height)
+            position = Vector2d(self.position.x, self.position.y)
+            self.thrustJet.position = position
+
     def rotateLeft(self):
         self.angle += self.turnAngle
 
@@ -101,6 +109,8 @@ class Ship(Shooter):
     def move(self):
         VectorSprite.move(self)
         self.decreaseThrust()
+        if self.inHyperSpace:
+            self.updateHyperSpace()
 
     # Break the shape of the ship down into several lines
     # Ship shape - [(0, -10), (6, 10), (3, 7), (-3, 7), (-6, 10)]
@@ -189,6 +199,8 @@ class ThrustJet(VectorSprite):
         self.position.x = self.ship.position.x
         self.position.y = self.ship.position.y
         self.angle = self.ship.angle
+        # Share the ship's velocity so the jet is interpolated along with it
+        self.heading = self.ship.heading
 
     def draw(self):
         if self.accelerating and self.ship.inHyperSpace == False:
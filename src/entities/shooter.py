@@ -2,6 +2,7 @@ import random
 from util.point import Point
 from util.vector2d import Vector2d
 from util.vectorsprites import VectorSprite
+from util.pool import ObjectPool
 
 
 class Shooter(VectorSprite):
@@ -14,9 +15,9 @@ class Shooter(VectorSprite):
 
     def fireBullet(self, heading, ttl, velocity):
         if (len(self.bullets) < self.maxBullets):
-            position = Vector2d(self.position.x, self.position.y)
-            newBullet = Bullet(position, heading, self,
-                               ttl, velocity, self.stage)
+            # Recycled bullets copy the position instead of sharing it
+            newBullet = bulletPool.acquire(self.position, heading, self,
+                                           ttl, velocity, self.stage)
             self.bullets.append(newBullet)
             # Add to universe instead of stage
             if self.universe:
@@ -38,14 +39,40 @@ class Shooter(VectorSprite):
 class Bullet(Point):
 
     def __init__(self, position, heading, shooter, ttl, velocity, stage):
-        Point.__init__(self, position, heading, stage)
+        Point.__init__(self, Vector2d(position.x, position.y),
+                       Vector2d(heading.x, heading.y), stage)
         self.shooter = shooter
         self.ttl = ttl
         self.velocity = velocity
+        # Start of this tick's path, used for swept collision checks
+        self.previousX = self.position.x
+        self.previousY = self.position.y
+
+    def reset(self, position, heading, shooter, ttl, velocity, stage):
+        """Reinitialise a recycled bullet in place"""
+        self.position.x = position.x
+        self.position.y = position.y
+        self.heading.x = heading.x
+        self.heading.y = heading.y
+        self.angle = 0
+        self.transformedPointlist = []
+        self.polygonKey = None
+        self.stage = stage
+        self.shooter = shooter
+        self.ttl = ttl
+        self.velocity = velocity
+        self.previousX = self.position.x
+        self.previousY = self.position.y
 
     def move(self):
+        self.previousX = self.position.x
+        self.previousY = self.position.y
         Point.move(self)
         if (self.ttl <= 0):
             # Only remove if still in the list (collision may have already removed it)
             if self in self.shooter.bullets:
                 self.shooter.bullets.remove(self)
+
+
+# Bullets are recycled once they leave the universe
+bulletPool = ObjectPool("bullets", Bullet)
@@ -16,6 +16,7 @@ class SpaceStation(VectorSprite):
     ]
     
     dockingRange = 80  # Distance within which player can dock
+    atlasSprite = True
     
     def __init__(self, position, stage):
         heading = Vector2d(0, 0)  # Space station doesn't move
@@ -2,8 +2,16 @@
 
 import pygame
 import random
+import time
+from collections import OrderedDict
 from ..util.vector2d import Vector2d
-from ..config.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from ..config.config import (SCREEN_WIDTH, SCREEN_HEIGHT, BIOME_TILE_SIZE, BIOME_TILE_SAMPLE_STEP,
+                             BIOME_TILE_CACHE_BYTES, BIOME_TILE_LOOKAHEAD, BIOME_TILES_PER_FRAME)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, stars are then drawn one at a time
+    np = None
 
 
 class Star:
@@ -36,8 +44,10 @@ class Star:
 class StarField:
     """Optimized starfield background with multiple parallax layers"""
     
-    def __init__(self, num_layers=3):
+    def __init__(self, num_layers=3, background=None):
         self.num_layers = num_layers
+        # None leaves the sky transparent so stars can be drawn over biome tiles
+        self.background = background
         self.star_layers = []
         self.parallax_factors = []
         
@@ -76,70 +86,309 @@ class StarField:
             self.star_layers.append(stars)
         
         # Pre-create surface for stars to optimize drawing
-        self.star_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.star_surface.set_colorkey((0, 0, 0))  # Black is transparent
-        
-        # Cache last camera position to avoid unnecessary redraws
-        self.last_camera_x = 0
-        self.last_camera_y = 0
-        self.cache_threshold = 5  # Redraw if camera moved more than this many pixels
-        
-    def update(self, camera):
-        """Update starfield based on camera position"""
-        # Only redraw if camera moved significantly
-        camera_moved = (abs(camera.x - self.last_camera_x) > self.cache_threshold or
-                       abs(camera.y - self.last_camera_y) > self.cache_threshold)
-        
-        if camera_moved:
-            self._redraw_stars(camera.x, camera.y)
-            self.last_camera_x = camera.x
-            self.last_camera_y = camera.y
+        # Stars sit on the background colour, so drawing is one opaque blit
+        self.star_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32)
+        self.sky = background if background is not None else (0, 0, 0)
+        self.star_surface.fill(self.sky)
+        if background is None:
+            self.star_surface.set_colorkey(self.sky)  # Black is transparent
+        
+        # Whole-pixel scroll of each layer at the last redraw; stars only
+        # move when one of these changes
+        self.layer_offsets = None
+        
+        self.pixels = None
+        if np is not None:
+            self._build_pixels()
     
-    def _redraw_stars(self, camera_x, camera_y):
-        """Redraw all stars with current camera position"""
-        # Clear the star surface
-        self.star_surface.fill((0, 0, 0))
+    def _build_pixels(self):
+        """Flatten every pixel of every star into arrays for a vectorized redraw.
+
+        Size 2 stars cover the pixels pygame.draw.circle fills, read back from
+        a scratch surface, so both redraw paths draw the same shapes.
+        """
+        scratch = pygame.Surface((5, 5))
+        pygame.draw.circle(scratch, (255, 255, 255), (2, 2), 2)
+        disc = [(x - 2, y - 2) for x in range(5) for y in range(5)
+                if scratch.get_at((x, y))[0]]
         
-        # Draw each layer with its parallax factor
+        star_x, star_y, layers, dx, dy, colors = [], [], [], [], [], []
         for layer_idx, stars in enumerate(self.star_layers):
-            parallax_factor = self.parallax_factors[layer_idx]
-            
             for star in stars:
-                star.draw(self.star_surface, camera_x, camera_y, parallax_factor)
+                color = self.star_surface.map_rgb(star.color)
+                for offset_x, offset_y in (disc if star.size != 1 else ((0, 0),)):
+                    star_x.append(star.x)
+                    star_y.append(star.y)
+                    layers.append(layer_idx)
+                    dx.append(offset_x)
+                    dy.append(offset_y)
+                    colors.append(color)
+        
+        self.pixels = (np.array(star_x, dtype=np.intp), np.array(star_y, dtype=np.intp),
+                       np.array(layers, dtype=np.intp), np.array(dx, dtype=np.intp),
+                       np.array(dy, dtype=np.intp), np.array(colors, dtype=np.uint32))
+        # Pixels lit by the last redraw, cleared before the next one
+        self.lit = None
+        
+    def update(self, view_x, view_y):
+        """Scroll the starfield to a view corner; returns True if any star moved"""
+        offsets = tuple((int(view_x * factor), int(view_y * factor))
+                        for factor in self.parallax_factors)
+        if offsets == self.layer_offsets:
+            return False
+        self.layer_offsets = offsets
+        self._redraw_stars()
+        return True
+    
+    def _redraw_stars(self):
+        """Redraw all stars at the current layer offsets"""
+        if self.pixels is None:
+            # Clear the star surface
+            self.star_surface.fill(self.sky)
+            
+            # Draw each layer at its whole-pixel parallax offset
+            for layer_idx, stars in enumerate(self.star_layers):
+                offset_x, offset_y = self.layer_offsets[layer_idx]
+                
+                for star in stars:
+                    star.draw(self.star_surface, offset_x, offset_y, 1.0)
+            return
+        
+        # Same wrapping as Star.draw, for every star pixel at once
+        star_x, star_y, layers, dx, dy, colors = self.pixels
+        offsets = np.array(self.layer_offsets, dtype=np.intp)[layers]
+        x = ((star_x - offsets[:, 0]) % SCREEN_WIDTH + dx) % SCREEN_WIDTH
+        y = ((star_y - offsets[:, 1]) % SCREEN_HEIGHT + dy) % SCREEN_HEIGHT
+        
+        surface_pixels = pygame.surfarray.pixels2d(self.star_surface)
+        if self.lit is not None:
+            surface_pixels[self.lit] = self.star_surface.map_rgb(self.sky)
+        surface_pixels[x, y] = colors
+        self.lit = (x, y)
+        # Release the pixel lock so the surface can be blitted
+        del surface_pixels
     
     def draw(self, surface):
         """Draw the starfield to the given surface"""
         surface.blit(self.star_surface, (0, 0))
+        
+    def drawRegion(self, surface, rect):
+        """Draw only the part of the starfield inside rect"""
+        surface.blit(self.star_surface, rect, rect)
     
     def regenerate_layer(self, layer_idx):
         """Regenerate stars for a specific layer (useful for dynamic changes)"""
         if 0 <= layer_idx < len(self.star_layers):
-            # Force regeneration by clearing cache
-            self.last_camera_x = float('inf')
-            self.last_camera_y = float('inf')
+            # Force a redraw on the next update
+            self.layer_offsets = None
+
+
+class BiomeTiles:
+    """World-anchored background tiles painted from a BiomeMap, kept in an LRU cache.
+
+    Each tile is a square of the universe tinted with the nebula colour of
+    the biomes under it and sprinkled with dim stars at the biome's
+    density. Colours are sampled every ``sampleStep`` pixels on a lattice
+    shared by neighbouring tiles and interpolated in between, so tiles meet
+    without seams. The stars come from a generator seeded with the world
+    seed and tile coordinates, so a tile looks the same whenever it is
+    rebuilt.
+
+    ``prefetch`` builds a few missing tiles per frame along the camera's
+    path; ``draw`` only builds tiles itself (counted as misses) when the
+    prefetch fell behind. Least recently used tiles are dropped once the
+    pixel data exceeds ``maxBytes``.
+    """
+
+    def __init__(self, biomeMap, tileSize=BIOME_TILE_SIZE, sampleStep=BIOME_TILE_SAMPLE_STEP,
+                 maxBytes=BIOME_TILE_CACHE_BYTES, lookahead=BIOME_TILE_LOOKAHEAD,
+                 tilesPerFrame=BIOME_TILES_PER_FRAME, sky=(5, 5, 15)):
+        self.biomeMap = biomeMap
+        self.tileSize = tileSize
+        self.sampleStep = sampleStep
+        self.maxBytes = maxBytes
+        self.lookahead = lookahead
+        self.tilesPerFrame = tilesPerFrame
+        self.sky = sky
+        self.tiles = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.evictions = 0
+        self.buildTime = 0.0
+        self.maxBuildTime = 0.0
+
+        # Linear interpolation from the sample lattice onto tile pixels as a
+        # (pixels, samples) matrix, so a tile is upsampled with two products
+        self.samples = np.arange(tileSize // sampleStep + 1) * sampleStep
+        position = np.arange(tileSize) / sampleStep
+        index = position.astype(np.intp)
+        fraction = position - index
+        pixel = np.arange(tileSize)
+        self.interpolation = np.zeros((tileSize, len(self.samples)), dtype=np.float32)
+        self.interpolation[pixel, index] = 1.0 - fraction
+        self.interpolation[pixel, index + 1] += fraction
+
+    def build(self, tile_x, tile_y):
+        """Paint the tile at tile coordinates into a new surface"""
+        started = time.perf_counter()
+        size = self.tileSize
+        world_x = tile_x * size
+        world_y = tile_y * size
+        biomeMap = self.biomeMap
+
+        # Nebula colour on the sample lattice, indexed [x, y] like surfarray
+        xs = (world_x + self.samples)[:, None]
+        ys = (world_y + self.samples)[None, :]
+        lattice = biomeMap.nebulaColor(xs, ys, self.sky).astype(np.float32)
+        weights = self.interpolation
+        pixels = (weights @ lattice.transpose(2, 0, 1) @ weights.T).transpose(1, 2, 0)
+
+        # Dim background stars at the biome's density
+        rng = np.random.default_rng((biomeMap.seed, tile_x & 0xFFFFFFFF, tile_y & 0xFFFFFFFF))
+        density = biomeMap.starDensity(world_x + size / 2, world_y + size / 2)
+        count = rng.poisson(density * size * size / 1e6)
+        star_x = rng.integers(0, size, count)
+        star_y = rng.integers(0, size, count)
+        brightness = rng.integers(50, 130, count).astype(np.float32)[:, None]
+        pixels[star_x, star_y] = np.maximum(pixels[star_x, star_y], brightness)
+
+        surface = pygame.Surface((size, size), 0, 32)
+        pygame.surfarray.blit_array(surface, pixels.astype(np.uint8))
+
+        elapsed = time.perf_counter() - started
+        self.buildTime += elapsed
+        self.maxBuildTime = max(self.maxBuildTime, elapsed)
+        return surface
+
+    def store(self, key, surface):
+        self.tiles[key] = surface
+        self.bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        while self.bytes > self.maxBytes and len(self.tiles) > 1:
+            _, evicted = self.tiles.popitem(last=False)
+            self.bytes -= evicted.get_width() * evicted.get_height() * evicted.get_bytesize()
+            self.evictions += 1
+
+    def tile(self, tile_x, tile_y):
+        """Cached surface for a tile, built now if it was not prefetched"""
+        key = (tile_x, tile_y)
+        surface = self.tiles.get(key)
+        if surface is not None:
+            self.tiles.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self.build(tile_x, tile_y)
+        self.store(key, surface)
+        return surface
+
+    def tileRange(self, left, top, right, bottom):
+        """Tile coordinates covering a world rectangle"""
+        size = self.tileSize
+        return (range(int(left // size), int((right - 1) // size) + 1),
+                range(int(top // size), int((bottom - 1) // size) + 1))
+
+    def prefetch(self, view_x, view_y, velocity_x, velocity_y, width, height, budget=None):
+        """Build up to budget (default tilesPerFrame) missing tiles where the view is heading.
+
+        Returns how many were built.
+        """
+        size = self.tileSize
+        ahead_x = view_x + velocity_x * self.lookahead
+        ahead_y = view_y + velocity_y * self.lookahead
+        # The view now and where it will be, with a tile of margin all round
+        columns, rows = self.tileRange(min(view_x, ahead_x) - size, min(view_y, ahead_y) - size,
+                                       max(view_x, ahead_x) + width + size,
+                                       max(view_y, ahead_y) + height + size)
+        missing = [(x, y) for x in columns for y in rows if (x, y) not in self.tiles]
+        if not missing:
+            return 0
+        # Nearest the predicted view centre first
+        centre_x = (ahead_x + width / 2) / size - 0.5
+        centre_y = (ahead_y + height / 2) / size - 0.5
+        missing.sort(key=lambda key: (key[0] - centre_x) ** 2 + (key[1] - centre_y) ** 2)
+        built = missing[:self.tilesPerFrame if budget is None else budget]
+        for key in built:
+            self.store(key, self.build(*key))
+        self.prefetched += len(built)
+        return len(built)
+
+    def drawRegion(self, surface, view_x, view_y, rect):
+        """Blit the tiles under a screen rect for a view corner"""
+        size = self.tileSize
+        columns, rows = self.tileRange(view_x + rect.left, view_y + rect.top,
+                                       view_x + rect.right, view_y + rect.bottom)
+        for tile_x in columns:
+            for tile_y in rows:
+                tile_rect = pygame.Rect(tile_x * size - view_x, tile_y * size - view_y, size, size)
+                area = tile_rect.clip(rect)
+                surface.blit(self.tile(tile_x, tile_y), area,
+                             area.move(-tile_rect.x, -tile_rect.y))
+
+    def stats(self):
+        """Snapshot of the cache counters"""
+        return {
+            "tiles": len(self.tiles),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "prefetched": self.prefetched,
+            "evictions": self.evictions,
+            "buildTime": self.buildTime,
+            "maxBuildTime": self.maxBuildTime,
+        }
+
+    def clear(self):
+        self.tiles.clear()
+        self.bytes = 0
 
 
 class BackgroundManager:
     """Main background manager that coordinates all background elements"""
     
-    def __init__(self, camera):
+    def __init__(self, camera, biomeMap=None):
         self.camera = camera
-        self.starfield = StarField(num_layers=3)
+        self.sky = (5, 5, 15)  # Very dark blue-black
+        if biomeMap is not None:
+            # Parallax stars over world-anchored biome tiles
+            self.tiles = BiomeTiles(biomeMap, sky=self.sky)
+            self.starfield = StarField(num_layers=3)
+        else:
+            self.tiles = None
+            self.starfield = StarField(num_layers=3, background=self.sky)
+        self.view = None
         
         # Force initial draw
-        self.starfield.update(camera)
+        self.update()
+        if self.tiles is not None:
+            # Build the tiles around the first view now rather than in the first frame
+            self.tiles.prefetch(camera.view_x, camera.view_y, 0, 0,
+                                camera.screen_width, camera.screen_height, budget=64)
     
-    def update(self):
-        """Update all background elements"""
-        self.starfield.update(self.camera)
+    def update(self, alpha=1.0):
+        """Update all background elements for a view alpha of a tick on; returns True if anything changed"""
+        camera = self.camera
+        view_x, view_y = camera.getView(alpha)
+        changed = self.starfield.update(view_x, view_y)
+        if self.tiles is not None:
+            view = (int(view_x), int(view_y))
+            changed = changed or view != self.view
+            self.view = view
+            self.tiles.prefetch(view_x, view_y, camera.view_x - camera.prev_view_x,
+                                camera.view_y - camera.prev_view_y,
+                                camera.screen_width, camera.screen_height)
+        return changed
     
     def draw(self, surface):
         """Draw all background elements"""
-        # Fill with deep space color
-        surface.fill((5, 5, 15))  # Very dark blue-black
+        self.drawRegion(surface, surface.get_rect())
         
-        # Draw starfield
-        self.starfield.draw(surface)
+    def drawRegion(self, surface, rect):
+        """Redraw the background inside rect only"""
+        if self.tiles is not None:
+            self.tiles.drawRegion(surface, self.view[0], self.view[1], pygame.Rect(rect))
+        self.starfield.drawRegion(surface, rect)
     
     def set_star_density(self, density_multiplier):
         """Adjust star density (1.0 = normal, 0.5 = half, 2.0 = double)"""
@@ -0,0 +1,120 @@
+"""
+Biomes
+Seeded value noise and the biome map laid over the universe
+"""
+
+from ..config.config import BIOMES, BIOME_SCALE, BIOME_DETAIL_SCALE, BIOME_BLEND
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the background is then a plain starfield
+    np = None
+
+_MASK = 0xFFFFFFFF
+
+
+def biomesAvailable():
+    """True when NumPy is installed and a BiomeMap can be built"""
+    return np is not None
+
+
+def latticeHash(ix, iy, seed):
+    """Deterministic value in [0, 1) for each integer lattice point; seed may be an array"""
+    seed = (np.asarray(seed, dtype=np.uint64) * np.uint64(1442695041)) & np.uint64(_MASK)
+    h = (ix.astype(np.uint64) * np.uint64(374761393) +
+         iy.astype(np.uint64) * np.uint64(668265263) + seed) & np.uint64(_MASK)
+    h = ((h ^ (h >> np.uint64(13))) * np.uint64(1274126177)) & np.uint64(_MASK)
+    h ^= h >> np.uint64(16)
+    return h.astype(np.float64) / float(1 << 32)
+
+
+def valueNoise(xs, ys, seed):
+    """Smoothly interpolated lattice noise in [0, 1) with features about one unit across"""
+    x0 = np.floor(xs)
+    y0 = np.floor(ys)
+    fx = xs - x0
+    fy = ys - y0
+    # Smoothstep so the gradient is continuous across lattice lines
+    fx = fx * fx * (3.0 - 2.0 * fx)
+    fy = fy * fy * (3.0 - 2.0 * fy)
+    ix = x0.astype(np.int64)
+    iy = y0.astype(np.int64)
+    top = latticeHash(ix, iy, seed) * (1.0 - fx) + latticeHash(ix + 1, iy, seed) * fx
+    bottom = latticeHash(ix, iy + 1, seed) * (1.0 - fx) + latticeHash(ix + 1, iy + 1, seed) * fx
+    return top * (1.0 - fy) + bottom * fy
+
+
+def fractalNoise(xs, ys, seed, octaves=3):
+    """Value noise summed over octaves of doubling frequency, normalised to [0, 1).
+
+    The octaves are stacked on a leading axis and evaluated in one pass.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    shape = (octaves,) + (1,) * max(xs.ndim, ys.ndim)
+    octave = np.arange(octaves)
+    frequency = (2.0 ** octave).reshape(shape)
+    amplitude = 0.5 ** octave
+    noise = valueNoise(xs * frequency, ys * frequency,
+                       (seed + octave * 7919).reshape(shape))
+    return np.tensordot(amplitude / amplitude.sum(), noise, axes=1)
+
+
+class BiomeMap:
+    """Splits the universe into the BIOMES regions from two low-frequency noise fields.
+
+    ``heat`` picks the row of the 2x2 BIOMES grid and ``density`` the
+    column, so biome index is ``heat_row * 2 + density_col``. ``weights``
+    blends the four neighbouring biomes smoothly for drawing, while
+    ``biomeAt`` gives the dominant one for gameplay. Everything is a pure
+    function of the seed and world coordinates, taking arrays of positions.
+    """
+
+    def __init__(self, seed, scale=BIOME_SCALE, detailScale=BIOME_DETAIL_SCALE, blend=BIOME_BLEND):
+        if np is None:
+            raise ImportError("BiomeMap requires NumPy")
+        self.seed = seed & _MASK
+        self.scale = scale
+        self.detailScale = detailScale
+        self.blend = blend
+        self.biomes = BIOMES
+        self.nebulaColors = np.array([biome["nebula"] for biome in BIOMES], dtype=np.float64)
+        self.starDensities = np.array([biome["stars"] for biome in BIOMES], dtype=np.float64)
+
+    def fields(self, xs, ys):
+        """(heat, density) in [0, 1) at world positions"""
+        xs = np.asarray(xs, dtype=np.float64) / self.scale
+        ys = np.asarray(ys, dtype=np.float64) / self.scale
+        return (fractalNoise(xs, ys, self.seed),
+                fractalNoise(xs, ys, self.seed + 101))
+
+    def biomeAt(self, xs, ys):
+        """Index into BIOMES of the dominant biome at world positions"""
+        heat, density = self.fields(xs, ys)
+        return (heat >= 0.5).astype(np.intp) * 2 + (density >= 0.5)
+
+    def weights(self, xs, ys):
+        """Blend weight of each biome at world positions, shape (..., 4), rows summing to 1"""
+        heat, density = self.fields(xs, ys)
+        # Stretch around the midpoint so biomes are mostly pure with narrow borders
+        h = np.clip((heat - 0.5) / self.blend + 0.5, 0.0, 1.0)
+        d = np.clip((density - 0.5) / self.blend + 0.5, 0.0, 1.0)
+        return np.stack(((1 - h) * (1 - d), (1 - h) * d, h * (1 - d), h * d), axis=-1)
+
+    def detail(self, xs, ys):
+        """Finer noise in [0, 1) that shapes nebula clouds inside a biome"""
+        return fractalNoise(np.asarray(xs, dtype=np.float64) / self.detailScale,
+                            np.asarray(ys, dtype=np.float64) / self.detailScale,
+                            self.seed + 202, octaves=4)
+
+    def nebulaColor(self, xs, ys, base=(5, 5, 15)):
+        """RGB float colour of the nebula at world positions, shape (..., 3)"""
+        weights = self.weights(xs, ys)
+        color = weights @ self.nebulaColors
+        base = np.asarray(base, dtype=np.float64)
+        cloud = self.detail(xs, ys)[..., None]
+        return base + (color - base) * (0.25 + 0.75 * cloud)
+
+    def starDensity(self, xs, ys):
+        """Blended stars per million square pixels at world positions"""
+        return self.weights(xs, ys) @ self.starDensities
@@ -0,0 +1,54 @@
+"""
+Broadphase
+Finds the pairs of circular bodies that overlap without testing every pair
+"""
+
+
+def sweepAndPrune(bodies, margin=0.0):
+    """Return (i, j) index pairs of bodies whose circles overlap.
+
+    Bodies need ``position`` and a precomputed ``radius``. Bodies are swept
+    along the x axis so only those whose x extents overlap are compared, and
+    only pairs that overlap are returned. A positive margin also returns
+    pairs that are within margin of touching. Pairs come back with i < j,
+    sorted the same way an all-pairs loop over ``bodies`` would visit them.
+    """
+    count = len(bodies)
+    if count < 2:
+        return []
+
+    xs = [0.0] * count
+    ys = [0.0] * count
+    radii = [0.0] * count
+    for index, body in enumerate(bodies):
+        xs[index] = body.position.x
+        ys[index] = body.position.y
+        radii[index] = body.radius + margin * 0.5
+
+    order = sorted(range(count), key=lambda index: xs[index] - radii[index])
+
+    pairs = []
+    active = []
+    for i in order:
+        x = xs[i]
+        y = ys[i]
+        radius = radii[i]
+        min_x = x - radius
+
+        # Drop bodies whose extent ends before this one starts
+        still_active = []
+        for j in active:
+            if xs[j] + radii[j] < min_x:
+                continue
+            still_active.append(j)
+
+            dx = xs[j] - x
+            dy = ys[j] - y
+            reach = radii[j] + radius
+            if dx * dx + dy * dy < reach * reach:
+                pairs.append((i, j) if i < j else (j, i))
+        still_active.append(i)
+        active = still_active
+
+    pairs.sort()
+    return pairs
@@ -15,6 +15,9 @@ class Camera:
         # Camera bounds (top-left corner of visible area)
         self.view_x = self.x - screen_width // 2
         self.view_y = self.y - screen_height // 2
+        # View at the previous simulation tick, for interpolated rendering
+        self.prev_view_x = self.view_x
+        self.prev_view_y = self.view_y
         
         # Target to follow (usually the player)
         self.target = None
@@ -28,6 +31,8 @@ class Camera:
         
     def update(self):
         """Update camera position to follow target"""
+        self.prev_view_x = self.view_x
+        self.prev_view_y = self.view_y
         if self.target:
             # Calculate desired camera position (centered on target)
             target_x = self.target.position.x
@@ -48,6 +53,11 @@ class Camera:
             self.view_x = self.x - half_screen_w
             self.view_y = self.y - half_screen_h
             
+    def getView(self, alpha=1.0):
+        """View corner blended between the last two ticks (alpha 1 is the latest)"""
+        return (self.prev_view_x + (self.view_x - self.prev_view_x) * alpha,
+                self.prev_view_y + (self.view_y - self.prev_view_y) * alpha)
+
     def worldToScreen(self, world_pos):
         """Convert world coordinates to screen coordinates"""
         screen_x = world_pos.x - self.view_x
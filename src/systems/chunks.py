@@ -0,0 +1,330 @@
+"""
+Chunks
+Streams the universe's rocks in and out by chunk around the camera
+"""
+
+import math
+import random
+import struct
+import time
+
+from ..entities.rock import Rock
+from ..util.vector2d import Vector2d
+from ..config.config import (CHUNK_SIZE, CHUNK_LOAD_RADIUS, CHUNK_UNLOAD_RADIUS,
+                             CHUNK_UPDATE_INTERVAL, CHUNK_BELT_CHANCE, CHUNK_ROCKS_PER_BELT,
+                             CHUNK_SPAWN_CLEARANCE)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, dormant rocks are then unpacked in Python
+    np = None
+
+# Dormant rock: x, y, heading x, heading y, angle, rock type, material, shape
+ROCK_RECORD = struct.Struct('<5f3B')
+if np is not None:
+    # The same packed layout, so dormant chunks can be read as arrays
+    ROCK_RECORD_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('headingX', '<f4'),
+                                  ('headingY', '<f4'), ('angle', '<f4'), ('rockType', 'u1'),
+                                  ('material', 'u1'), ('shape', 'u1')])
+
+
+def packRock(rock):
+    return ROCK_RECORD.pack(rock.position.x, rock.position.y, rock.heading.x, rock.heading.y,
+                            rock.angle % 360, rock.rockType, rock.materialType, rock.shape)
+
+
+def unpackRock(record):
+    x, y, heading_x, heading_y, angle, rock_type, material, shape = record
+    rock = Rock(None, Vector2d(x, y), rock_type, Vector2d(heading_x, heading_y), material, shape)
+    rock.angle = angle
+    return rock
+
+
+def unpackRocks(records):
+    """Rocks for a run of packed records (bytes or a ROCK_RECORD_DTYPE array)"""
+    if not isinstance(records, bytes):
+        records = records.tobytes()
+    return [unpackRock(record) for record in ROCK_RECORD.iter_unpack(records)]
+
+
+class ChunkManager:
+    """Keeps rocks as live objects only in chunks near the camera.
+
+    The universe is cut into ``chunkSize`` squares. A chunk's belts are
+    generated from the world seed and the chunk coordinates, so the same
+    seed always gives the same chunk; ``generateAll`` packs every chunk's
+    belts up front, so the mini map and ``isCleared`` see all of them while
+    only the rocks near the camera are live objects. Chunks
+    within ``loadRadius`` of the focus (the camera centre) are active: their
+    rocks are normal Rock objects in the universe. Every ``updateInterval``
+    ticks, chunks further than ``unloadRadius`` are deactivated. Any live
+    rock whose position lies in an inactive chunk, including one that
+    drifted out of an active chunk, is then packed into that chunk's
+    dormant record (``ROCK_RECORD`` bytes) and removed from the universe.
+
+    With a ``generator`` (a WorldGenerator) chunks are sampled in batches
+    and shaped by the biome map; without one they come from the slower
+    pure-Python generator below.
+
+    Load and unload times are recorded per chunk for ``stats``.
+    """
+
+    def __init__(self, universe, seed, chunkSize=CHUNK_SIZE, loadRadius=CHUNK_LOAD_RADIUS,
+                 unloadRadius=CHUNK_UNLOAD_RADIUS, updateInterval=CHUNK_UPDATE_INTERVAL,
+                 generator=None):
+        self.universe = universe
+        self.seed = seed
+        self.generator = generator
+        self.chunkSize = chunkSize
+        self.loadRadius = loadRadius
+        self.unloadRadius = max(unloadRadius, loadRadius)
+        self.updateInterval = updateInterval
+        self.ticksUntilUpdate = 0
+        self.active = set()
+        # Packed rocks of every generated chunk that is not active
+        self.dormant = {}
+
+        self.generated = 0
+        self.loads = 0
+        self.unloads = 0
+        self.drifted = 0
+        self.loadTime = 0.0
+        self.maxLoadTime = 0.0
+        self.lastLoadTime = 0.0
+        self.unloadTime = 0.0
+        self.maxUnloadTime = 0.0
+        self.lastUnloadTime = 0.0
+
+    def chunkKey(self, x, y):
+        size = self.chunkSize
+        return (int(x // size), int(y // size))
+
+    def chunkDistance(self, key, x, y):
+        """Distance from (x, y) to the nearest point of a chunk"""
+        size = self.chunkSize
+        left = key[0] * size
+        top = key[1] * size
+        dx = max(left - x, 0, x - left - size)
+        dy = max(top - y, 0, y - top - size)
+        return math.hypot(dx, dy)
+
+    def isActiveAt(self, x, y):
+        return self.chunkKey(x, y) in self.active
+
+    def generate(self, key):
+        """Packed rocks of a chunk's belts, the same for the same seed and key"""
+        self.generated += 1
+        universe = self.universe
+        size = self.chunkSize
+        left = key[0] * size
+        top = key[1] * size
+        if left < 0 or top < 0 or left >= universe.width or top >= universe.height:
+            return b''
+        right = min(left + size, universe.width)
+        bottom = min(top + size, universe.height)
+        if self.generator is not None:
+            return self.generator.chunkRecords(self.seed, key, size, CHUNK_BELT_CHANCE,
+                                               CHUNK_ROCKS_PER_BELT,
+                                               CHUNK_SPAWN_CLEARANCE).tobytes()
+
+        rng = random.Random(f"{self.seed}:{key[0]}:{key[1]}")
+        spawn_x = universe.width / 2
+        spawn_y = universe.height / 2
+        records = []
+        while rng.random() < CHUNK_BELT_CHANCE:
+            # Keep the belt inside the chunk so every rock starts in its own chunk
+            belt_radius = rng.randrange(300, 800)
+            margin = min(belt_radius * 1.2, (right - left) / 2, (bottom - top) / 2)
+            belt_x = rng.uniform(left + margin, right - margin)
+            belt_y = rng.uniform(top + margin, bottom - margin)
+            if math.hypot(belt_x - spawn_x, belt_y - spawn_y) < CHUNK_SPAWN_CLEARANCE:
+                continue
+
+            for _ in range(CHUNK_ROCKS_PER_BELT):
+                # Same belt shape as Universe.createRockBelt
+                angle = rng.uniform(0, 2 * math.pi)
+                distance = rng.uniform(belt_radius * 0.3, belt_radius)
+                distance += rng.uniform(-belt_radius * 0.2, belt_radius * 0.2)
+                x = min(max(belt_x + distance * math.cos(angle), left + 50), right - 50)
+                y = min(max(belt_y + distance * math.sin(angle), top + 50), bottom - 50)
+
+                rock_type_chance = rng.random()
+                if rock_type_chance < 0.6:
+                    rock_type = Rock.largeRockType
+                elif rock_type_chance < 0.85:
+                    rock_type = Rock.mediumRockType
+                else:
+                    rock_type = Rock.smallRockType
+
+                # Same rarities as Rock.determineMaterialType
+                rarity = rng.random()
+                gold = Rock.material_types[Rock.GOLD]["rarity"]
+                if rarity < gold:
+                    material = Rock.GOLD
+                elif rarity < gold + Rock.material_types[Rock.IRON]["rarity"]:
+                    material = Rock.IRON
+                else:
+                    material = Rock.COAL
+
+                velocity = Rock.velocities[rock_type]
+                heading_x = rng.uniform(-velocity, velocity) or 0.1
+                heading_y = rng.uniform(-velocity, velocity) or 0.1
+                records.append(ROCK_RECORD.pack(x, y, heading_x, heading_y, 0.0, rock_type,
+                                                material, rng.randint(1, 4)))
+        return b''.join(records)
+
+    def dormantRecords(self, key):
+        """The dormant record of an inactive chunk, generating the chunk if it is new"""
+        records = self.dormant.get(key)
+        if records is None:
+            records = self.dormant[key] = self.generate(key)
+        return records
+
+    def generateAll(self):
+        """Generate the dormant record of every chunk of the universe not generated yet"""
+        size = self.chunkSize
+        for key_x in range(math.ceil(self.universe.width / size)):
+            for key_y in range(math.ceil(self.universe.height / size)):
+                key = (key_x, key_y)
+                if key not in self.active:
+                    self.dormantRecords(key)
+
+    def load(self, key):
+        """Turn a chunk's dormant rocks into live ones"""
+        started = time.perf_counter()
+        records = self.dormant.pop(key, None)
+        if records is None:
+            records = self.generate(key)
+        self.active.add(key)
+        if np is not None:
+            records = np.frombuffer(records, dtype=ROCK_RECORD_DTYPE)
+            self.universe.addRocks(unpackRocks(records), records)
+        else:
+            self.universe.addRocks(unpackRocks(records))
+
+        elapsed = time.perf_counter() - started
+        self.loads += 1
+        self.loadTime += elapsed
+        self.lastLoadTime = elapsed
+        self.maxLoadTime = max(self.maxLoadTime, elapsed)
+
+    def stash(self, key, rocks):
+        """Pack live rocks into an inactive chunk and remove them from the universe"""
+        records = [packRock(rock) for rock in rocks]
+        self.dormant[key] = self.dormantRecords(key) + b''.join(records)
+        removeObject = self.universe.removeObject
+        for rock in rocks:
+            removeObject(rock)
+
+    def placeRock(self, rock):
+        """Add a new rock, live if its chunk is active and packed away otherwise"""
+        key = self.chunkKey(rock.position.x, rock.position.y)
+        if key in self.active:
+            self.universe.addObject(rock)
+        else:
+            self.dormant[key] = self.dormantRecords(key) + packRock(rock)
+
+    def placeRecords(self, records):
+        """placeRock for a ROCK_RECORD_DTYPE array, grouped by chunk (needs NumPy)"""
+        if not len(records):
+            return
+        size = self.chunkSize
+        keys = np.stack((np.floor_divide(records['x'], size),
+                         np.floor_divide(records['y'], size)), axis=1).astype(np.int64)
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique) + 1))
+        for index, (key_x, key_y) in enumerate(unique.tolist()):
+            key = (key_x, key_y)
+            chunk = records[order[bounds[index]:bounds[index + 1]]]
+            if key in self.active:
+                self.universe.addRocks(unpackRocks(chunk), chunk)
+            else:
+                self.dormant[key] = self.dormantRecords(key) + chunk.tobytes()
+
+    def update(self, x, y, force=False):
+        """Load and unload chunks around (x, y); runs every updateInterval ticks"""
+        self.ticksUntilUpdate -= 1
+        if self.ticksUntilUpdate > 0 and not force:
+            return
+        self.ticksUntilUpdate = self.updateInterval
+
+        size = self.chunkSize
+        reach = self.loadRadius
+        for key_x in range(int((x - reach) // size), int((x + reach) // size) + 1):
+            for key_y in range(int((y - reach) // size), int((y + reach) // size) + 1):
+                key = (key_x, key_y)
+                if key not in self.active and self.chunkDistance(key, x, y) <= reach:
+                    self.load(key)
+
+        unloading = [key for key in self.active
+                     if self.chunkDistance(key, x, y) > self.unloadRadius]
+        for key in unloading:
+            self.active.discard(key)
+            self.dormant[key] = b''
+
+        # Every live rock outside the active chunks goes to sleep where it is
+        # (rocks the LOD scheduler froze first catch up to where that is)
+        self.universe.catchUpRocks()
+        buckets = {}
+        chunkKey = self.chunkKey
+        isPendingRemoval = self.universe.entities.isPendingRemoval
+        for rock in self.universe.rocks:
+            key = chunkKey(rock.position.x, rock.position.y)
+            if key not in self.active and not isPendingRemoval(rock):
+                buckets.setdefault(key, []).append(rock)
+
+        for key in unloading:
+            started = time.perf_counter()
+            self.stash(key, buckets.pop(key, ()))
+            elapsed = time.perf_counter() - started
+            self.unloads += 1
+            self.unloadTime += elapsed
+            self.lastUnloadTime = elapsed
+            self.maxUnloadTime = max(self.maxUnloadTime, elapsed)
+        for key, rocks in buckets.items():
+            self.drifted += len(rocks)
+            self.stash(key, rocks)
+
+    def dormantRockCount(self):
+        return sum(len(records) for records in self.dormant.values()) // ROCK_RECORD.size
+
+    def dormantArrays(self):
+        """All dormant rocks as one ROCK_RECORD_DTYPE array (needs NumPy)"""
+        return np.frombuffer(b''.join(self.dormant.values()), dtype=ROCK_RECORD_DTYPE)
+
+    def dormantRocks(self):
+        """(x, y, rock type, material) of every dormant rock"""
+        for records in self.dormant.values():
+            for x, y, _, _, _, rock_type, material, _ in ROCK_RECORD.iter_unpack(records):
+                yield x, y, rock_type, material
+
+    def isCleared(self):
+        """True once every chunk of the universe was generated and has no dormant rocks"""
+        size = self.chunkSize
+        for key_x in range(math.ceil(self.universe.width / size)):
+            for key_y in range(math.ceil(self.universe.height / size)):
+                key = (key_x, key_y)
+                if key not in self.active and key not in self.dormant:
+                    return False
+        return not any(self.dormant.values())
+
+    def stats(self):
+        """Chunk counts and load/unload latency in milliseconds"""
+        return {
+            "active": len(self.active),
+            "dormant": len(self.dormant),
+            "dormantRocks": self.dormantRockCount(),
+            "dormantBytes": sum(len(records) for records in self.dormant.values()),
+            "generated": self.generated,
+            "loads": self.loads,
+            "unloads": self.unloads,
+            "drifted": self.drifted,
+            "meanLoadMs": self.loadTime / self.loads * 1000 if self.loads else 0.0,
+            "maxLoadMs": self.maxLoadTime * 1000,
+            "lastLoadMs": self.lastLoadTime * 1000,
+            "meanUnloadMs": self.unloadTime / self.unloads * 1000 if self.unloads else 0.0,
+            "maxUnloadMs": self.maxUnloadTime * 1000,
+            "lastUnloadMs": self.lastUnloadTime * 1000,
+        }
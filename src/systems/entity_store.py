@@ -0,0 +1,132 @@
+"""
+Entity Store
+Dense per-category entity lists with O(1) insertion and removal
+"""
+
+
+class EntityList:
+    """Dense list of objects with O(1) append, membership test and removal.
+
+    Removal swaps the last object into the freed slot, so iteration order is
+    not insertion order. Supports the read-only list operations the game uses
+    (len, iteration, ``in``, indexing and slicing).
+    """
+
+    def __init__(self):
+        self.items = []
+        self.slots = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __contains__(self, obj):
+        return obj in self.slots
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def add(self, obj):
+        """Append an object if it is not already present"""
+        if obj in self.slots:
+            return
+        self.slots[obj] = len(self.items)
+        self.items.append(obj)
+
+    def discard(self, obj):
+        """Remove an object by swapping the last one into its slot"""
+        slot = self.slots.pop(obj, None)
+        if slot is None:
+            return
+        last = self.items.pop()
+        if slot < len(self.items):
+            self.items[slot] = last
+            self.slots[last] = slot
+
+    def clear(self):
+        self.items.clear()
+        self.slots.clear()
+
+
+class EntityStore:
+    """Owns every entity in a world, with stable handles and deferred removal.
+
+    Each entity gets an integer handle that stays valid while its slot in the
+    dense lists moves around. ``remove`` only queues the entity; ``flush``
+    applies all queued removals at once, so systems can safely iterate the
+    dense lists while entities die.
+    """
+
+    def __init__(self, categories=()):
+        self.all = EntityList()
+        self.categories = {name: EntityList() for name in categories}
+        self.handles = {}
+        self.entities = {}
+        self.nextHandle = 1
+        self.pendingRemoval = {}
+
+    def __len__(self):
+        return len(self.all)
+
+    def category(self, name):
+        """Return the dense list for a category"""
+        return self.categories[name]
+
+    def add(self, obj, categories=()):
+        """Add an entity to the given categories and return its handle"""
+        # Re-adding something queued for removal just cancels the removal
+        self.pendingRemoval.pop(obj, None)
+
+        handle = self.handles.get(obj)
+        if handle is None:
+            handle = self.nextHandle
+            self.nextHandle += 1
+            self.handles[obj] = handle
+            self.entities[handle] = obj
+
+        self.all.add(obj)
+        for category in categories:
+            self.categories[category].add(obj)
+        return handle
+
+    def remove(self, obj):
+        """Queue an entity for removal at the next flush"""
+        if obj in self.all.slots:
+            self.pendingRemoval[obj] = None
+
+    def isPendingRemoval(self, obj):
+        return obj in self.pendingRemoval
+
+    def flush(self):
+        """Apply queued removals and return the removed entities"""
+        if not self.pendingRemoval:
+            return []
+
+        removed = list(self.pendingRemoval)
+        self.pendingRemoval.clear()
+        for obj in removed:
+            self.all.discard(obj)
+            for entity_list in self.categories.values():
+                entity_list.discard(obj)
+            handle = self.handles.pop(obj, None)
+            if handle is not None:
+                del self.entities[handle]
+        return removed
+
+    def getHandle(self, obj):
+        """Return the handle of a live entity, or None"""
+        return self.handles.get(obj)
+
+    def get(self, handle):
+        """Return the entity for a handle, or None once it has been removed"""
+        return self.entities.get(handle)
+
+    def clear(self):
+        self.all.clear()
+        for entity_list in self.categories.values():
+            entity_list.clear()
+        self.handles.clear()
+        self.entities.clear()
+        self.pendingRemoval.clear()
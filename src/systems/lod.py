@@ -0,0 +1,140 @@
+"""
+Level Of Detail
+Simulates rocks at a rate set by their distance from the camera
+"""
+
+from ..config.config import LOD_BANDS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, bands are then picked rock by rock
+    np = None
+
+
+class LodScheduler:
+    """Decides which rocks advance on each tick from their distance to a focus.
+
+    ``bands`` is a sequence of (radius, interval), nearest first: a rock
+    whose current position lies within a band's radius of the focus
+    advances on every tick divisible by the band's interval. A rock that
+    missed ticks moves along its heading by all of them at once, so it
+    covers the same ground at a fraction of the cost. Rocks beyond the
+    last radius are frozen. They are still banded from where they would
+    be by now, so they wake up when that brings them back into range, and
+    Universe catches them up when a query returns them.
+
+    Stored rocks are scheduled in bulk with ``dueSlots``; rocks kept
+    outside a RockStore are moved by ``stepRocks``, which keeps its own
+    tick and each rock's ``lodTick``. Until ``setFocus`` is called every
+    rock runs at full rate.
+    """
+
+    def __init__(self, bands=LOD_BANDS):
+        self.bands = tuple((radius, max(int(interval), 1)) for radius, interval in bands)
+        self.radiiSquared = [radius * radius for radius, _ in self.bands]
+        self.intervals = [interval for _, interval in self.bands]
+        self.focusX = None
+        self.focusY = None
+        # Tick of the rocks moved by stepRocks (stored rocks use the store's)
+        self.tick = 0
+
+        # Rocks per band on the latest tick, the last entry counting frozen ones
+        self.counts = [0] * (len(self.bands) + 1)
+        self.ticks = 0
+        self.advanced = 0
+        self.scheduled = 0
+
+    def setFocus(self, x, y):
+        self.focusX = x
+        self.focusY = y
+
+    def dueBands(self, tick):
+        """Indices of the bands whose rocks advance on the given tick"""
+        return [band for band, interval in enumerate(self.intervals) if tick % interval == 0]
+
+    def dueSlots(self, store):
+        """Slots of a RockStore to advance on its next tick, None for every slot"""
+        count = store.count
+        self.ticks += 1
+        self.scheduled += count
+        if self.focusX is None or count == 0:
+            self.counts = [count] + [0] * len(self.bands)
+            self.advanced += count
+            return None
+
+        positions = store.currentPositions()
+        dx = positions[:, 0] - self.focusX
+        dy = positions[:, 1] - self.focusY
+        bands = np.searchsorted(self.radiiSquared, dx * dx + dy * dy)
+        counts = np.bincount(bands, minlength=len(self.bands) + 1)
+        self.counts = counts.tolist()
+
+        due_bands = self.dueBands(store.tick + 1)
+        if len(due_bands) == len(self.bands) and counts[-1] == 0:
+            self.advanced += count
+            return None
+        due = np.zeros(len(self.bands) + 1, dtype=bool)
+        due[due_bands] = True
+        slots = np.nonzero(due[bands])[0]
+        self.advanced += len(slots)
+        return slots
+
+    def bandAt(self, x, y):
+        """Index of the band (x, y) lies in, len(bands) when beyond them all"""
+        if self.focusX is None:
+            return 0
+        distance_sq = (x - self.focusX) ** 2 + (y - self.focusY) ** 2
+        for band, radius_sq in enumerate(self.radiiSquared):
+            if distance_sq <= radius_sq:
+                return band
+        return len(self.bands)
+
+    def stepRocks(self, rocks, spatialIndex):
+        """Advance the due ones of rocks kept outside a RockStore by one tick"""
+        self.tick += 1
+        tick = self.tick
+        intervals = self.intervals
+        frozen = len(intervals)
+        counts = [0] * (frozen + 1)
+        advanced = 0
+        for rock in rocks:
+            elapsed = tick - rock.lodTick
+            band = self.bandAt(rock.position.x + rock.heading.x * elapsed,
+                               rock.position.y + rock.heading.y * elapsed)
+            counts[band] += 1
+            if band == frozen or tick % intervals[band]:
+                continue
+            rock.advance(elapsed)
+            rock.lodTick = tick
+            spatialIndex.update(rock)
+            advanced += 1
+        self.counts = counts
+        self.ticks += 1
+        self.advanced += advanced
+        self.scheduled += len(rocks)
+
+    def catchUpRocks(self, rocks, spatialIndex):
+        """Bring rocks kept outside a RockStore up to the latest tick"""
+        tick = self.tick
+        for rock in rocks:
+            elapsed = tick - rock.lodTick
+            if elapsed > 0:
+                rock.advance(elapsed)
+                rock.lodTick = tick
+                spatialIndex.update(rock)
+
+    def bandNames(self):
+        """Label of each band in counts, e.g. "LOD<1200/2" for every other tick"""
+        names = []
+        for radius, interval in self.bands:
+            names.append(f"LOD<{radius}" if interval == 1 else f"LOD<{radius}/{interval}")
+        return names + ["Frozen"]
+
+    def stats(self):
+        """Latest per-band counts and the share of rock updates actually run"""
+        return {
+            "bands": list(zip(self.bandNames(), self.counts)),
+            "meanAdvanced": self.advanced / self.ticks if self.ticks else 0.0,
+            "meanRocks": self.scheduled / self.ticks if self.ticks else 0.0,
+            "updateRatio": self.advanced / self.scheduled if self.scheduled else 1.0,
+        }
@@ -1,10 +1,18 @@
 import pygame
 import math
 from ..util.vector2d import Vector2d
+from ..ui.text_cache import textCache
+from ..config.config import MINIMAP_REFRESH_INTERVAL
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, rock markers are then blitted one by one
+    np = None
 
 
 class MiniMap:
-    def __init__(self, universe, screen_width, screen_height):
+    def __init__(self, universe, screen_width, screen_height,
+                 refreshInterval=MINIMAP_REFRESH_INTERVAL):
         self.universe = universe
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -18,6 +26,20 @@ class MiniMap:
         self.surface = pygame.Surface((self.map_size, self.map_size))
         self.surface.set_alpha(180)  # Semi-transparent
         
+        # Slow-moving content (rocks, station) is drawn into this layer every
+        # refreshInterval frames and copied under the moving markers. The
+        # redraw goes into backLayer a marker colour per frame and is swapped
+        # in once complete, so no single frame pays for all of it
+        self.staticLayer = pygame.Surface((self.map_size, self.map_size))
+        self.backLayer = pygame.Surface((self.map_size, self.map_size))
+        self.refreshInterval = refreshInterval
+        self.framesUntilRefresh = 0
+        self.refresh = None
+        self.stale = True
+        self.staticRefreshes = 0
+        self.rockMarkers = {}
+        self.rockFootprints = {}
+        
         # Colors for different objects
         self.colors = {
             'background': (10, 10, 30),
@@ -37,20 +59,23 @@ class MiniMap:
         map_y = int((world_y / self.universe.height) * self.map_size)
         return map_x, map_y
     
+    def invalidate(self):
+        """Redraw the rock layer in full on the next frame"""
+        self.stale = True
+    
     def draw(self, screen):
-        """Draw the mini map on the screen"""
-        # Clear the mini map surface
-        self.surface.fill(self.colors['background'])
-        
-        # Draw border
-        pygame.draw.rect(self.surface, self.colors['border'], 
-                        (0, 0, self.map_size, self.map_size), 2)
-        
-        # Draw individual rocks (make them more prominent)
-        self.drawRocks()
-        
-        # Draw space station
-        self.drawSpaceStation()
+        """Draw the mini map on the screen and return the rect it covers"""
+        # Rocks and the station come from the cached layer
+        if self.stale:
+            self.drawStaticLayer()
+        else:
+            self.framesUntilRefresh -= 1
+            if self.refresh is None and self.framesUntilRefresh <= 0:
+                self.refresh = self.staticLayerSteps()
+                self.framesUntilRefresh = self.refreshInterval
+            if self.refresh is not None and next(self.refresh, None) is None:
+                self.refresh = None
+        self.surface.blit(self.staticLayer, (0, 0))
         
         # Draw saucer if present
         self.drawSaucer()
@@ -65,39 +90,155 @@ class MiniMap:
         self.drawTitle()
         
         # Blit the mini map to the main screen
-        screen.blit(self.surface, (self.map_x, self.map_y))
+        return screen.blit(self.surface, (self.map_x, self.map_y))
+    
+    def drawStaticLayer(self):
+        """Redraw background, border, rocks and station into the cached layer at once"""
+        for _ in self.staticLayerSteps():
+            pass
+        self.refresh = None
+        self.stale = False
+        self.framesUntilRefresh = self.refreshInterval
+    
+    def staticLayerSteps(self):
+        """Redraw the cached layer into backLayer, yielding between the steps; swaps at the end"""
+        layer = self.backLayer
+        layer.fill(self.colors['background'])
+        
+        # Draw border
+        pygame.draw.rect(layer, self.colors['border'], 
+                        (0, 0, self.map_size, self.map_size), 2)
+        
+        # Draw individual rocks (make them more prominent)
+        if self.universe.rockStore is not None and np is not None:
+            yield from self.rasterRocks(layer)
+        else:
+            self.drawRocks(layer)
+        
+        # Draw space station
+        self.drawSpaceStation(layer)
+        self.backLayer, self.staticLayer = self.staticLayer, layer
+        self.staticRefreshes += 1
+    
+    def rockMarker(self, style):
+        """Marker for a rock style (material * 2 + 1 if large): a dot with a white rim"""
+        marker = self.rockMarkers.get(style)
+        if marker is None:
+            material, large = divmod(style, 2)
+            if material == 2:  # Gold
+                color = (255, 215, 0)  # Brighter gold
+                radius = 3  # Make gold rocks more prominent
+            elif material == 1:  # Iron
+                color = (180, 180, 180)  # Brighter silver
+                radius = 2
+            else:  # Coal
+                color = (120, 120, 120)  # Brighter gray
+                radius = 2
+            # Make large rocks even more visible
+            radius += large
+            
+            size = 2 * radius + 3
+            image = pygame.Surface((size, size))
+            image.set_colorkey((0, 0, 0))
+            pygame.draw.circle(image, (255, 255, 255), (radius + 1, radius + 1), radius + 1)
+            pygame.draw.circle(image, color, (radius + 1, radius + 1), radius)
+            marker = self.rockMarkers[style] = (image, radius + 1)
+        return marker
+    
+    def rockFootprint(self, style):
+        """[(color, [(dx, dy), ...]), ...] of a style's marker pixels, rim first"""
+        footprint = self.rockFootprints.get(style)
+        if footprint is None:
+            image, offset = self.rockMarker(style)
+            pixels = pygame.surfarray.array3d(image)
+            by_color = {}
+            for x in range(pixels.shape[0]):
+                for y in range(pixels.shape[1]):
+                    color = tuple(int(c) for c in pixels[x, y])
+                    if color != (0, 0, 0):
+                        by_color.setdefault(color, []).append((x - offset, y - offset))
+            footprint = sorted(by_color.items(), key=lambda item: item[0] != (255, 255, 255))
+            self.rockFootprints[style] = footprint
+        return footprint
     
-    def drawRocks(self):
+    def drawRocks(self, layer):
         """Draw individual rocks as more noticeable dots"""
-        for rock in self.universe.rocks:
-            map_x, map_y = self.worldToMapCoords(rock.position.x, rock.position.y)
+        universe = self.universe
+        
+        # One marker per map pixel and style; sorting puts gold and large rocks on top
+        size = self.map_size
+        universe.catchUpRocks()
+        rocks = [(rock.position.x, rock.position.y, getattr(rock, 'rockType', None),
+                  getattr(rock, 'materialType', 0)) for rock in universe.rocks]
+        if universe.chunks is not None:
+            # Rocks packed away in explored chunks that are not loaded
+            rocks.extend(universe.chunks.dormantRocks())
+        pixels = set()
+        for x, y, rock_type, material in rocks:
+            map_x, map_y = self.worldToMapCoords(x, y)
             # Make sure the rock is within the mini map bounds
-            if 0 <= map_x < self.map_size and 0 <= map_y < self.map_size:
-                # Different colors and sizes for different rock materials and types
-                radius = 2  # Base radius - larger than before
-                
-                if hasattr(rock, 'materialType'):
-                    if rock.materialType == 2:  # Gold
-                        color = (255, 215, 0)  # Brighter gold
-                        radius = 3  # Make gold rocks more prominent
-                    elif rock.materialType == 1:  # Iron
-                        color = (180, 180, 180)  # Brighter silver
-                        radius = 2
-                    else:  # Coal
-                        color = (120, 120, 120)  # Brighter gray
-                        radius = 2
-                else:
-                    color = (150, 150, 150)  # Default bright gray
-                    radius = 2
-                
-                # Make large rocks even more visible
-                if hasattr(rock, 'rockType'):
-                    if rock.rockType == 0:  # Large rock
-                        radius += 1
-                
-                # Draw the rock with a small border for better visibility
-                pygame.draw.circle(self.surface, (255, 255, 255), (map_x, map_y), radius + 1)
-                pygame.draw.circle(self.surface, color, (map_x, map_y), radius)
+            if 0 <= map_x < size and 0 <= map_y < size:
+                material = min(max(material, 0), 2)
+                large = 1 if rock_type == 0 else 0
+                pixels.add((material * 2 + large, map_x, map_y))
+        blits = []
+        for style, map_x, map_y in sorted(pixels):
+            image, offset = self.rockMarker(style)
+            blits.append((image, (map_x - offset, map_y - offset)))
+        layer.blits(blits, doreturn=False)
+    
+    def rasterRocks(self, layer):
+        """Paint the rock markers straight into the layer's pixels from the RockStore arrays.
+
+        Rock positions become one occupancy grid per style; each marker pixel
+        is then a shifted copy of that grid, so the cost depends on the map
+        size rather than on how many rocks there are. Yields after reading
+        the positions, after building the grids and after each marker
+        colour, so the work can be spread over frames; the map shows the
+        rocks as they were on the first step.
+        """
+        size = self.map_size
+        store = self.universe.rockStore
+        count = store.count
+        # Rocks the LOD scheduler left behind are drawn where they are by now
+        positions = store.currentPositions()
+        xs = positions[:, 0]
+        ys = positions[:, 1]
+        materials = store.materials[:count]
+        rock_types = store.rockTypes[:count]
+        chunks = self.universe.chunks
+        if chunks is not None:
+            # Rocks packed away in explored chunks that are not loaded
+            dormant = chunks.dormantArrays()
+            xs = np.concatenate((xs, dormant['x']))
+            ys = np.concatenate((ys, dormant['y']))
+            materials = np.concatenate((materials, dormant['material'].astype(materials.dtype)))
+            rock_types = np.concatenate((rock_types, dormant['rockType'].astype(rock_types.dtype)))
+        yield
+        
+        map_x = np.floor(xs * (size / self.universe.width)).astype(np.intp)
+        map_y = np.floor(ys * (size / self.universe.height)).astype(np.intp)
+        inside = (map_x >= 0) & (map_x < size) & (map_y >= 0) & (map_y < size)
+        styles = np.clip(materials, 0, 2).astype(np.intp) * 2 + (rock_types == 0)
+        occupancy = np.zeros((6, size, size), dtype=bool)
+        occupancy[styles[inside], map_x[inside], map_y[inside]] = True
+        yield
+        
+        mask = np.empty((size, size), dtype=bool)
+        for style in range(6):
+            occupied = occupancy[style]
+            if not occupied.any():
+                continue
+            for color, offsets in self.rockFootprint(style):
+                mask.fill(False)
+                for dx, dy in offsets:
+                    mask[max(dx, 0):size + min(dx, 0), max(dy, 0):size + min(dy, 0)] |= \
+                        occupied[max(-dx, 0):size - max(dx, 0), max(-dy, 0):size - max(dy, 0)]
+                pixels = pygame.surfarray.pixels2d(layer)
+                pixels[mask] = layer.map_rgb(color)
+                # Release the pixel lock before the layer is drawn on again
+                del pixels
+                yield
     
     def drawPlayer(self):
         """Draw the player ship"""
@@ -117,22 +258,16 @@ class MiniMap:
                     pygame.draw.line(self.surface, self.colors['player'], 
                                    (map_x, map_y), (end_x, end_y), 2)
     
-    def drawSpaceStation(self):
+    def drawSpaceStation(self, layer):
         """Draw the space station"""
-        # Find space station in universe objects
-        space_station = None
-        for obj in self.universe.objects:
-            if hasattr(obj, '__class__') and obj.__class__.__name__ == 'SpaceStation':
-                space_station = obj
-                break
-        
+        space_station = self.universe.spaceStation
         if space_station:
             map_x, map_y = self.worldToMapCoords(space_station.position.x, 
                                                space_station.position.y)
             # Make sure the station is within the mini map bounds
             if 0 <= map_x < self.map_size and 0 <= map_y < self.map_size:
                 # Draw station as a blue square
-                pygame.draw.rect(self.surface, self.colors['space_station'], 
+                pygame.draw.rect(layer, self.colors['space_station'], 
                                (map_x - 2, map_y - 2, 4, 4))
     
     def drawSaucer(self):
@@ -157,12 +292,18 @@ class MiniMap:
             if 0 <= map_x < self.map_size and 0 <= map_y < self.map_size:
                 pygame.draw.circle(self.surface, self.colors['debris'], (map_x, map_y), 1)
                 debris_count += 1
+        
+        # Particle debris shares the same limit
+        if self.universe.particles is not None and debris_count <= 50:
+            for x, y in self.universe.particles.livePositions()[:51 - debris_count].tolist():
+                map_x, map_y = self.worldToMapCoords(x, y)
+                if 0 <= map_x < self.map_size and 0 <= map_y < self.map_size:
+                    pygame.draw.circle(self.surface, self.colors['debris'], (map_x, map_y), 1)
     
     def drawTitle(self):
         """Draw mini map title"""
         try:
-            font = pygame.font.Font(None, 16)
-            title_text = font.render("Galaxy Map", True, (255, 255, 255))
+            title_text = textCache.render("Galaxy Map", (255, 255, 255), 16, None)
             self.surface.blit(title_text, (5, 5))
         except:
             # Fallback if font loading fails
@@ -0,0 +1,137 @@
+"""
+Particle System
+Fixed-capacity explosion particles, emitted, moved, faded and expired in bulk
+"""
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, explosions then use Debris sprites
+    np = None
+
+
+def particleSystemAvailable():
+    """True when NumPy is installed and a ParticleSystem can be built"""
+    return np is not None
+
+
+class ParticleSystem:
+    """Explosion debris stored in fixed-size arrays instead of sprites.
+
+    Reproduces the look of the old Debris sprites: each particle starts
+    white within 10 px of the explosion, drifts at up to 1.5 px per tick,
+    darkens by ``fade`` per tick and is drawn as a 2x2 dot straight into the
+    frame surface. Live particles are kept packed at the front of the arrays;
+    emitting into a full system drops the extra particles.
+    """
+
+    def __init__(self, capacity=4096, ttl=50, fade=5, speed=1.5, spread=10):
+        if np is None:
+            raise ImportError("ParticleSystem requires NumPy")
+        self.capacity = capacity
+        self.ttl = ttl
+        self.fade = fade
+        self.speed = speed
+        self.spread = spread
+        self.count = 0
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.ttls = np.zeros(capacity, dtype=np.int32)
+        self.brightness = np.zeros(capacity, dtype=np.int32)
+        self.rng = np.random.default_rng()
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, count):
+        """Spawn up to count particles around (x, y); returns how many fit"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        start = self.count
+        end = start + count
+        rng = self.rng
+        offsets = rng.integers(-self.spread, self.spread, size=(count, 2))
+        self.positions[start:end, 0] = x + offsets[:, 0]
+        self.positions[start:end, 1] = y + offsets[:, 1]
+        self.velocities[start:end] = rng.uniform(-self.speed, self.speed, size=(count, 2))
+        self.ttls[start:end] = self.ttl
+        self.brightness[start:end] = 255
+        self.count = end
+        return count
+
+    def update(self):
+        """Integrate, fade and expire every particle"""
+        count = self.count
+        if count == 0:
+            return
+        self.positions[:count] += self.velocities[:count]
+        self.ttls[:count] -= 1
+        self.brightness[:count] -= self.fade
+
+        alive = self.ttls[:count] > 0
+        remaining = int(alive.sum())
+        if remaining < count:
+            # Pack the survivors at the front of the arrays
+            self.positions[:remaining] = self.positions[:count][alive]
+            self.velocities[:remaining] = self.velocities[:count][alive]
+            self.ttls[:remaining] = self.ttls[:count][alive]
+            self.brightness[:remaining] = self.brightness[:count][alive]
+            self.count = remaining
+
+    def livePositions(self):
+        """Array of (x, y) world positions of the live particles"""
+        return self.positions[:self.count]
+
+    def clear(self):
+        self.count = 0
+
+    def draw(self, surface, view_x, view_y, alpha=1.0):
+        """Draw the live particles as 2x2 dots offset by the camera view.
+
+        An alpha below 1 draws them that far between the previous and the
+        latest update. Returns the screen rect covering the dots, or None if
+        none were drawn.
+        """
+        count = self.count
+        if count == 0:
+            return None
+        width, height = surface.get_size()
+        positions = self.positions[:count]
+        if alpha != 1.0:
+            positions = positions + self.velocities[:count] * (alpha - 1.0)
+        screen_x = (positions[:, 0] - view_x).astype(np.int64)
+        screen_y = (positions[:, 1] - view_y).astype(np.int64)
+        visible = (screen_x >= 0) & (screen_x < width - 1) & (screen_y >= 0) & (screen_y < height - 1)
+        if not visible.any():
+            return None
+        screen_x = screen_x[visible]
+        screen_y = screen_y[visible]
+        level = np.clip(self.brightness[:count][visible], 0, 255)
+        left = int(screen_x.min())
+        top = int(screen_y.min())
+        drawn_rect = pygame.Rect(left, top, int(screen_x.max()) - left + 2,
+                                 int(screen_y.max()) - top + 2)
+
+        if surface.get_bytesize() not in (3, 4):
+            # surfarray needs a 24/32-bit surface, fall back to fills
+            for sx, sy, value in zip(screen_x.tolist(), screen_y.tolist(), level.tolist()):
+                surface.fill((value, value, value), (sx, sy, 2, 2))
+            return drawn_rect
+
+        # Map the grey levels to pixel values using the surface's format
+        mapped = np.zeros(len(level), dtype=np.int64)
+        for shift, loss, mask in zip(surface.get_shifts()[:3], surface.get_losses()[:3],
+                                     surface.get_masks()[:3]):
+            mapped |= ((level >> loss) << shift) & mask
+        if surface.get_masks()[3]:
+            mapped |= surface.get_masks()[3]
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[screen_x, screen_y] = mapped
+        pixels[screen_x + 1, screen_y] = mapped
+        pixels[screen_x, screen_y + 1] = mapped
+        pixels[screen_x + 1, screen_y + 1] = mapped
+        del pixels
+        return drawn_rect
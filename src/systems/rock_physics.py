@@ -0,0 +1,204 @@
+"""
+Rock Physics
+Vectorized rock-rock collision detection and response on a RockStore
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:  # Only used together with RockStore, which needs NumPy
+    np = None
+
+# Same constants as the scalar path in Universe.handleRockRockCollisions
+RESTITUTION = 0.8
+SPIN_KICK = 5
+MIN_DISTANCE = 0.1
+
+
+def findRockPairs(store, margin=0.0, slots=None):
+    """Return arrays (first, second) of slot pairs whose circles overlap.
+
+    slots, an ascending array, limits the search to those rows.
+
+    Rows are bucketed into a grid whose cells are as wide as the largest
+    contact distance, so each row only needs pairing with rows in its own
+    cell and the four following neighbour cells. Candidates are then
+    filtered on the real distance. Pairs have first < second and are sorted
+    the way an all-pairs loop visits them.
+    """
+    count = store.count if slots is None else len(slots)
+    empty = np.empty(0, dtype=np.intp)
+    if count < 2:
+        return empty, empty
+
+    if slots is None:
+        x = store.positions[:count, 0]
+        y = store.positions[:count, 1]
+        reach = store.radii[:count] + margin * 0.5
+    else:
+        x = store.positions[slots, 0]
+        y = store.positions[slots, 1]
+        reach = store.radii[slots] + margin * 0.5
+    cell_size = 2 * float(reach.max())
+
+    cx = np.floor_divide(x, cell_size).astype(np.int64)
+    cy = np.floor_divide(y, cell_size).astype(np.int64)
+    cx -= cx.min()
+    cy -= cy.min()
+    # Leave a spare row on each side so neighbour keys never alias
+    stride = int(cy.max()) + 3
+    keys = cx * stride + cy + 1
+
+    order = np.argsort(keys, kind='stable')
+    cell_keys, cell_starts, cell_counts = np.unique(keys[order], return_index=True,
+                                                    return_counts=True)
+
+    candidates_a = []
+    candidates_b = []
+
+    # Pairs inside the same cell
+    a, b = _crossPairs(cell_starts, cell_counts, cell_starts, cell_counts)
+    inside = a < b
+    candidates_a.append(a[inside])
+    candidates_b.append(b[inside])
+
+    # Pairs with the following neighbour cells (each pair is seen once)
+    for offset in (1, stride - 1, stride, stride + 1):
+        neighbour = np.searchsorted(cell_keys, cell_keys + offset)
+        neighbour = np.minimum(neighbour, len(cell_keys) - 1)
+        found = cell_keys[neighbour] == cell_keys + offset
+        if found.any():
+            a, b = _crossPairs(cell_starts[found], cell_counts[found],
+                               cell_starts[neighbour[found]], cell_counts[neighbour[found]])
+            candidates_a.append(a)
+            candidates_b.append(b)
+
+    a = order[np.concatenate(candidates_a)]
+    b = order[np.concatenate(candidates_b)]
+
+    dx = x[b] - x[a]
+    dy = y[b] - y[a]
+    limit = reach[a] + reach[b]
+    close = dx * dx + dy * dy < limit * limit
+    a = a[close]
+    b = b[close]
+
+    if slots is not None:
+        a = slots[a]
+        b = slots[b]
+    first = np.minimum(a, b)
+    second = np.maximum(a, b)
+    ordering = np.lexsort((second, first))
+    return first[ordering], second[ordering]
+
+
+def _crossPairs(starts_a, counts_a, starts_b, counts_b):
+    """Every (a, b) combination between matching runs of sorted rows"""
+    per_run = counts_a * counts_b
+    total = int(per_run.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    run = np.repeat(np.arange(len(per_run)), per_run)
+    local = np.arange(total) - np.repeat(np.cumsum(per_run) - per_run, per_run)
+    width = counts_b[run]
+    return starts_a[run] + local // width, starts_b[run] + local % width
+
+
+def scheduleBatches(first, second):
+    """Split an ordered pair list into batches that share no rock.
+
+    Each pair goes into the batch after the latest earlier pair that touches
+    one of its rocks, so every rock still sees its contacts in the original
+    order and the sequential (pair by pair) result is reproduced exactly.
+    Pairs whose rocks have no other contact all go straight into the first
+    batch; only rocks with several contacts are scheduled one by one.
+    """
+    contacts = np.bincount(np.concatenate((first, second)))
+    shared = (contacts[first] > 1) | (contacts[second] > 1)
+    batches = [list(np.nonzero(~shared)[0].tolist())]
+
+    last_batch = {}
+    shared_pairs = np.nonzero(shared)[0].tolist()
+    for k, i, j in zip(shared_pairs, first[shared].tolist(), second[shared].tolist()):
+        batch = max(last_batch.get(i, -1), last_batch.get(j, -1)) + 1
+        last_batch[i] = batch
+        last_batch[j] = batch
+        if batch == len(batches):
+            batches.append([])
+        batches[batch].append(k)
+    return [np.array(sorted(batch), dtype=np.intp) for batch in batches if batch]
+
+
+def resolveRockCollisions(store, first, second, rng=random):
+    """Separate overlapping rocks and apply the elastic response in bulk.
+
+    Computes normals, overlap separation, restitution impulses and the
+    random spin kick for every candidate pair and writes the results back
+    into the store. Spin kicks are drawn from ``rng`` in pair order, two per
+    resolved pair, exactly like the scalar path. Returns the slots whose
+    position changed.
+    """
+    if len(first) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    positions = store.positions
+    headings = store.headings
+    radii = store.radii
+    masses = store.masses
+
+    resolved = []
+    moved = []
+    for batch in scheduleBatches(first, second):
+        i = first[batch]
+        j = second[batch]
+
+        delta = positions[j] - positions[i]
+        distance = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+        min_distance = radii[i] + radii[j]
+        hit = (distance < min_distance) & (distance > MIN_DISTANCE)
+        if not hit.any():
+            continue
+        i = i[hit]
+        j = j[hit]
+        batch = batch[hit]
+        distance = distance[hit]
+
+        # Collision normal and separation (no rock repeats within a batch)
+        normal = delta[hit] / distance[:, None]
+        separation = normal * ((min_distance[hit] - distance) * 0.5)[:, None]
+        positions[i] -= separation
+        positions[j] += separation
+        moved.append(i)
+        moved.append(j)
+
+        # Relative velocity along the normal; skip separating pairs
+        relative = headings[j] - headings[i]
+        dvn = relative[:, 0] * normal[:, 0] + relative[:, 1] * normal[:, 1]
+        approaching = dvn <= 0
+        if not approaching.any():
+            continue
+        i = i[approaching]
+        j = j[approaching]
+        normal = normal[approaching]
+        mass1 = masses[i]
+        mass2 = masses[j]
+
+        impulse = 2 * dvn[approaching] / (mass1 + mass2) * RESTITUTION
+        headings[i] += normal * (impulse * mass2)[:, None]
+        headings[j] -= normal * (impulse * mass1)[:, None]
+        resolved.append(batch[approaching])
+
+    if resolved:
+        # Spin does not feed back into the motion, so draw it last in the
+        # original pair order to consume the random stream identically
+        resolved = np.sort(np.concatenate(resolved))
+        kicks = np.array([rng.uniform(-SPIN_KICK, SPIN_KICK)
+                          for _ in range(2 * len(resolved))]).reshape(-1, 2)
+        np.add.at(store.angles, first[resolved], kicks[:, 0])
+        np.add.at(store.angles, second[resolved], kicks[:, 1])
+
+    if not moved:
+        return np.empty(0, dtype=np.intp)
+    return np.unique(np.concatenate(moved))
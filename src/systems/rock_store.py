@@ -0,0 +1,284 @@
+"""
+Rock Store
+Structure-of-arrays storage for rocks, advanced in one vectorized step
+"""
+
+from ..util.vector2d import Vector2d
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, rocks then move one by one
+    np = None
+
+
+def rockStoreAvailable():
+    """True when NumPy is installed and a RockStore can be built"""
+    return np is not None
+
+
+class StoreVector:
+    """Vector2d-compatible view onto one row of a RockStore array"""
+
+    __slots__ = ('store', 'field', 'slot')
+
+    def __init__(self, store, field, slot):
+        self.store = store
+        self.field = field
+        self.slot = slot
+
+    @property
+    def x(self):
+        return getattr(self.store, self.field)[self.slot, 0]
+
+    @x.setter
+    def x(self, value):
+        getattr(self.store, self.field)[self.slot, 0] = value
+
+    @property
+    def y(self):
+        return getattr(self.store, self.field)[self.slot, 1]
+
+    @y.setter
+    def y(self, value):
+        getattr(self.store, self.field)[self.slot, 1] = value
+
+
+class RockStore:
+    """Keeps position, heading, angle, type and material of rocks in arrays.
+
+    Collision radius and mass are stored alongside for the vectorized
+    collision kernel in rock_physics.py.
+
+    Rocks added to the store keep working as normal Rock objects: their
+    ``position`` and ``heading`` become StoreVector views and their ``angle``
+    reads through to the store, so the rest of the game (collision handling,
+    Game.handleRockDestroyed, the minimap) sees rock-like objects while
+    ``step`` moves every rock with a few array operations. Rows are kept
+    dense with swap-removal, mirroring Universe.rocks, so a rock's slot is
+    also its index in that list.
+
+    ``step`` can also advance only some rows (see systems/lod.py). Each
+    row remembers the tick it was last advanced in ``lastTicks``; a row
+    that missed ticks moves along its heading by all of them at once the
+    next time it is stepped or caught up, so it ends up where it would
+    have been.
+    """
+
+    def __init__(self, capacity=1024, spin=1.0):
+        if np is None:
+            raise ImportError("RockStore requires NumPy")
+        self.spin = spin  # degrees per tick, as in Rock.move
+        self.count = 0
+        self.tick = 0
+        # True while some row was not advanced on the latest tick
+        self.lagging = False
+        self.rocks = []
+        self._allocate(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _allocate(self, capacity):
+        """(Re)allocate the arrays, keeping the rows in use"""
+        count = self.count
+        positions = np.zeros((capacity, 2))
+        headings = np.zeros((capacity, 2))
+        angles = np.zeros(capacity)
+        rockTypes = np.zeros(capacity, dtype=np.int8)
+        materials = np.zeros(capacity, dtype=np.int8)
+        radii = np.zeros(capacity)
+        masses = np.zeros(capacity)
+        lastTicks = np.zeros(capacity, dtype=np.int64)
+        if count:
+            positions[:count] = self.positions[:count]
+            headings[:count] = self.headings[:count]
+            angles[:count] = self.angles[:count]
+            rockTypes[:count] = self.rockTypes[:count]
+            materials[:count] = self.materials[:count]
+            radii[:count] = self.radii[:count]
+            masses[:count] = self.masses[:count]
+            lastTicks[:count] = self.lastTicks[:count]
+        self.positions = positions
+        self.headings = headings
+        self.angles = angles
+        self.rockTypes = rockTypes
+        self.materials = materials
+        self.radii = radii
+        self.masses = masses
+        self.lastTicks = lastTicks
+        self.capacity = capacity
+
+    def add(self, rock):
+        """Move a rock's state into the store and turn it into a view"""
+        if rock.store is self:
+            return
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+
+        slot = self.count
+        self.positions[slot] = (rock.position.x, rock.position.y)
+        self.headings[slot] = (rock.heading.x, rock.heading.y)
+        self.angles[slot] = rock.angle
+        self.rockTypes[slot] = rock.rockType
+        self.materials[slot] = rock.materialType
+        self.radii[slot] = rock.radius
+        self.masses[slot] = rock.mass
+        self.lastTicks[slot] = self.tick
+        self.rocks.append(rock)
+        self.count += 1
+
+        rock.store = self
+        rock.storeSlot = slot
+        rock.position = StoreVector(self, 'positions', slot)
+        rock.heading = StoreVector(self, 'headings', slot)
+
+    def addMany(self, rocks, records=None):
+        """add for a list of new rocks, filling their rows with one assignment per array.
+
+        records is an optional structured array (the chunk record layout:
+        x, y, headingX, headingY, angle, rockType, material) matching rocks,
+        read instead of the rocks' attributes.
+        """
+        count = len(rocks)
+        if count == 0:
+            return
+        capacity = self.capacity
+        while self.count + count > capacity:
+            capacity *= 2
+        if capacity != self.capacity:
+            self._allocate(capacity)
+
+        start = self.count
+        rows = slice(start, start + count)
+        if records is None:
+            self.positions[rows] = [(rock.position.x, rock.position.y) for rock in rocks]
+            self.headings[rows] = [(rock.heading.x, rock.heading.y) for rock in rocks]
+            self.angles[rows] = [rock.angle for rock in rocks]
+            self.rockTypes[rows] = [rock.rockType for rock in rocks]
+            self.materials[rows] = [rock.materialType for rock in rocks]
+        else:
+            self.positions[rows, 0] = records['x']
+            self.positions[rows, 1] = records['y']
+            self.headings[rows, 0] = records['headingX']
+            self.headings[rows, 1] = records['headingY']
+            self.angles[rows] = records['angle']
+            self.rockTypes[rows] = records['rockType']
+            self.materials[rows] = records['material']
+        self.radii[rows] = [rock.radius for rock in rocks]
+        self.masses[rows] = [rock.mass for rock in rocks]
+        self.lastTicks[rows] = self.tick
+        self.rocks.extend(rocks)
+        self.count += count
+
+        for slot, rock in enumerate(rocks, start):
+            rock.store = self
+            rock.storeSlot = slot
+            rock.position = StoreVector(self, 'positions', slot)
+            rock.heading = StoreVector(self, 'headings', slot)
+
+    def remove(self, rock):
+        """Copy a rock's state back onto the object and free its row"""
+        if rock.store is not self:
+            return
+        slot = rock.storeSlot
+        hx, hy = self.headings[slot]
+        # Bring a lagging rock up to date on its way out
+        elapsed = self.tick - int(self.lastTicks[slot])
+        x, y = self.positions[slot] + self.headings[slot] * elapsed
+        angle = float(self.angles[slot]) + self.spin * elapsed
+
+        rock.store = None
+        rock.storeSlot = None
+        rock.position = Vector2d(float(x), float(y))
+        rock.heading = Vector2d(float(hx), float(hy))
+        rock.angle = angle
+
+        last = self.count - 1
+        moved = self.rocks.pop()
+        if slot != last:
+            self.positions[slot] = self.positions[last]
+            self.headings[slot] = self.headings[last]
+            self.angles[slot] = self.angles[last]
+            self.rockTypes[slot] = self.rockTypes[last]
+            self.materials[slot] = self.materials[last]
+            self.radii[slot] = self.radii[last]
+            self.masses[slot] = self.masses[last]
+            self.lastTicks[slot] = self.lastTicks[last]
+            self.rocks[slot] = moved
+            moved.storeSlot = slot
+            moved.position.slot = slot
+            moved.heading.slot = slot
+        self.count = last
+
+    def step(self, cellSize=None, due=None):
+        """Advance the rocks by one tick.
+
+        due, an array of slots, limits the step to those rows; the others
+        keep their place until they are next due or caught up. Returns the
+        rocks whose grid cell (of the given size) changed, so a spatial
+        index only has to re-bucket those.
+        """
+        self.tick += 1
+        count = self.count
+        if count == 0:
+            return []
+        if due is not None or self.lagging:
+            return self.catchUp(due, cellSize)
+
+        positions = self.positions[:count]
+        if cellSize:
+            before = np.floor_divide(positions, cellSize)
+
+        positions += self.headings[:count]
+        self.angles[:count] += self.spin
+        self.lastTicks[:count] = self.tick
+
+        if not cellSize:
+            return []
+        crossed = np.nonzero((np.floor_divide(positions, cellSize) != before).any(axis=1))[0]
+        rocks = self.rocks
+        return [rocks[slot] for slot in crossed.tolist()]
+
+    def catchUp(self, slots=None, cellSize=None):
+        """Move the given slots (all by default) by every tick they missed.
+
+        Returns the rocks whose grid cell changed, as step does.
+        """
+        count = self.count
+        if slots is None:
+            slots = np.arange(count)
+        else:
+            slots = np.asarray(slots, dtype=np.intp)
+        elapsed = self.tick - self.lastTicks[slots]
+        behind = elapsed > 0
+        slots = slots[behind]
+        elapsed = elapsed[behind]
+        if len(slots):
+            positions = self.positions[slots]
+            if cellSize:
+                before = np.floor_divide(positions, cellSize)
+            positions += self.headings[slots] * elapsed[:, None]
+            self.positions[slots] = positions
+            self.angles[slots] += self.spin * elapsed
+            self.lastTicks[slots] = self.tick
+        self.lagging = bool((self.lastTicks[:count] != self.tick).any())
+
+        if not cellSize or not len(slots):
+            return []
+        crossed = slots[(np.floor_divide(positions, cellSize) != before).any(axis=1)]
+        rocks = self.rocks
+        return [rocks[slot] for slot in crossed.tolist()]
+
+    def currentSlots(self):
+        """Slots of the rows advanced on the latest tick, None when that is every row"""
+        if not self.lagging:
+            return None
+        return np.nonzero(self.lastTicks[:self.count] == self.tick)[0]
+
+    def currentPositions(self):
+        """Where every row is as of the latest tick, including lagging rows"""
+        count = self.count
+        if not self.lagging:
+            return self.positions[:count]
+        elapsed = (self.tick - self.lastTicks[:count])[:, None]
+        return self.positions[:count] + self.headings[:count] * elapsed
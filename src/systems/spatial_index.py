@@ -0,0 +1,281 @@
+"""
+Spatial Index
+Incrementally updated lookups for region, radius and nearest-neighbour queries
+"""
+
+import heapq
+import math
+
+
+class SpatialIndex:
+    """Interface shared by all spatial index implementations"""
+
+    def insert(self, obj):
+        """Start tracking an object"""
+        raise NotImplementedError
+
+    def remove(self, obj):
+        """Stop tracking an object (no-op if it is not tracked)"""
+        raise NotImplementedError
+
+    def update(self, obj):
+        """Refresh an object after its position changed"""
+        raise NotImplementedError
+
+    def clear(self):
+        """Forget every tracked object"""
+        raise NotImplementedError
+
+    def queryRegion(self, x, y, width, height):
+        """Return objects whose position lies inside the rectangle (inclusive)"""
+        raise NotImplementedError
+
+    def queryRadius(self, x, y, radius):
+        """Return objects whose position lies within radius of (x, y)"""
+        raise NotImplementedError
+
+    def queryNearest(self, x, y, k=1, maxRadius=None):
+        """Return up to k objects closest to (x, y), nearest first"""
+        raise NotImplementedError
+
+
+class BruteForceIndex(SpatialIndex):
+    """Reference implementation that scans every object on each query"""
+
+    def __init__(self):
+        self.objects = {}
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __contains__(self, obj):
+        return obj in self.objects
+
+    def insert(self, obj):
+        self.objects[obj] = None
+
+    def remove(self, obj):
+        self.objects.pop(obj, None)
+
+    def update(self, obj):
+        # Nothing is bucketed, so positions are always read live
+        pass
+
+    def clear(self):
+        self.objects.clear()
+
+    def queryRegion(self, x, y, width, height):
+        right = x + width
+        bottom = y + height
+        found = []
+        for obj in self.objects:
+            position = obj.position
+            if x <= position.x <= right and y <= position.y <= bottom:
+                found.append(obj)
+        return found
+
+    def queryRadius(self, x, y, radius):
+        radius_sq = radius * radius
+        found = []
+        for obj in self.objects:
+            dx = obj.position.x - x
+            dy = obj.position.y - y
+            if dx * dx + dy * dy <= radius_sq:
+                found.append(obj)
+        return found
+
+    def queryNearest(self, x, y, k=1, maxRadius=None):
+        limit_sq = math.inf if maxRadius is None else maxRadius * maxRadius
+        candidates = []
+        for obj in self.objects:
+            dx = obj.position.x - x
+            dy = obj.position.y - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= limit_sq:
+                candidates.append((distance_sq, id(obj), obj))
+        return [entry[2] for entry in heapq.nsmallest(k, candidates)]
+
+
+class UniformGridIndex(SpatialIndex):
+    """Hash grid that only stores occupied cells.
+
+    Only cells that contain something are kept in the dictionary, so the
+    tightly clustered asteroid belts cost nothing for the empty space between
+    them. Objects are re-bucketed only when they cross a cell boundary.
+    """
+
+    def __init__(self, cellSize=256):
+        self.cellSize = cellSize
+        self.cells = {}
+        self.objectCells = {}
+
+    def __len__(self):
+        return len(self.objectCells)
+
+    def __contains__(self, obj):
+        return obj in self.objectCells
+
+    def cellFor(self, x, y):
+        """Return the grid key of the cell containing (x, y)"""
+        return (int(x // self.cellSize), int(y // self.cellSize))
+
+    def insert(self, obj):
+        if obj in self.objectCells:
+            self.update(obj)
+            return
+        key = self.cellFor(obj.position.x, obj.position.y)
+        self.objectCells[obj] = key
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = {}
+        cell[obj] = None
+
+    def remove(self, obj):
+        key = self.objectCells.pop(obj, None)
+        if key is None:
+            return
+        cell = self.cells[key]
+        del cell[obj]
+        if not cell:
+            del self.cells[key]
+
+    def update(self, obj):
+        old_key = self.objectCells.get(obj)
+        if old_key is None:
+            return
+        cell_size = self.cellSize
+        position = obj.position
+        key = (int(position.x // cell_size), int(position.y // cell_size))
+        if key == old_key:
+            return
+
+        cell = self.cells[old_key]
+        del cell[obj]
+        if not cell:
+            del self.cells[old_key]
+
+        self.objectCells[obj] = key
+        cell = self.cells.get(key)
+        if cell is None:
+            cell = self.cells[key] = {}
+        cell[obj] = None
+
+    def clear(self):
+        self.cells.clear()
+        self.objectCells.clear()
+
+    def _cellsInRange(self, min_cx, min_cy, max_cx, max_cy):
+        """Yield the occupied cells inside an inclusive range of cell keys"""
+        span = (max_cx - min_cx + 1) * (max_cy - min_cy + 1)
+        if span > len(self.cells):
+            # Cheaper to walk the occupied cells than every key in range
+            for (cx, cy), cell in self.cells.items():
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy:
+                    yield cell
+            return
+
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = cells.get((cx, cy))
+                if cell is not None:
+                    yield cell
+
+    def queryRegion(self, x, y, width, height):
+        right = x + width
+        bottom = y + height
+        min_cx, min_cy = self.cellFor(x, y)
+        max_cx, max_cy = self.cellFor(right, bottom)
+
+        found = []
+        for cell in self._cellsInRange(min_cx, min_cy, max_cx, max_cy):
+            for obj in cell:
+                position = obj.position
+                if x <= position.x <= right and y <= position.y <= bottom:
+                    found.append(obj)
+        return found
+
+    def queryRadius(self, x, y, radius):
+        min_cx, min_cy = self.cellFor(x - radius, y - radius)
+        max_cx, max_cy = self.cellFor(x + radius, y + radius)
+        radius_sq = radius * radius
+
+        found = []
+        for cell in self._cellsInRange(min_cx, min_cy, max_cx, max_cy):
+            for obj in cell:
+                dx = obj.position.x - x
+                dy = obj.position.y - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append(obj)
+        return found
+
+    def queryNearest(self, x, y, k=1, maxRadius=None):
+        if k <= 0 or not self.objectCells:
+            return []
+
+        limit_sq = math.inf if maxRadius is None else maxRadius * maxRadius
+        center_cx, center_cy = self.cellFor(x, y)
+        cells = self.cells
+        candidates = []
+        seen = 0
+        ring = 0
+
+        # Search square rings of cells outwards from the query point. After
+        # finishing ring R everything closer than R * cellSize has been seen.
+        while True:
+            if (2 * ring + 1) ** 2 > len(cells):
+                # The rings now cover more keys than there are occupied
+                # cells, so finish with a single pass over what is left
+                for (cx, cy), cell in cells.items():
+                    if max(abs(cx - center_cx), abs(cy - center_cy)) >= ring:
+                        self._collectNearest(cell, x, y, limit_sq, candidates)
+                break
+
+            for key in self._ringKeys(center_cx, center_cy, ring):
+                cell = cells.get(key)
+                if cell is not None:
+                    seen += len(cell)
+                    self._collectNearest(cell, x, y, limit_sq, candidates)
+
+            covered = ring * self.cellSize
+            if seen >= len(self.objectCells):
+                break
+            if maxRadius is not None and covered >= maxRadius:
+                break
+            if len(candidates) >= k:
+                kth = heapq.nsmallest(k, candidates)[-1][0]
+                if kth <= covered * covered:
+                    break
+            ring += 1
+
+        return [entry[2] for entry in heapq.nsmallest(k, candidates)]
+
+    def _collectNearest(self, cell, x, y, limit_sq, candidates):
+        for obj in cell:
+            dx = obj.position.x - x
+            dy = obj.position.y - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= limit_sq:
+                candidates.append((distance_sq, id(obj), obj))
+
+    @staticmethod
+    def _ringKeys(center_cx, center_cy, ring):
+        """Yield the cell keys on the square ring at Chebyshev distance ring"""
+        if ring == 0:
+            yield (center_cx, center_cy)
+            return
+        for cx in range(center_cx - ring, center_cx + ring + 1):
+            yield (cx, center_cy - ring)
+            yield (cx, center_cy + ring)
+        for cy in range(center_cy - ring + 1, center_cy + ring):
+            yield (center_cx - ring, cy)
+            yield (center_cx + ring, cy)
+
+
+def createSpatialIndex(kind="grid", cellSize=256):
+    """Build a spatial index by name ("grid" or "brute")"""
+    if kind == "grid":
+        return UniformGridIndex(cellSize)
+    elif kind == "brute":
+        return BruteForceIndex()
+    raise ValueError(f"Unknown spatial index type: {kind}")
@@ -1,86 +1,291 @@
 import random
 import math
 from ..util.vector2d import Vector2d
+from ..util.geometry import segmentDistanceSquared, segmentEntersBox
+from ..util.narrowphase import polygonsCollide
 from ..entities.rock import Rock
 from ..entities.saucer import Saucer
 from ..entities.debris import Debris
 from ..entities.ship import Ship
-from ..entities.shooter import Bullet
+from ..entities.space_station import SpaceStation
+from ..entities.shooter import Bullet, bulletPool
+from ..entities.crystal import crystalPool
+from ..config.config import (SPATIAL_INDEX_TYPE, SPATIAL_GRID_CELL_SIZE, VISIBILITY_PADDING,
+                             ROCK_BROADPHASE_MARGIN, ROCK_STORE_ENABLED,
+                             PARTICLES_ENABLED, PARTICLE_CAPACITY, DEBRIS_TTL,
+                             WORLDGEN_ENABLED, LOD_ENABLED)
+from .spatial_index import createSpatialIndex
+from .broadphase import sweepAndPrune
+from .entity_store import EntityStore
+from .rock_store import RockStore, rockStoreAvailable
+from .rock_physics import findRockPairs, resolveRockCollisions
+from .particles import ParticleSystem, particleSystemAvailable
+from .chunks import ChunkManager, unpackRocks
+from .worldgen import WorldGenerator, worldgenAvailable
+from .lod import LodScheduler
+from ..util.pool import releaseToPool
 
 
 class Universe:
-    def __init__(self, width=10000, height=10000):
+    def __init__(self, width=10000, height=10000, spatialIndex=None, useRockStore=None,
+                 biomeMap=None, useWorldgen=None, useLod=None):
         self.width = width
         self.height = height
-        self.objects = []
-        self.rocks = []
-        self.bullets = []
-        self.debris = []
+        
+        # Dense per-category storage with O(1) add/remove. Removals are
+        # queued and applied once per tick by flushRemovals().
+        self.entities = EntityStore(('rocks', 'bullets', 'debris', 'movers'))
+        self.objects = self.entities.all
+        self.rocks = self.entities.category('rocks')
+        self.bullets = self.entities.category('bullets')
+        self.debris = self.entities.category('debris')
+        # Everything that moves itself through obj.move() each tick
+        self.movers = self.entities.category('movers')
         self.ship = None
         self.saucer = None
+        self.spaceStation = None
+        # Largest bounding radius of any rock added, bounds bullet queries
+        self.rockReach = 0
         
-    def addObject(self, obj):
-        """Add an object to the universe"""
-        self.objects.append(obj)
+        # Spatial index used for region, radius and nearest queries.
+        # Pass "brute" to check the grid against a full scan.
+        if spatialIndex is None or isinstance(spatialIndex, str):
+            spatialIndex = createSpatialIndex(spatialIndex or SPATIAL_INDEX_TYPE,
+                                              SPATIAL_GRID_CELL_SIZE)
+        self.spatialIndex = spatialIndex
+        
+        # Optional structure-of-arrays storage that moves all rocks at once
+        if useRockStore is None:
+            useRockStore = ROCK_STORE_ENABLED and rockStoreAvailable()
+        self.rockStore = RockStore() if useRockStore else None
+        
+        # Explosion debris lives in a pooled particle system when possible
+        self.particles = None
+        if PARTICLES_ENABLED and particleSystemAvailable():
+            self.particles = ParticleSystem(PARTICLE_CAPACITY, ttl=DEBRIS_TTL)
+        
+        # Samples belts as arrays, with materials from the biome map if given
+        if useWorldgen is None:
+            useWorldgen = WORLDGEN_ENABLED and worldgenAvailable()
+        self.worldgen = WorldGenerator(width, height, biomeMap) if useWorldgen else None
+        
+        # Streams rocks in and out around the camera once enableChunks is called
+        self.chunks = None
+        
+        # Moves distant rocks less often once setLodFocus is called
+        if useLod is None:
+            useLod = LOD_ENABLED
+        self.lod = LodScheduler() if useLod else None
+        
+    def enableChunks(self, seed):
+        """Generate rocks per chunk from the world seed, live only in chunks near the camera"""
+        self.chunks = ChunkManager(self, seed, generator=self.worldgen)
+        # Every chunk's belts exist from the start (packed away), so the
+        # mini map shows them all and the level clears once they are gone
+        self.chunks.generateAll()
         
+    def updateChunks(self, x, y):
+        """Load chunks near (x, y), normally the camera centre, and unload distant ones"""
+        if self.chunks is not None:
+            self.chunks.update(x, y)
+        
+    def setLodFocus(self, x, y):
+        """Centre the LOD bands on (x, y), normally the camera centre"""
+        if self.lod is not None:
+            self.lod.setFocus(x, y)
+            
+    def catchUpRocks(self, objects=None):
+        """Move rocks the LOD scheduler left behind (among objects, or all) to where they are by now"""
+        lod = self.lod
+        if lod is None:
+            return
+        store = self.rockStore
+        if store is None:
+            rocks = self.rocks if objects is None else [obj for obj in objects if isinstance(obj, Rock)]
+            lod.catchUpRocks(rocks, self.spatialIndex)
+            return
+        if not store.lagging:
+            return
+        slots = None
+        if objects is not None:
+            slots = [obj.storeSlot for obj in objects if getattr(obj, 'store', None) is store]
+        for rock in store.catchUp(slots, getattr(self.spatialIndex, 'cellSize', None)):
+            self.spatialIndex.update(rock)
+        
+    def placeRock(self, rock):
+        """Add a newly created rock; with chunks it is packed away if its chunk is not loaded"""
+        if self.chunks is not None:
+            self.chunks.placeRock(rock)
+        else:
+            self.addObject(rock)
+            
+    def addRockRecords(self, records):
+        """Place a ROCK_RECORD_DTYPE array of new rocks, packed away by chunk if chunked"""
+        if self.chunks is not None:
+            self.chunks.placeRecords(records)
+        else:
+            self.addRocks(unpackRocks(records), records)
+            
+    def isCleared(self):
+        """True when no rocks are left anywhere, including unloaded chunks"""
+        if len(self.rocks):
+            return False
+        return self.chunks is None or self.chunks.isCleared()
+        
+    def addObject(self, obj):
+        """Add an object to the universe and return its handle"""
         # Categorize objects for easier management
+        categories = ('movers',)
         if isinstance(obj, Rock):
-            self.rocks.append(obj)
+            self.rockReach = max(self.rockReach, obj.getBoundingRadius())
+            if self.rockStore is not None:
+                # Stored rocks are advanced in bulk by RockStore.step
+                self.rockStore.add(obj)
+                categories = ('rocks',)
+            elif self.lod is not None:
+                # Moved by the LOD scheduler instead of obj.move()
+                obj.lodTick = self.lod.tick
+                categories = ('rocks',)
+            else:
+                categories = ('rocks', 'movers')
         elif isinstance(obj, Bullet):
-            self.bullets.append(obj)
+            categories = ('bullets', 'movers')
         elif isinstance(obj, Debris):
-            self.debris.append(obj)
+            categories = ('debris', 'movers')
         elif isinstance(obj, Ship):
             self.ship = obj
         elif isinstance(obj, Saucer):
             self.saucer = obj
+        elif isinstance(obj, SpaceStation):
+            self.spaceStation = obj
             
-    def removeObject(self, obj):
-        """Remove an object from the universe"""
-        if obj in self.objects:
-            self.objects.remove(obj)
+        handle = self.entities.add(obj, categories)
+        self.spatialIndex.insert(obj)
+        return handle
+            
+    def addRocks(self, rocks, records=None):
+        """addObject for a list of new rocks, storing them in one batch.
+        
+        records, the ROCK_RECORD_DTYPE array the rocks were unpacked from,
+        lets the store copy their state column by column.
+        """
+        if self.rockStore is None:
+            for rock in rocks:
+                self.addObject(rock)
+            return
+        # Rocks of one shape and size share a pointlist, so one radius each
+        shared = {id(rock.pointlist): rock for rock in rocks}
+        for rock in shared.values():
+            self.rockReach = max(self.rockReach, rock.getBoundingRadius())
+        # Indexed while positions are still plain vectors, cheaper to read
+        add = self.entities.add
+        insert = self.spatialIndex.insert
+        for rock in rocks:
+            add(rock, ('rocks',))
+            insert(rock)
+        self.rockStore.addMany(rocks, records)
             
-        # Remove from category lists
-        if obj in self.rocks:
-            self.rocks.remove(obj)
-        elif obj in self.bullets:
-            self.bullets.remove(obj)
-        elif obj in self.debris:
-            self.debris.remove(obj)
-        elif obj == self.saucer:
+    def removeObject(self, obj):
+        """Remove an object from the universe at the end of the tick"""
+        self.entities.remove(obj)
+        if obj is self.saucer:
             self.saucer = None
+        elif obj is self.spaceStation:
+            self.spaceStation = None
             
-    def getObjectsInRegion(self, x, y, width, height):
-        """Get all objects within a rectangular region"""
-        visible_objects = []
+    def flushRemovals(self):
+        """Apply all queued removals"""
+        removed = self.entities.flush()
+        for obj in removed:
+            self.spatialIndex.remove(obj)
+            if self.rockStore is not None and isinstance(obj, Rock):
+                self.rockStore.remove(obj)
+            # Pooled bullets and crystals go back for reuse
+            releaseToPool(obj)
+        return removed
         
+    def releasePooledObjects(self):
+        """Hand every pooled bullet and crystal back, for when the universe is discarded"""
         for obj in self.objects:
-            # Check if object is within the visible region
-            # Add some padding for objects that might be partially visible
-            padding = 50
-            if (obj.position.x >= x - padding and 
-                obj.position.x <= x + width + padding and
-                obj.position.y >= y - padding and 
-                obj.position.y <= y + height + padding):
-                visible_objects.append(obj)
-                
-        return visible_objects
+            releaseToPool(obj)
+        
+    def getPoolStats(self):
+        """Hit rate and high-water mark of the bullet and crystal pools"""
+        return {
+            "bullets": bulletPool.stats(),
+            "crystals": crystalPool.stats(),
+        }
+        
+    def getObject(self, handle):
+        """Look up a live object by the handle addObject returned"""
+        return self.entities.get(handle)
+            
+    def getObjectsInRegion(self, x, y, width, height, padding=VISIBILITY_PADDING):
+        """Get all objects within a rectangular region"""
+        # Add some padding for objects that might be partially visible
+        objects = self.spatialIndex.queryRegion(x - padding, y - padding,
+                                                width + 2 * padding, height + 2 * padding)
+        self.catchUpRocks(objects)
+        return objects
+        
+    def getObjectsInRadius(self, x, y, radius):
+        """Get all objects whose position lies within radius of (x, y)"""
+        objects = self.spatialIndex.queryRadius(x, y, radius)
+        self.catchUpRocks(objects)
+        return objects
+        
+    def getNearestObjects(self, x, y, k=1, maxRadius=None):
+        """Get up to k objects closest to (x, y), nearest first"""
+        objects = self.spatialIndex.queryNearest(x, y, k, maxRadius)
+        self.catchUpRocks(objects)
+        return objects
         
     def updateObjects(self):
         """Update all objects in the universe"""
-        # Update all objects
-        for obj in self.objects[:]:  # Use slice to avoid modification during iteration
+        # Drop whatever was removed since the last tick (collisions, pickups)
+        self.flushRemovals()
+        
+        # Stored rocks move in one vectorized step; only the ones that
+        # crossed a grid cell need re-bucketing in the spatial index
+        spatial_index = self.spatialIndex
+        if self.rockStore is not None:
+            cell_size = getattr(spatial_index, 'cellSize', None)
+            # Distant rocks only move on some ticks (see systems/lod.py)
+            due = self.lod.dueSlots(self.rockStore) if self.lod is not None else None
+            for rock in self.rockStore.step(cell_size, due):
+                spatial_index.update(rock)
+        elif self.lod is not None:
+            self.lod.stepRocks(self.rocks, spatial_index)
+        
+        # Removals are deferred, so the dense list can be walked in place.
+        # Objects added while moving (new bullets) start moving next tick.
+        items = self.movers.items
+        for index in range(len(items)):
+            obj = items[index]
             obj.move()
             
             # Remove expired objects (bullets, debris with TTL)
             if hasattr(obj, 'ttl') and obj.ttl <= 0:
                 self.removeObject(obj)
+            else:
+                spatial_index.update(obj)
+                
+        if self.particles is not None:
+            self.particles.update()
+                
+        self.flushRemovals()
                 
     def createAsteroidBelts(self, num_belts=8, rocks_per_belt=15):
         """Create asteroid belts randomly distributed throughout the universe"""
         # Clear existing rocks
-        for rock in self.rocks[:]:
+        for rock in self.rocks:
             self.removeObject(rock)
+        self.flushRemovals()
+        
+        if self.worldgen is not None:
+            self.addRockRecords(self.worldgen.belts(self.worldgen.newRng(), num_belts,
+                                                    rocks_per_belt))
+            return
         
         center_x = self.width // 2
         center_y = self.height // 2
@@ -104,6 +309,11 @@ class Universe:
     
     def createRockBelt(self, belt_center, belt_radius, num_rocks):
         """Create a belt of rocks around a center point"""
+        if self.worldgen is not None:
+            self.addRockRecords(self.worldgen.beltRocks(self.worldgen.newRng(), [belt_center.x],
+                                                        [belt_center.y], [belt_radius],
+                                                        [num_rocks]))
+            return
         for _ in range(num_rocks):
             # Generate position within belt radius using polar coordinates
             angle = random.uniform(0, 2 * math.pi)
@@ -132,7 +342,7 @@ class Universe:
                 rock_type = Rock.smallRockType
                 
             newRock = Rock(None, position, rock_type)
-            self.addObject(newRock)
+            self.placeRock(newRock)
     
     def createRocksAroundPlayer(self, player_pos, num_rocks, min_distance=200):
         """Create rocks around the player but not too close - DEPRECATED, use createAsteroidBelts instead"""
@@ -143,6 +353,10 @@ class Universe:
     def addRocksToExistingBelts(self, additional_rocks_per_belt=5):
         """Add more rocks randomly throughout the universe (used for level progression)"""
         # Since rocks spread out, just add them randomly across the universe
+        if self.worldgen is not None:
+            self.addRockRecords(self.worldgen.scatter(self.worldgen.newRng(),
+                                                      additional_rocks_per_belt * 8))
+            return
         for _ in range(additional_rocks_per_belt * 8):  # Multiply by estimated belt count
             # Create random position avoiding center spawn
             center_x = self.width // 2
@@ -169,7 +383,7 @@ class Universe:
                 rock_type = Rock.smallRockType
                 
             newRock = Rock(None, position, rock_type)
-            self.addObject(newRock)
+            self.placeRock(newRock)
 
     def checkCollisions(self):
         """Check for collisions between objects"""
@@ -177,11 +391,9 @@ class Universe:
         
         # Check ship collisions with rocks
         if self.ship and not self.ship.inHyperSpace:
-            for rock in self.rocks:
-                if rock.collidesWith(self.ship):
-                    p = rock.checkPolygonCollision(self.ship)
-                    if p is not None:
-                        collisions.append(('ship_rock', self.ship, rock))
+            for rock in self.rocksNear(self.ship):
+                if rock.collidesWith(self.ship) and polygonsCollide(rock, self.ship):
+                    collisions.append(('ship_rock', self.ship, rock))
                         
         # Check all bullets (ship and saucer bullets) with rocks
         all_bullets = []
@@ -192,10 +404,9 @@ class Universe:
             
         for bullet in all_bullets:
             if bullet.ttl > 0:  # Only active bullets
-                for rock in self.rocks[:]:
-                    if rock.collidesWith(bullet):
-                        collisions.append(('bullet_rock', bullet, rock))
-                        break  # Each bullet can only hit one rock
+                rock = self.findBulletHit(bullet)
+                if rock is not None:
+                    collisions.append(('bullet_rock', bullet, rock))
                         
         # Check saucer bullets hitting ship
         if self.saucer and self.ship and not self.ship.inHyperSpace:
@@ -211,7 +422,7 @@ class Universe:
                     
         # Check saucer collisions with rocks
         if self.saucer:
-            for rock in self.rocks:
+            for rock in self.rocksNear(self.saucer):
                 if rock.collidesWith(self.saucer):
                     collisions.append(('saucer_rock', self.saucer, rock))
                     
@@ -225,94 +436,148 @@ class Universe:
                     
         return collisions
         
+    def rocksNear(self, sprite):
+        """Rocks whose bounding rect could overlap the sprite's.
+        
+        Each outline fits in a square of its bounding radius around its
+        position, so two rects only overlap when the positions are within
+        the sum of the radii on both axes, i.e. sqrt(2) times it overall.
+        """
+        # A sprite without an outline falls back to a 10x10 rect
+        radius = max(sprite.getBoundingRadius(), 5)
+        reach = (radius + self.rockReach) * math.sqrt(2) + 2
+        nearby = self.getObjectsInRadius(sprite.position.x, sprite.position.y, reach)
+        return [obj for obj in nearby if isinstance(obj, Rock)]
+        
+    def findBulletHit(self, bullet):
+        """Return the first rock the bullet's path crossed this tick, or None.
+        
+        The bullet is swept from where it started the tick to where it is
+        now, so a 13 px/frame bullet cannot skip over a small rock. Only
+        rocks near that segment are fetched from the spatial index; their
+        cached bounding circles and boxes do the rest.
+        """
+        x1 = bullet.previousX
+        y1 = bullet.previousY
+        x2 = bullet.position.x
+        y2 = bullet.position.y
+        # The bullet's own 2x2 rect overlaps rocks up to two pixels away
+        pad = 2
+        half_length = math.hypot(x2 - x1, y2 - y1) * 0.5
+        # Through getObjectsInRadius, so frozen rocks are caught up first
+        nearby = self.getObjectsInRadius((x1 + x2) * 0.5, (y1 + y2) * 0.5,
+                                         half_length + self.rockReach + pad)
+        
+        hit = None
+        hit_t = None
+        for rock in nearby:
+            if not isinstance(rock, Rock):
+                continue
+            reach = rock.getBoundingRadius() + pad
+            if segmentDistanceSquared(x1, y1, x2, y2, rock.position.x, rock.position.y) > reach * reach:
+                continue
+            bounds = rock.getBounds()
+            if bounds is None:
+                continue
+            min_x, min_y, max_x, max_y = bounds
+            # Same overlap as the rock's rect against the bullet's 2x2 rect
+            t = segmentEntersBox(x1, y1, x2, y2, min_x - 2, min_y - 2,
+                                 max_x + 1, max_y + 1)
+            # Each bullet can only hit one rock: the first one along its path
+            if t is not None and (hit_t is None or t < hit_t):
+                hit = rock
+                hit_t = t
+        return hit
+
     def handleRockRockCollisions(self):
         """Handle collisions between rocks with realistic physics"""
-        import math
+        if self.rockStore is not None:
+            # Same response computed in bulk on the store's arrays
+            # Only rocks moved this tick; the LOD scheduler's laggards wait their turn
+            first, second = findRockPairs(self.rockStore, ROCK_BROADPHASE_MARGIN,
+                                          self.rockStore.currentSlots())
+            moved = resolveRockCollisions(self.rockStore, first, second)
+            rocks = self.rockStore.rocks
+            for slot in moved.tolist():
+                self.spatialIndex.update(rocks[slot])
+            return
+        
+        rocks = self.rocks
+        if self.lod is not None:
+            rocks = [rock for rock in rocks if rock.lodTick == self.lod.tick]
         
-        # Check all pairs of rocks for collisions
-        for i in range(len(self.rocks)):
-            for j in range(i + 1, len(self.rocks)):
-                rock1 = self.rocks[i]
-                rock2 = self.rocks[j]
+        # Only pairs the broadphase found (nearly) overlapping are checked,
+        # in the same order the all-pairs loop used to visit them
+        for i, j in sweepAndPrune(rocks, ROCK_BROADPHASE_MARGIN):
+            rock1 = rocks[i]
+            rock2 = rocks[j]
+            
+            # Calculate distance between rock centers
+            dx = rock2.position.x - rock1.position.x
+            dy = rock2.position.y - rock1.position.y
+            distance = math.sqrt(dx * dx + dy * dy)
+            
+            # Collision radius is precomputed from the rock type
+            min_distance = rock1.radius + rock2.radius
+            
+            # Check if rocks are colliding
+            if distance < min_distance and distance > 0.1:  # Avoid division by zero
+                # Calculate collision normal
+                nx = dx / distance
+                ny = dy / distance
                 
-                # Calculate distance between rock centers
-                dx = rock2.position.x - rock1.position.x
-                dy = rock2.position.y - rock1.position.y
-                distance = math.sqrt(dx * dx + dy * dy)
+                # Calculate overlap
+                overlap = min_distance - distance
                 
-                # Estimate collision radius based on rock type
-                radius1 = self.getRockRadius(rock1)
-                radius2 = self.getRockRadius(rock2)
-                min_distance = radius1 + radius2
+                # Separate rocks to prevent overlap
+                separate_distance = overlap * 0.5
+                rock1.position.x -= nx * separate_distance
+                rock1.position.y -= ny * separate_distance
+                rock2.position.x += nx * separate_distance
+                rock2.position.y += ny * separate_distance
+                self.spatialIndex.update(rock1)
+                self.spatialIndex.update(rock2)
                 
-                # Check if rocks are colliding
-                if distance < min_distance and distance > 0.1:  # Avoid division by zero
-                    # Calculate collision normal
-                    nx = dx / distance
-                    ny = dy / distance
-                    
-                    # Calculate overlap
-                    overlap = min_distance - distance
-                    
-                    # Separate rocks to prevent overlap
-                    separate_distance = overlap * 0.5
-                    rock1.position.x -= nx * separate_distance
-                    rock1.position.y -= ny * separate_distance
-                    rock2.position.x += nx * separate_distance
-                    rock2.position.y += ny * separate_distance
-                    
-                    # Calculate relative velocity
-                    dvx = rock2.heading.x - rock1.heading.x
-                    dvy = rock2.heading.y - rock1.heading.y
-                    
-                    # Calculate relative velocity in collision normal direction
-                    dvn = dvx * nx + dvy * ny
-                    
-                    # Do not resolve if velocities are separating
-                    if dvn > 0:
-                        continue
-                    
-                    # Calculate collision response (elastic collision)
-                    # Using conservation of momentum for different mass rocks
-                    mass1 = self.getRockMass(rock1)
-                    mass2 = self.getRockMass(rock2)
-                    
-                    # Calculate impulse scalar
-                    impulse = 2 * dvn / (mass1 + mass2)
-                    
-                    # Apply restitution (bounciness) - make it slightly bouncy
-                    restitution = 0.8
-                    impulse *= restitution
-                    
-                    # Apply impulse to velocities
-                    rock1.heading.x += impulse * mass2 * nx
-                    rock1.heading.y += impulse * mass2 * ny
-                    rock2.heading.x -= impulse * mass1 * nx
-                    rock2.heading.y -= impulse * mass1 * ny
-                    
-                    # Add some spin when rocks collide
-                    rock1.angle += random.uniform(-5, 5)
-                    rock2.angle += random.uniform(-5, 5)
+                # Calculate relative velocity
+                dvx = rock2.heading.x - rock1.heading.x
+                dvy = rock2.heading.y - rock1.heading.y
+                
+                # Calculate relative velocity in collision normal direction
+                dvn = dvx * nx + dvy * ny
+                
+                # Do not resolve if velocities are separating
+                if dvn > 0:
+                    continue
+                
+                # Calculate collision response (elastic collision)
+                # Using conservation of momentum for different mass rocks
+                mass1 = rock1.mass
+                mass2 = rock2.mass
+                
+                # Calculate impulse scalar
+                impulse = 2 * dvn / (mass1 + mass2)
+                
+                # Apply restitution (bounciness) - make it slightly bouncy
+                restitution = 0.8
+                impulse *= restitution
+                
+                # Apply impulse to velocities
+                rock1.heading.x += impulse * mass2 * nx
+                rock1.heading.y += impulse * mass2 * ny
+                rock2.heading.x -= impulse * mass1 * nx
+                rock2.heading.y -= impulse * mass1 * ny
+                
+                # Add some spin when rocks collide
+                rock1.angle += random.uniform(-5, 5)
+                rock2.angle += random.uniform(-5, 5)
     
     def getRockRadius(self, rock):
         """Get approximate radius of a rock based on its type"""
-        from ..entities.rock import Rock
-        if rock.rockType == Rock.largeRockType:
-            return 35
-        elif rock.rockType == Rock.mediumRockType:
-            return 22
-        else:  # small rock
-            return 12
+        return rock.radius
     
     def getRockMass(self, rock):
         """Get mass of a rock based on its type"""
-        from ..entities.rock import Rock
-        if rock.rockType == Rock.largeRockType:
-            return 3.0
-        elif rock.rockType == Rock.mediumRockType:
-            return 2.0
-        else:  # small rock
-            return 1.0
+        return rock.mass
         
     def getShipPosition(self):
         """Get the current ship position"""
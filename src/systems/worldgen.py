@@ -0,0 +1,202 @@
+"""
+World Generation
+Samples whole asteroid belts at once as packed rock records, shaped by the biome map
+"""
+
+import math
+import random
+
+from ..entities.rock import Rock
+from ..config.config import BIOMES, WORLDGEN_DEPTH_RICHNESS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, Universe then places rocks one by one
+    np = None
+
+if np is not None:
+    from .chunks import ROCK_RECORD_DTYPE
+
+_MASK = 0xFFFFFFFF
+
+
+def worldgenAvailable():
+    """True when NumPy is installed and a WorldGenerator can be built"""
+    return np is not None
+
+
+class WorldGenerator:
+    """Generates rocks for a universe in vectorized batches.
+
+    Every method returns a ``ROCK_RECORD_DTYPE`` array (the dormant chunk
+    layout) rather than Rock objects, so a belt, a level's worth of extra
+    rocks or a whole chunk is sampled with a handful of array operations
+    and only becomes live rocks when Universe.addRockRecords places it.
+
+    Materials are drawn per rock from the blended ``materials`` weights of
+    the biomes at its position, then tilted by distance from the spawn
+    point: coal towards the centre and gold towards the edge of the
+    universe, ``depthRichness`` setting how strongly. Without a biome map
+    the base weights are Rock.material_types' rarities.
+    """
+
+    def __init__(self, width, height, biomeMap=None, depthRichness=WORLDGEN_DEPTH_RICHNESS):
+        if np is None:
+            raise ImportError("WorldGenerator requires NumPy")
+        self.width = width
+        self.height = height
+        self.biomeMap = biomeMap
+        self.depthRichness = depthRichness
+        self.spawnX = width / 2
+        self.spawnY = height / 2
+        self.biomeMaterials = np.array([biome["materials"] for biome in BIOMES], dtype=np.float64)
+        self.biomeBelts = np.array([biome["belts"] for biome in BIOMES], dtype=np.float64)
+        self.baseMaterials = np.array([Rock.material_types[material]["rarity"]
+                                       for material in (Rock.COAL, Rock.IRON, Rock.GOLD)])
+        self.velocities = np.array(Rock.velocities, dtype=np.float64)
+        # Belt chance of every chunk, per (chunk size, base chance)
+        self.chunkChances = {}
+
+    def newRng(self):
+        """A NumPy generator seeded from the random module, so seeded runs repeat"""
+        return np.random.default_rng(random.getrandbits(64))
+
+    def materialWeights(self, xs, ys):
+        """(coal, iron, gold) probabilities at world positions, shape (n, 3)"""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if self.biomeMap is not None:
+            weights = self.biomeMap.weights(xs, ys) @ self.biomeMaterials
+        else:
+            weights = np.tile(self.baseMaterials, (len(xs), 1))
+        depth = np.hypot(xs - self.spawnX, ys - self.spawnY) / math.hypot(self.spawnX, self.spawnY)
+        depth = np.clip(depth, 0.0, 1.0)
+        weights[:, Rock.GOLD] *= 1.0 + self.depthRichness * depth
+        weights[:, Rock.COAL] *= 1.0 + self.depthRichness * (1.0 - depth)
+        return weights / weights.sum(axis=1, keepdims=True)
+
+    def pickMaterials(self, rng, xs, ys):
+        """Material index per position, drawn from materialWeights"""
+        cumulative = np.cumsum(self.materialWeights(xs, ys), axis=1)
+        draws = rng.random(len(cumulative))[:, None]
+        return (draws >= cumulative[:, :-1]).sum(axis=1)
+
+    def samplePositions(self, rng, count, clearance):
+        """count positions in the middle 80% of the universe, clearance away from spawn"""
+        xs = np.empty(0)
+        ys = np.empty(0)
+        while len(xs) < count:
+            # Oversample and keep the ones outside the spawn area
+            wanted = (count - len(xs)) * 2 + 8
+            x = rng.uniform(self.width * 0.1, self.width * 0.9, wanted)
+            y = rng.uniform(self.height * 0.1, self.height * 0.9, wanted)
+            keep = np.hypot(x - self.spawnX, y - self.spawnY) > clearance
+            xs = np.concatenate((xs, x[keep]))
+            ys = np.concatenate((ys, y[keep]))
+        return xs[:count], ys[:count]
+
+    def records(self, rng, xs, ys, typeOdds):
+        """Rocks at the given positions with random type, heading, shape and material.
+
+        typeOdds are the cumulative chances of a large and of a large or
+        medium rock, as in Universe.createRockBelt.
+        """
+        count = len(xs)
+        records = np.zeros(count, dtype=ROCK_RECORD_DTYPE)
+        records['x'] = xs
+        records['y'] = ys
+        draws = rng.random(count)
+        rock_types = (draws >= typeOdds[0]).astype(np.uint8) + (draws >= typeOdds[1])
+        records['rockType'] = rock_types
+
+        # Same heading range as Rock.__init__, never exactly along an axis
+        velocity = self.velocities[rock_types]
+        headings = rng.uniform(-1.0, 1.0, (2, count)) * velocity
+        headings[headings == 0] = 0.1
+        records['headingX'] = headings[0]
+        records['headingY'] = headings[1]
+        records['material'] = self.pickMaterials(rng, xs, ys)
+        records['shape'] = rng.integers(1, 5, count)
+        return records
+
+    def beltRocks(self, rng, centersX, centersY, radii, counts, bounds=None, typeOdds=(0.6, 0.85)):
+        """Rocks of several belts at once, each ring-shaped around its centre.
+
+        bounds is (left, top, right, bottom), the universe by default; rocks
+        are kept 50 pixels inside it.
+        """
+        centersX = np.asarray(centersX, dtype=np.float64)
+        centersY = np.asarray(centersY, dtype=np.float64)
+        radii = np.asarray(radii, dtype=np.float64)
+        belt = np.repeat(np.arange(len(radii)), counts)
+        radius = radii[belt]
+        count = len(belt)
+
+        angle = rng.uniform(0.0, 2 * math.pi, count)
+        distance = radius * (rng.uniform(0.3, 1.0, count) + rng.uniform(-0.2, 0.2, count))
+        left, top, right, bottom = bounds or (0, 0, self.width, self.height)
+        xs = np.clip(centersX[belt] + distance * np.cos(angle), left + 50, right - 50)
+        ys = np.clip(centersY[belt] + distance * np.sin(angle), top + 50, bottom - 50)
+        return self.records(rng, xs, ys, typeOdds)
+
+    def belts(self, rng, numBelts, rocksPerBelt, clearance=1000):
+        """numBelts belts spread over the universe, away from the spawn area"""
+        centers_x, centers_y = self.samplePositions(rng, numBelts, clearance)
+        radii = rng.integers(300, 800, numBelts)
+        return self.beltRocks(rng, centers_x, centers_y, radii, np.full(numBelts, rocksPerBelt))
+
+    def scatter(self, rng, count, clearance=800):
+        """count loose rocks anywhere outside the spawn area, more of them small"""
+        xs, ys = self.samplePositions(rng, count, clearance)
+        return self.records(rng, xs, ys, (0.5, 0.8))
+
+    def chunkBounds(self, key, chunkSize):
+        """(left, top, right, bottom) of a chunk, clipped to the universe"""
+        left = key[0] * chunkSize
+        top = key[1] * chunkSize
+        return (left, top, min(left + chunkSize, self.width), min(top + chunkSize, self.height))
+
+    def beltChances(self, chunkSize, chance):
+        """Chance of each chunk holding a (further) belt, indexed [key x, key y].
+
+        The base chance is scaled by the biomes' ``belts`` at the chunk's
+        centre. Evaluated for the whole universe at once, as the noise is
+        far cheaper per point in bulk than chunk by chunk.
+        """
+        chances = self.chunkChances.get((chunkSize, chance))
+        if chances is None:
+            columns = math.ceil(self.width / chunkSize)
+            rows = math.ceil(self.height / chunkSize)
+            centers_x = (np.minimum((np.arange(columns) + 1) * chunkSize, self.width) +
+                         np.arange(columns) * chunkSize) / 2
+            centers_y = (np.minimum((np.arange(rows) + 1) * chunkSize, self.height) +
+                         np.arange(rows) * chunkSize) / 2
+            chances = np.full((columns, rows), float(chance))
+            if self.biomeMap is not None:
+                xs, ys = np.meshgrid(centers_x, centers_y, indexing='ij')
+                chances *= self.biomeMap.weights(xs, ys) @ self.biomeBelts
+            chances = self.chunkChances[(chunkSize, chance)] = np.minimum(chances, 0.9)
+        return chances
+
+    def chunkRecords(self, seed, key, chunkSize, beltChance, rocksPerBelt, clearance):
+        """The belts of one chunk inside the universe, the same for the same seed and key.
+
+        Belts are kept inside the chunk so every rock starts in its own
+        chunk; belts centred within clearance of the spawn point are dropped.
+        """
+        rng = np.random.default_rng((seed & _MASK, key[0] & _MASK, key[1] & _MASK))
+        bounds = self.chunkBounds(key, chunkSize)
+        left, top, right, bottom = bounds
+        chance = self.beltChances(chunkSize, beltChance)[key]
+        num_belts = int(rng.geometric(1.0 - chance)) - 1
+        if num_belts == 0:
+            return np.zeros(0, dtype=ROCK_RECORD_DTYPE)
+
+        radii = rng.integers(300, 800, num_belts)
+        margin_x = np.minimum(radii * 1.2, (right - left) / 2)
+        margin_y = np.minimum(radii * 1.2, (bottom - top) / 2)
+        centers_x = rng.uniform(left + margin_x, right - margin_x)
+        centers_y = rng.uniform(top + margin_y, bottom - margin_y)
+        keep = np.hypot(centers_x - self.spawnX, centers_y - self.spawnY) >= clearance
+        return self.beltRocks(rng, centers_x[keep], centers_y[keep], radii[keep],
+                              np.full(int(keep.sum()), rocksPerBelt), bounds)
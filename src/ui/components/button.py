@@ -1,3 +1,6 @@
+from ..text_cache import textCache
+
+
 class Button:
     """Simple clickable button component for pygame UIs"""
     def __init__(self, rect, text, font, callback,
@@ -40,8 +43,8 @@ class Button:
         pygame.draw.rect(surface, colour, self.rect)
         pygame.draw.rect(surface, (0, 255, 255), self.rect, 2)  # border
 
-        # Render text centred
-        text_surface = self.font.render(self.text, True, self.text_color)
+        # Render text centred; labels rarely change, so reuse the surface
+        text_surface = textCache.renderWith(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
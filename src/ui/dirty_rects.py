@@ -0,0 +1,97 @@
+"""
+Dirty Rectangles
+Restores and updates only the screen regions that changed since the last frame
+"""
+
+import pygame
+
+
+class DirtyRectRenderer:
+    """Tracks what was drawn on the screen so a frame only touches those regions.
+
+    Everything drawn on top of the background is reported with ``markDirty``.
+    The next ``beginFrame`` paints the background back over just those rects,
+    and ``present`` pushes the old and new rects to the display with
+    ``pygame.display.update``. When the camera scrolls or the background
+    changes, every pixel is stale anyway, so the frame is redrawn in full and
+    flipped. A frame also falls back to a flip when its rects would cover more
+    than ``maxCoverage`` of the screen.
+    """
+
+    def __init__(self, screen, maxCoverage=0.5, maxRects=200):
+        self.screen = screen
+        self.screenRect = screen.get_rect()
+        self.maxCoverage = maxCoverage
+        self.maxRects = maxRects
+        self.pending = []   # drawn since the last restore
+        self.updates = []   # restored or drawn since the last present
+        self.fullFrame = True
+        self.lastView = None
+
+        # Per-frame report
+        self.pixelsUpdated = 0
+        self.rectsUpdated = 0
+        self.fullFrames = 0
+        self.partialFrames = 0
+
+    def invalidate(self):
+        """Redraw the whole screen on the next frame"""
+        self.fullFrame = True
+
+    def beginFrame(self, background, view=(0, 0), backgroundChanged=False):
+        """Clear last frame's drawing; returns True if the frame is redrawn in full"""
+        view = (int(view[0]), int(view[1]))
+        if view != self.lastView or backgroundChanged:
+            self.fullFrame = True
+        self.lastView = view
+
+        if self.fullFrame:
+            background.draw(self.screen)
+        else:
+            for rect in self.pending:
+                background.drawRegion(self.screen, rect)
+            self.updates.extend(self.pending)
+        self.pending = []
+        return self.fullFrame
+
+    def markDirty(self, rect):
+        """Record a region drawn over the background this frame"""
+        if not rect:
+            return
+        rect = self.screenRect.clip(rect)
+        if rect.width and rect.height:
+            self.pending.append(rect)
+            self.updates.append(rect)
+
+    def present(self):
+        """Push this frame's changes to the display"""
+        screen_pixels = self.screenRect.width * self.screenRect.height
+        pixels = sum(rect.width * rect.height for rect in self.updates)
+        if (self.fullFrame or len(self.updates) > self.maxRects
+                or pixels > screen_pixels * self.maxCoverage):
+            pygame.display.flip()
+            self.pixelsUpdated = screen_pixels
+            self.rectsUpdated = 1
+            self.fullFrames += 1
+        else:
+            if self.updates:
+                pygame.display.update(self.updates)
+            self.pixelsUpdated = pixels
+            self.rectsUpdated = len(self.updates)
+            self.partialFrames += 1
+        self.updates = []
+        self.fullFrame = False
+        # Frames presented without a beginFrame (the pause screen) keep
+        # adding to pending; past maxRects a full redraw is cheaper anyway
+        if len(self.pending) > self.maxRects:
+            self.pending = []
+            self.fullFrame = True
+
+    def stats(self):
+        """Snapshot of the last frame and the running frame counts"""
+        return {
+            "pixels": self.pixelsUpdated,
+            "rects": self.rectsUpdated,
+            "fullFrames": self.fullFrames,
+            "partialFrames": self.partialFrames,
+        }
@@ -0,0 +1,92 @@
+"""
+HUD Layers
+Retained HUD widgets that keep their own surface and repaint it only when their value changes
+"""
+
+import pygame
+
+# Value no bound value ever equals, so new or invalidated widgets repaint
+_unset = object()
+
+
+class HudWidget:
+    """One HUD element drawn from a cached surface.
+
+    ``bind()`` returns the value the widget shows and must be comparable
+    (numbers, strings, tuples). ``paint(surface, value)`` draws that value
+    into the widget surface in local coordinates, after it has been cleared.
+    Each frame the widget only blits its surface unless the value changed.
+    """
+
+    def __init__(self, layers, name, rect, bind, paint, transparent=True):
+        self.layers = layers
+        self.name = name
+        self.rect = pygame.Rect(rect)
+        self.bind = bind
+        self.paint = paint
+        self.transparent = transparent
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA if transparent else 0)
+        self.value = _unset
+        self.renders = 0
+
+    def invalidate(self):
+        """Repaint on the next draw whatever the value"""
+        self.value = _unset
+
+    def draw(self, screen):
+        """Blit the widget, repainting it first if its value changed; returns the rect drawn"""
+        value = self.bind()
+        if value != self.value:
+            if self.transparent:
+                self.surface.fill((0, 0, 0, 0))
+            self.paint(self.surface, value)
+            self.value = value
+            self.renders += 1
+            self.layers.frameRenders += 1
+        return screen.blit(self.surface, self.rect)
+
+
+class HudLayers:
+    """Registry of the game's HUD widgets and shared overlay surfaces.
+
+    Counts how many widgets repainted in the current frame; ``endFrame``
+    rolls that count into ``lastFrameRenders`` for the FPS line.
+    """
+
+    def __init__(self):
+        self.widgets = {}
+        self.overlays = {}
+        self.frameRenders = 0
+        self.lastFrameRenders = 0
+
+    def widget(self, name, rect, bind, paint, transparent=True):
+        """Create and register a widget"""
+        widget = HudWidget(self, name, rect, bind, paint, transparent)
+        self.widgets[name] = widget
+        return widget
+
+    def overlay(self, size, color=(0, 0, 0), alpha=180):
+        """Translucent fill of the given size, built once and shared"""
+        key = (tuple(size), color, alpha)
+        surface = self.overlays.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.set_alpha(alpha)
+            surface.fill(color)
+            self.overlays[key] = surface
+        return surface
+
+    def invalidate(self):
+        for widget in self.widgets.values():
+            widget.invalidate()
+
+    def endFrame(self):
+        self.lastFrameRenders = self.frameRenders
+        self.frameRenders = 0
+
+    def stats(self):
+        """Repaints per widget since start, and in the last frame overall"""
+        return {
+            "widgets": {name: widget.renders for name, widget in self.widgets.items()},
+            "lastFrameRenders": self.lastFrameRenders,
+        }
@@ -0,0 +1,118 @@
+"""
+Profiler Overlay
+Rolling per-stage frame times with sparklines and entity counts, drawn over the game
+"""
+
+from collections import Counter
+
+import pygame
+
+from .text_cache import textCache
+
+# (profiler section, label) in the order playGame runs them
+STAGES = (
+    ("input", "input"),
+    ("camera", "camera"),
+    ("chunks", "chunks"),
+    ("background", "background"),
+    ("universe", "universe"),
+    ("visibility", "visibility"),
+    ("draw", "draw"),
+    ("collisions", "collisions"),
+    ("crystals", "crystal bin"),
+    ("logic", "game logic"),
+    ("hud", "hud"),
+    ("minimap", "minimap"),
+    ("flip", "flip"),
+)
+
+
+class ProfilerOverlay:
+    """Table of min/avg/max milliseconds per stage with a sparkline of recent frames.
+
+    Reads the history the game's Profiler keeps while it is enabled, so it
+    costs nothing while hidden. Entity counts walk every object, so they are
+    refreshed only every ``countInterval`` frames.
+    """
+
+    def __init__(self, game, x=10, y=170, sparklineWidth=120, countInterval=15):
+        self.game = game
+        self.x = x
+        self.y = y
+        self.sparklineWidth = sparklineWidth
+        self.countInterval = countInterval
+        self.lineHeight = textCache.font("small").get_linesize()
+        self.labelWidth = 110
+        self.statsWidth = 170
+        self.width = self.labelWidth + self.statsWidth + sparklineWidth + 20
+        self.height = self.lineHeight * (len(STAGES) + 2) + 10
+        self.panel = pygame.Surface((self.width, self.height))
+        self.panel.set_alpha(180)
+        self.panel.fill((10, 10, 30))
+        self.countText = None
+        self.framesUntilCount = 0
+
+    def countEntities(self):
+        """Live objects per class, plus particles, crystals in the bin and unloaded rocks"""
+        universe = self.game.universe
+        counts = Counter(type(obj).__name__ for obj in universe.objects)
+        if universe.particles is not None:
+            counts["Particle"] = len(universe.particles)
+        counts["BinCrystal"] = len(self.game.crystalSystem.bin_crystals)
+        if universe.chunks is not None:
+            counts["DormantRock"] = universe.chunks.dormantRockCount()
+        if universe.lod is not None:
+            # Rocks per LOD band as of the latest tick
+            for name, count in zip(universe.lod.bandNames(), universe.lod.counts):
+                counts[name] = count
+        return counts
+
+    def draw(self, surface):
+        """Draw the overlay and return the rect it covers"""
+        rect = surface.blit(self.panel, (self.x, self.y))
+        sections = self.game.profiler.sections
+        text_x = self.x + 10
+        stats_x = text_x + self.labelWidth
+        spark_x = stats_x + self.statsWidth
+        row_y = self.y + 5
+        frame_total = 0.0
+
+        for name, label in STAGES:
+            section = sections.get(name)
+            if section is None or not section.history:
+                low = mean = high = 0.0
+                history = ()
+            else:
+                low, mean, high = section.rolling()
+                history = section.history
+                frame_total += mean
+            surface.blit(textCache.render(label, (200, 200, 200)), (text_x, row_y))
+            textCache.blitGlyphs(surface, f"{low * 1000:5.2f} {mean * 1000:5.2f} {high * 1000:5.2f}",
+                                 (255, 255, 255), x=stats_x, y=row_y)
+            self.drawSparkline(surface, history, high, spark_x, row_y)
+            row_y += self.lineHeight
+
+        textCache.blitGlyphs(surface, f"total {frame_total * 1000:.2f} ms avg  (min avg max)",
+                             (255, 255, 0), x=text_x, y=row_y)
+        row_y += self.lineHeight
+
+        self.framesUntilCount -= 1
+        if self.countText is None or self.framesUntilCount <= 0:
+            counts = self.countEntities()
+            self.countText = "  ".join(f"{name} {count}" for name, count in counts.most_common())
+            self.framesUntilCount = self.countInterval
+        # The count line can run past the panel
+        return rect.union(textCache.blitGlyphs(surface, self.countText, (150, 200, 255),
+                                               x=text_x, y=row_y))
+
+    def drawSparkline(self, surface, history, high, x, y):
+        """Polyline of a section's recent frame times, scaled to its own maximum"""
+        count = len(history)
+        if count < 2 or high <= 0:
+            return
+        height = self.lineHeight - 4
+        step = self.sparklineWidth / (count - 1)
+        bottom = y + height
+        points = [(x + i * step, bottom - value / high * height)
+                  for i, value in enumerate(history)]
+        pygame.draw.lines(surface, (0, 255, 0), False, points)
@@ -1,5 +1,5 @@
 import pygame
-from ..config.config import FONT_PATH, FONT_SIZES
+from .text_cache import textCache
 from .components.button import Button
 
 class RescueUI:
@@ -17,7 +17,7 @@ class RescueUI:
         screen_w = self.game.stage.width
         screen_h = self.game.stage.height
         rect = pygame.Rect(screen_w//2 - 120, screen_h//2 + 20, 240, 40)
-        font = pygame.font.Font(FONT_PATH, FONT_SIZES["normal"])
+        font = textCache.font("normal")
         cost = self.rescue_system.rescueCost
         self.button = Button(rect, f"Rescue me - ${cost}", font, self.rescue_system.handleRescueRequest)
         self.button_created = True
@@ -27,10 +27,7 @@ class RescueUI:
         if not self.button_created:
             self._create_button()
 
-        font_title = pygame.font.Font(FONT_PATH, FONT_SIZES["subtitle"])
-        font_text = pygame.font.Font(FONT_PATH, FONT_SIZES["normal"])
-
-        title_text = font_title.render("OUT OF FUEL!", True, (255, 0, 0))
+        title_text = textCache.render("OUT OF FUEL!", (255, 0, 0), "subtitle")
         title_rect = title_text.get_rect(centerx=self.game.stage.width//2, centery=self.game.stage.height//2 - 60)
         surface.blit(title_text, title_rect)
 
@@ -39,7 +36,8 @@ class RescueUI:
 
         # Show money status if insufficient
         if self.game.money < self.rescue_system.rescueCost:
-            money_text = font_text.render(f"Insufficient funds! You have ${self.game.money}", True, (255, 0, 0))
+            money_text = textCache.render(f"Insufficient funds! You have ${self.game.money}",
+                                          (255, 0, 0), "normal")
             money_rect = money_text.get_rect(centerx=self.game.stage.width//2, centery=self.game.stage.height//2 + 70)
             surface.blit(money_text, money_rect)
 
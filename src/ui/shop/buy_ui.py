@@ -1,5 +1,5 @@
 import pygame
-from ...config.config import FONT_PATH, FONT_SIZES
+from ..text_cache import textCache
 from ..components.button import Button
 
 class ShopBuyUI:
@@ -14,8 +14,8 @@ class ShopBuyUI:
     # ------------------------------------------------------------------
     def _create_buttons(self, shop_x, shop_y):
         """Create buttons. Must be called once window dims known."""
-        option_font = pygame.font.Font(FONT_PATH, FONT_SIZES["normal"])
-        instruction_font = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
+        option_font = textCache.font("normal")
+        instruction_font = textCache.font("small")
 
         # Button for refilling fuel
         refill_rect = pygame.Rect(shop_x + 40, shop_y + 90, 320, 35)
@@ -46,13 +46,12 @@ class ShopBuyUI:
             btn.draw(surface)
 
         # Draw status lines
-        instruction_font = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
         if self.game.ship:
             fuel_pct = int(self.game.ship.getFuelPercentage())
-            fuel_status = instruction_font.render(f"Current Fuel: {fuel_pct}%", True, (255, 255, 0))
-            surface.blit(fuel_status, (shop_x + 40, shop_y + 180))
-        money_status = instruction_font.render(f"Your Money: ${self.game.money}", True, (0, 255, 0))
-        surface.blit(money_status, (shop_x + 40, shop_y + 200))
+            textCache.blitGlyphs(surface, f"Current Fuel: {fuel_pct}%", (255, 255, 0), "small",
+                                 x=shop_x + 40, y=shop_y + 180)
+        textCache.blitGlyphs(surface, f"Your Money: ${self.game.money}", (0, 255, 0), "small",
+                             x=shop_x + 40, y=shop_y + 200)
 
     # ------------------------------------------------------------------
     def handle_event(self, event):
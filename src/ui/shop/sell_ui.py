@@ -1,5 +1,5 @@
 import pygame
-from ...config.config import FONT_PATH, FONT_SIZES
+from ..text_cache import textCache
 from ..components.button import Button
 from ...entities.crystal import Crystal
 
@@ -14,8 +14,8 @@ class ShopSellUI:
 
     # ------------------------------------------------------------------
     def _create_buttons(self, shop_x, shop_y):
-        option_font = pygame.font.Font(FONT_PATH, FONT_SIZES["normal"])
-        small_font = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
+        option_font = textCache.font("normal")
+        small_font = textCache.font("small")
 
         y_offset = 90
         height = 30
@@ -67,9 +67,8 @@ class ShopSellUI:
             btn.draw(surface)
 
         # Money status
-        small_font = pygame.font.Font(FONT_PATH, FONT_SIZES["small"])
-        money_status = small_font.render(f"Your Money: ${self.game.money}", True, (0, 255, 0))
-        surface.blit(money_status, (shop_x + 40, shop_y + shop_height - 60))
+        textCache.blitGlyphs(surface, f"Your Money: ${self.game.money}", (0, 255, 0), "small",
+                             x=shop_x + 40, y=shop_y + shop_height - 60)
 
     # ------------------------------------------------------------------
     def handle_event(self, event):
@@ -0,0 +1,92 @@
+"""
+Sprite Atlas
+Pre-rendered, rotated sprite images blitted instead of drawing outlines
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from ..util.vectorsprites import shapeCache
+
+
+class SpriteAtlas:
+    """Lazily renders each shape/colour at quantized angles into surfaces.
+
+    Images are keyed by pointlist, colour and angle rounded to ``angleStep``
+    degrees, so rocks sharing a shape prototype share images too. The
+    outline is drawn with aalines once per key. The images are kept in LRU
+    order and the least recently used ones are dropped once the pixel data
+    exceeds ``maxBytes``.
+    """
+
+    def __init__(self, angleStep=3, maxBytes=32 * 1024 * 1024):
+        self.angleStep = angleStep
+        self.steps = int(round(360 / angleStep))
+        self.maxBytes = maxBytes
+        self.bytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, pointlist, color, angle):
+        """Return (surface, offset_x, offset_y) for a sprite.
+
+        Blit the surface at the sprite's screen position plus the offset.
+        """
+        step = int(round(angle / self.angleStep)) % self.steps
+        key = (id(pointlist), color, step)
+        entry = self.entries.get(key)
+        # The entry holds on to its pointlist, so the id cannot be reused
+        if entry is not None and entry[0] is pointlist:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        image = self.render(shapeCache.rotated(pointlist, step * self.angleStep), color)
+        self.entries[key] = (pointlist, image)
+        self.bytes += self.imageBytes(image[0])
+        while self.bytes > self.maxBytes and len(self.entries) > 1:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= self.imageBytes(evicted[0])
+            self.evictions += 1
+        return image
+
+    def render(self, points, color):
+        """Draw a rotated outline into a new transparent surface"""
+        min_x = min(x for x, _ in points) - 1
+        min_y = min(y for _, y in points) - 1
+        width = max(x for x, _ in points) - min_x + 2
+        height = max(y for _, y in points) - min_y + 2
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.aalines(surface, color, True,
+                            [(x - min_x, y - min_y) for x, y in points])
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface, min_x, min_y
+
+    @staticmethod
+    def imageBytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def hitRate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Snapshot of the atlas counters"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hitRate(),
+            "evictions": self.evictions,
+            "images": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
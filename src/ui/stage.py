@@ -3,6 +3,12 @@ import sys
 import os
 from pygame.locals import *
 from ..util.vector2d import Vector2d
+from ..config.config import (SPRITE_ATLAS_ENABLED, SPRITE_ATLAS_ANGLE_STEP,
+                             SPRITE_ATLAS_MAX_BYTES, DIRTY_RECTS_ENABLED,
+                             DIRTY_RECTS_MAX_COVERAGE)
+from ..util.vectorsprites import VectorSprite
+from .sprite_atlas import SpriteAtlas
+from .dirty_rects import DirtyRectRenderer
 
 
 class Stage:
@@ -26,35 +32,112 @@ class Stage:
         self.height = dimensions[1]
         self.showBoundingBoxes = False
         self.camera = None
+        # How far rendering is between the last two simulation ticks
+        self.alpha = 1.0
+        # Screen-space point lists reused by drawSprites, keyed by length
+        self.pointBuffers = {}
+        # Pre-rendered rotations for sprites with atlasSprite set
+        self.atlas = None
+        if SPRITE_ATLAS_ENABLED:
+            self.atlas = SpriteAtlas(SPRITE_ATLAS_ANGLE_STEP, SPRITE_ATLAS_MAX_BYTES)
+        # Partial display updates; None means every frame is redrawn and flipped
+        self.renderer = None
+        if DIRTY_RECTS_ENABLED:
+            self.renderer = DirtyRectRenderer(self.screen, DIRTY_RECTS_MAX_COVERAGE)
 
     def setCamera(self, camera):
         """Set the camera for this stage"""
         self.camera = camera
 
+    def beginFrame(self, background, backgroundChanged=False, alpha=1.0):
+        """Clear the screen for a new frame by redrawing the background.
+
+        alpha is the fraction of a simulation tick rendered past the previous
+        tick; sprites and the view are drawn that far between the two ticks.
+        """
+        self.alpha = alpha
+        if self.renderer is None:
+            background.draw(self.screen)
+            return
+        self.renderer.beginFrame(background, self.getView(), backgroundChanged)
+
+    def getView(self):
+        """Top-left corner of the view in world coordinates for this frame"""
+        if self.camera:
+            return self.camera.getView(self.alpha)
+        return (0, 0)
+
+    def markDirty(self, rect):
+        """Report a region drawn this frame so it gets updated and cleared"""
+        if self.renderer is not None:
+            self.renderer.markDirty(rect)
+
+    def invalidate(self):
+        """Redraw and flip the whole screen on the next frame"""
+        if self.renderer is not None:
+            self.renderer.invalidate()
+
+    def presentFrame(self):
+        """Show the finished frame"""
+        if self.renderer is None:
+            pygame.display.flip()
+        else:
+            self.renderer.present()
+
     def drawSprites(self, visible_sprites):
-        """Draw only the visible sprites using camera coordinates"""
+        """Draw already culled sprites, offsetting their world-space outlines by the camera view"""
+        view_x, view_y = self.getView()
+        buffers = self.pointBuffers
+        atlas = self.atlas
+        # Sprites sit at their latest tick; step them back along their velocity
+        # (screen = point - offset, so the offset moves the other way)
+        lag = self.alpha - 1.0
+        
         for sprite in visible_sprites:
-            if self.camera and self.camera.isVisible(sprite.position):
-                # Convert world position to screen position
-                screen_pos = self.camera.worldToScreen(sprite.position)
-                
-                # Temporarily store original position
-                original_pos = Vector2d(sprite.position.x, sprite.position.y)
-                
-                # Set sprite to screen position for drawing
-                sprite.position = screen_pos
-                
-                # Draw the sprite and get its bounding rect
+            if lag:
+                offset_x = view_x - sprite.heading.x * lag
+                offset_y = view_y - sprite.heading.y * lag
+            else:
+                offset_x = view_x
+                offset_y = view_y
+            if atlas is not None and sprite.atlasSprite:
+                # The image only needs position and angle, so skip building the
+                # outline unless draw() is overridden (the ship hides itself in
+                # hyperspace there)
+                if type(sprite).draw is not VectorSprite.draw and not sprite.draw():
+                    continue
+                image, image_x, image_y = atlas.get(sprite.pointlist, sprite.color, sprite.angle)
+                drawn_rect = self.screen.blit(
+                    image, (int(sprite.position.x - offset_x) + image_x,
+                            int(sprite.position.y - offset_y) + image_y))
+            else:
+                # Sprites stay in world space; only the copy drawn here is moved
                 points = sprite.draw()
-                if points and len(points) > 0:
-                    drawn_rect = pygame.draw.aalines(
-                        self.screen, sprite.color, True, points)
-                    # Store the bounding rect for this frame
-                    sprite.boundingRect = drawn_rect
+                if not points:
+                    continue
                     
-                    if self.showBoundingBoxes:
-                        pygame.draw.rect(self.screen, (255, 255, 255),
-                                       drawn_rect, 1)
-                
-                # Restore original world position
-                sprite.position = original_pos
+                # Reuse one screen-space buffer per outline length across frames
+                count = len(points)
+                screen_points = buffers.get(count)
+                if screen_points is None:
+                    screen_points = [[0, 0] for _ in range(count)]
+                    buffers[count] = screen_points
+                for point, screen_point in zip(points, screen_points):
+                    screen_point[0] = point[0] - offset_x
+                    screen_point[1] = point[1] - offset_y
+                    
+                drawn_rect = pygame.draw.aalines(
+                    self.screen, sprite.color, True, screen_points)
+            # Store the bounding rect for this frame
+            sprite.boundingRect = drawn_rect
+            self.markDirty(drawn_rect)
+            
+            if self.showBoundingBoxes:
+                pygame.draw.rect(self.screen, (255, 255, 255),
+                               drawn_rect, 1)
+
+    def drawParticles(self, particles):
+        """Draw a particle system straight into the screen surface"""
+        view_x, view_y = self.getView()
+        drawn_rect = particles.draw(self.screen, view_x, view_y, self.alpha)
+        self.markDirty(drawn_rect)
@@ -0,0 +1,123 @@
+"""
+Text Cache
+Shared fonts, cached text surfaces and per-character glyphs for HUD text
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from ..config.config import FONT_PATH, FONT_SIZES
+
+
+class TextCache:
+    """Loads each font once and keeps rendered text around for reuse.
+
+    ``font`` opens a font file at a size the first time it is asked for.
+    ``render`` keeps rendered surfaces in LRU order keyed by font, string and
+    colour. Numbers that change every few frames (money, fuel, FPS) would
+    churn that cache, so ``blitGlyphs`` instead draws them one cached
+    character at a time. Font loads and text renders are counted per frame;
+    call ``endFrame`` once a frame to roll the counters over.
+    """
+
+    def __init__(self, maxEntries=512):
+        self.maxEntries = maxEntries
+        self.fonts = {}
+        self.entries = OrderedDict()
+        self.glyphs = {}
+        self.fontLoads = 0
+        self.renders = 0
+        self.hits = 0
+        # Counts for the frame in progress and the last finished frame
+        self.frameFontLoads = 0
+        self.frameRenders = 0
+        self.lastFrameFontLoads = 0
+        self.lastFrameRenders = 0
+
+    def font(self, size="small", path=FONT_PATH):
+        """Shared Font for a FONT_SIZES name or point size; path None is pygame's default font"""
+        if isinstance(size, str):
+            size = FONT_SIZES[size]
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(path, size)
+            self.fontLoads += 1
+            self.frameFontLoads += 1
+        return font
+
+    def render(self, text, color, size="small", path=FONT_PATH):
+        """Antialiased text surface in a shared font"""
+        return self.renderWith(self.font(size, path), text, color)
+
+    def renderWith(self, font, text, color):
+        """Antialiased text surface in the given font, rendered at most once while cached"""
+        key = (font, text, color)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        surface = font.render(text, True, color)
+        self.renders += 1
+        self.frameRenders += 1
+        self.entries[key] = surface
+        if len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def blitGlyphs(self, surface, text, color, size="small", path=FONT_PATH, **anchor):
+        """Draw text character by character from cached glyphs.
+
+        anchor positions the text like Surface.get_rect (x, right, centerx,
+        centery, ...). Returns the rect drawn.
+        """
+        font = self.font(size, path)
+        glyphs = []
+        width = 0
+        for char in text:
+            key = (font, char, color)
+            glyph = self.glyphs.get(key)
+            if glyph is None:
+                glyph = self.glyphs[key] = font.render(char, True, color)
+                self.renders += 1
+                self.frameRenders += 1
+            glyphs.append(glyph)
+            width += glyph.get_width()
+
+        rect = pygame.Rect(0, 0, width, font.get_height())
+        for name, value in anchor.items():
+            setattr(rect, name, value)
+        x = rect.x
+        for glyph in glyphs:
+            surface.blit(glyph, (x, rect.y))
+            x += glyph.get_width()
+        return rect
+
+    def endFrame(self):
+        self.lastFrameFontLoads = self.frameFontLoads
+        self.lastFrameRenders = self.frameRenders
+        self.frameFontLoads = 0
+        self.frameRenders = 0
+
+    def stats(self):
+        """Snapshot of the cache counters"""
+        return {
+            "fonts": len(self.fonts),
+            "fontLoads": self.fontLoads,
+            "renders": self.renders,
+            "hits": self.hits,
+            "entries": len(self.entries),
+            "glyphs": len(self.glyphs),
+            "lastFrameFontLoads": self.lastFrameFontLoads,
+            "lastFrameRenders": self.lastFrameRenders,
+        }
+
+    def clear(self):
+        self.entries.clear()
+        self.glyphs.clear()
+
+
+# Shared by all HUD code
+textCache = TextCache()
@@ -1,5 +1,6 @@
 from pygame import Rect
 
+
 def calculateGradient(p1, p2):
 
     # Ensure that the line is not vertical
@@ -9,9 +10,11 @@ def calculateGradient(p1, p2):
     else:
         return None
 
+
 def calculateYAxisIntersect(p, m):
     return p[1] - (m * p[0])
 
+
 def getIntersectPoint(p1, p2, p3, p4):
     m1 = calculateGradient(p1, p2)
     m2 = calculateGradient(p3, p4)
@@ -56,6 +59,7 @@ def getIntersectPoint(p1, p2, p3, p4):
         else:
             return None
 
+
 def calculateIntersectPoint(p1, p2, p3, p4):
 
     p = getIntersectPoint(p1, p2, p3, p4)
@@ -101,4 +105,41 @@ def calculateIntersectPoint(p1, p2, p3, p4):
         return None
 
     else:
-        return None
\ No newline at end of file
+        return None
+
+
+def segmentDistanceSquared(x1, y1, x2, y2, cx, cy):
+    """Squared distance from (cx, cy) to the segment (x1, y1)-(x2, y2)"""
+    dx = x2 - x1
+    dy = y2 - y1
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0:
+        t = 0
+    else:
+        t = ((cx - x1) * dx + (cy - y1) * dy) / length_sq
+        t = max(0.0, min(1.0, t))
+    px = x1 + t * dx - cx
+    py = y1 + t * dy - cy
+    return px * px + py * py
+
+
+def segmentEntersBox(x1, y1, x2, y2, min_x, min_y, max_x, max_y):
+    """Return the fraction along the segment where it first enters the box,
+    or None if it misses. A segment that starts inside returns 0."""
+    t_enter = 0.0
+    t_exit = 1.0
+    for start, delta, low, high in ((x1, x2 - x1, min_x, max_x),
+                                    (y1, y2 - y1, min_y, max_y)):
+        if delta == 0:
+            if start < low or start > high:
+                return None
+            continue
+        t1 = (low - start) / delta
+        t2 = (high - start) / delta
+        if t1 > t2:
+            t1, t2 = t2, t1
+        t_enter = max(t_enter, t1)
+        t_exit = min(t_exit, t2)
+        if t_enter > t_exit:
+            return None
+    return t_enter
@@ -0,0 +1,233 @@
+"""
+Narrow Phase
+Exact polygon overlap tests on convex pieces with the separating axis theorem
+"""
+
+# Convex pieces per pointlist: id(pointlist) -> (pointlist, pieces)
+_pieces = {}
+
+
+def polygonsCollide(sprite1, sprite2):
+    """True if the world outlines of two sprites overlap.
+
+    Unlike VectorSprite.checkPolygonCollision this also reports a sprite
+    lying completely inside the other. Far apart sprites are rejected on
+    their bounding circles before any polygon work is done.
+    """
+    reach = sprite1.getBoundingRadius() + sprite2.getBoundingRadius()
+    dx = sprite1.position.x - sprite2.position.x
+    dy = sprite1.position.y - sprite2.position.y
+    if dx * dx + dy * dy > reach * reach:
+        return False
+
+    polygon1 = sprite1.worldPolygon()
+    polygon2 = sprite2.worldPolygon()
+    if not polygon1 or not polygon2:
+        return False
+    pieces1 = [[polygon1[i] for i in piece] for piece in convexPieces(sprite1.pointlist)]
+    pieces2 = [[polygon2[i] for i in piece] for piece in convexPieces(sprite2.pointlist)]
+    for piece1 in pieces1:
+        for piece2 in pieces2:
+            if convexOverlap(piece1, piece2):
+                return True
+    return False
+
+
+def convexOverlap(a, b):
+    """Separating axis test for two convex polygons given as point lists"""
+    return not _hasSeparatingEdge(a, b) and not _hasSeparatingEdge(b, a)
+
+
+def _hasSeparatingEdge(a, b):
+    """True if one of a's edge normals separates a from b"""
+    count = len(a)
+    if count == 1:
+        return False
+    for i in range(count if count > 2 else 1):
+        x1, y1 = a[i - 1]
+        x2, y2 = a[i]
+        nx = y2 - y1
+        ny = x1 - x2
+        if nx == 0 and ny == 0:
+            continue
+        min_a = max_a = nx * x1 + ny * y1
+        for x, y in a:
+            d = nx * x + ny * y
+            if d < min_a:
+                min_a = d
+            elif d > max_a:
+                max_a = d
+        min_b = max_b = nx * b[0][0] + ny * b[0][1]
+        for x, y in b:
+            d = nx * x + ny * y
+            if d < min_b:
+                min_b = d
+            elif d > max_b:
+                max_b = d
+        if max_a < min_b or max_b < min_a:
+            return True
+    return False
+
+
+def convexPieces(pointlist):
+    """Convex pieces of an outline as tuples of indices into pointlist.
+
+    Simple outlines are ear-clipped into triangles, which are then merged
+    back into larger convex pieces. Outlines that cross themselves (the
+    saucer and space station draw some edges twice) use their convex hull.
+    Results are cached per pointlist.
+    """
+    entry = _pieces.get(id(pointlist))
+    # The entry holds on to its pointlist, so the id cannot be reused
+    if entry is not None and entry[0] is pointlist:
+        return entry[1]
+    points = [tuple(point) for point in pointlist]
+    outline = _outline(points)
+    pieces = None
+    if len(outline) >= 3 and _isSimple(points, outline):
+        pieces = _mergeConvex(points, _triangulate(points, outline))
+    if not pieces:
+        pieces = [convexHull(points)]
+    pieces = tuple(tuple(piece) for piece in pieces)
+    _pieces[id(pointlist)] = (pointlist, pieces)
+    return pieces
+
+
+def convexHull(points):
+    """Indices of the convex hull of points, counter-clockwise"""
+    order = sorted(range(len(points)), key=lambda i: points[i])
+    if len(order) <= 2:
+        return order
+
+    def half(indices):
+        chain = []
+        for i in indices:
+            while len(chain) >= 2 and _cross(points[chain[-2]], points[chain[-1]], points[i]) <= 0:
+                chain.pop()
+            chain.append(i)
+        return chain
+
+    lower = half(order)
+    upper = half(reversed(order))
+    return lower[:-1] + upper[:-1]
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _outline(points):
+    """Vertex indices with repeated points (including a closing copy of the first) dropped"""
+    outline = []
+    for i, point in enumerate(points):
+        if not outline or points[outline[-1]] != point:
+            outline.append(i)
+    while len(outline) > 1 and points[outline[0]] == points[outline[-1]]:
+        outline.pop()
+    return outline
+
+
+def _isSimple(points, outline):
+    """True if no two non-adjacent edges of the outline touch"""
+    count = len(outline)
+    edges = [(points[outline[i - 1]], points[outline[i]]) for i in range(count)]
+    for i in range(count):
+        for j in range(i + 1, count):
+            if j == i + 1 or (i == 0 and j == count - 1):
+                continue
+            if _segmentsTouch(edges[i][0], edges[i][1], edges[j][0], edges[j][1]):
+                return False
+    return True
+
+
+def _segmentsTouch(p1, p2, p3, p4):
+    d1 = _cross(p3, p4, p1)
+    d2 = _cross(p3, p4, p2)
+    d3 = _cross(p1, p2, p3)
+    d4 = _cross(p1, p2, p4)
+    if ((d1 > 0) != (d2 > 0) and d1 != 0 and d2 != 0 and
+            (d3 > 0) != (d4 > 0) and d3 != 0 and d4 != 0):
+        return True
+    return ((d1 == 0 and _onSegment(p3, p4, p1)) or (d2 == 0 and _onSegment(p3, p4, p2)) or
+            (d3 == 0 and _onSegment(p1, p2, p3)) or (d4 == 0 and _onSegment(p1, p2, p4)))
+
+
+def _onSegment(a, b, p):
+    return (min(a[0], b[0]) <= p[0] <= max(a[0], b[0]) and
+            min(a[1], b[1]) <= p[1] <= max(a[1], b[1]))
+
+
+def _triangulate(points, outline):
+    """Ear-clip a simple polygon into counter-clockwise index triangles"""
+    ring = list(outline)
+    area = sum(_cross((0, 0), points[ring[i - 1]], points[ring[i]]) for i in range(len(ring)))
+    if area < 0:
+        ring.reverse()
+
+    triangles = []
+    guard = len(ring) * len(ring)
+    while len(ring) > 3 and guard > 0:
+        guard -= 1
+        for k in range(len(ring)):
+            a, b, c = ring[k - 1], ring[k], ring[(k + 1) % len(ring)]
+            turn = _cross(points[a], points[b], points[c])
+            if turn == 0:
+                # Collinear vertex adds nothing to the shape
+                ring.pop(k)
+                break
+            if turn < 0:
+                continue
+            if any(_inTriangle(points[a], points[b], points[c], points[p])
+                   for p in ring if p not in (a, b, c)):
+                continue
+            triangles.append([a, b, c])
+            ring.pop(k)
+            break
+        else:
+            return []
+    if len(ring) == 3 and _cross(points[ring[0]], points[ring[1]], points[ring[2]]) > 0:
+        triangles.append(ring)
+    return triangles
+
+
+def _inTriangle(a, b, c, p):
+    return _cross(a, b, p) >= 0 and _cross(b, c, p) >= 0 and _cross(c, a, p) >= 0
+
+
+def _mergeConvex(points, pieces):
+    """Greedily merge pieces that share an edge while the result stays convex"""
+    pieces = [list(piece) for piece in pieces]
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(pieces)):
+            for j in range(i + 1, len(pieces)):
+                union = _joinAlongEdge(pieces[i], pieces[j])
+                if union is not None and _isConvex(points, union):
+                    pieces[i] = union
+                    pieces.pop(j)
+                    merged = True
+                    break
+            if merged:
+                break
+    return pieces
+
+
+def _joinAlongEdge(first, second):
+    """Join two CCW polygons sharing an edge, or None if they share none"""
+    for i in range(len(first)):
+        a, b = first[i], first[(i + 1) % len(first)]
+        for j in range(len(second)):
+            if second[j] == b and second[(j + 1) % len(second)] == a:
+                # Walk first from b round to a, then second from a round to b
+                rest = [second[(j + 2 + k) % len(second)] for k in range(len(second) - 2)]
+                start = (i + 1) % len(first)
+                walk = [first[(start + k) % len(first)] for k in range(len(first))]
+                return walk + rest
+    return None
+
+
+def _isConvex(points, polygon):
+    count = len(polygon)
+    return all(_cross(points[polygon[k - 2]], points[polygon[k - 1]], points[polygon[k]]) >= 0
+               for k in range(count))
@@ -0,0 +1,71 @@
+"""
+Object Pools
+Recycle short-lived game objects instead of allocating new ones
+"""
+
+
+class ObjectPool:
+    """Hands out recycled objects and takes them back when they die.
+
+    Pooled classes implement ``reset`` with the same arguments as their
+    constructor so a recycled object can be reinitialised in place. Each
+    acquired object remembers its pool in ``obj.pool`` so whoever retires it
+    (normally Universe.flushRemovals) can hand it back.
+    """
+
+    def __init__(self, name, factory, maxFree=256):
+        self.name = name
+        self.factory = factory
+        self.maxFree = maxFree
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.inUse = 0
+        self.highWater = 0
+
+    def acquire(self, *args):
+        """Return a recycled object reset with args, or a new one"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.hits += 1
+        else:
+            obj = self.factory(*args)
+            obj.pool = self
+            self.misses += 1
+        obj.pooled = False
+        self.inUse += 1
+        if self.inUse > self.highWater:
+            self.highWater = self.inUse
+        return obj
+
+    def release(self, obj):
+        """Take an object back; releasing twice is ignored"""
+        if getattr(obj, 'pool', None) is not self or obj.pooled:
+            return
+        obj.pooled = True
+        self.inUse -= 1
+        if len(self.free) < self.maxFree:
+            self.free.append(obj)
+
+    def hitRate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Snapshot of the pool's counters"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hitRate(),
+            "inUse": self.inUse,
+            "highWater": self.highWater,
+            "free": len(self.free),
+        }
+
+
+def releaseToPool(obj):
+    """Return an object to its pool if it came from one"""
+    pool = getattr(obj, 'pool', None)
+    if pool is not None:
+        pool.release(obj)
@@ -0,0 +1,95 @@
+"""
+Profiler
+Wall-clock timings for the named stages of a frame
+"""
+
+import time
+from collections import deque
+
+
+class ProfileSection:
+    """Accumulates the time spent inside ``with`` blocks for one stage"""
+
+    def __init__(self, name, historyLength=120):
+        self.name = name
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.started = 0.0
+        # Time spent in the current frame, and in each of the last few frames
+        self.frameTime = 0.0
+        self.history = deque(maxlen=historyLength)
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.started
+        self.calls += 1
+        self.total += elapsed
+        self.frameTime += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        return False
+
+    def rolling(self):
+        """(min, mean, max) seconds per frame over the recorded history"""
+        if not self.history:
+            return 0.0, 0.0, 0.0
+        history = self.history
+        return min(history), sum(history) / len(history), max(history)
+
+
+class NullSection:
+    """Stand-in returned while profiling is off; entering it does nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_nullSection = NullSection()
+
+
+class Profiler:
+    """Times stages of the game loop by name.
+
+    Wrap a stage in ``with profiler.section("name"):``. Sections are created
+    on first use and reused, so a running profiler allocates nothing per
+    frame. A disabled profiler hands back a shared no-op section.
+
+    Calling ``endFrame`` once a frame keeps the last ``historyLength``
+    per-frame times of every section for rolling statistics.
+    """
+
+    def __init__(self, enabled=True, historyLength=120):
+        self.enabled = enabled
+        self.historyLength = historyLength
+        self.sections = {}
+
+    def section(self, name):
+        if not self.enabled:
+            return _nullSection
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = ProfileSection(name, self.historyLength)
+        return section
+
+    def endFrame(self):
+        """Close the current frame's times into each section's history"""
+        for section in self.sections.values():
+            section.history.append(section.frameTime)
+            section.frameTime = 0.0
+
+    def reset(self):
+        self.sections = {}
+
+    def report(self):
+        """(name, calls, total seconds, mean seconds, max seconds) per section, slowest first"""
+        rows = [(s.name, s.calls, s.total, s.total / s.calls if s.calls else 0.0, s.max)
+                for s in self.sections.values()]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
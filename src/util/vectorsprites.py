@@ -3,13 +3,101 @@ import sys
 import os
 import math
 import random
+from collections import OrderedDict
 from math import *
 from .vector2d import *
 from .geometry import *
 
 
+class ShapeCache:
+    """Bounded LRU cache of rotated sprite outlines.
+
+    Entries are keyed by the pointlist object and the angle rounded to
+    ``angleStep`` degrees, so every sprite sharing a shape prototype shares
+    its rotations. Rotated points are truncated to ints exactly like
+    VectorSprite.rotatePoint.
+    """
+
+    def __init__(self, maxEntries=8192, angleStep=1):
+        self.maxEntries = maxEntries
+        self.angleStep = angleStep
+        self.steps = int(round(360 / angleStep))
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def rotated(self, pointlist, angle):
+        """Return pointlist rotated by angle as a tuple of (x, y) ints"""
+        step = int(round(angle / self.angleStep)) % self.steps
+        key = (id(pointlist), step)
+        entry = self.entries.get(key)
+        # The entry holds on to its pointlist, so the id cannot be reused
+        if entry is not None and entry[0] is pointlist:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        theta = radians(step * self.angleStep)
+        cosVal = math.cos(theta)
+        sinVal = math.sin(theta)
+        points = tuple((int(x * cosVal + y * sinVal), int(y * cosVal - x * sinVal))
+                       for x, y in pointlist)
+        self.entries[key] = (pointlist, points)
+        if len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+        return points
+
+    def hitRate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Snapshot of the cache's counters"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRate": self.hitRate(),
+            "entries": len(self.entries),
+        }
+
+    def clear(self):
+        self.entries.clear()
+
+
+# Shared by every VectorSprite
+shapeCache = ShapeCache()
+
+# Scaled outlines shared between sprites of the same shape and size
+_prototypes = {}
+
+
+def shapePrototype(pointlist, scale=1):
+    """Return a shared, scaled copy of pointlist as a tuple of (x, y) ints"""
+    key = (tuple(tuple(point) for point in pointlist), scale)
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        # Truncate to ints like VectorSprite.scale
+        prototype = tuple((int(x * scale), int(y * scale)) for x, y in key[0])
+        _prototypes[key] = prototype
+    return prototype
+
+
 class VectorSprite:
 
+    # (x, y, angle, pointlist) that transformedPointlist was built from
+    polygonKey = None
+
+    # Drawn from the Stage's SpriteAtlas when one is enabled
+    atlasSprite = False
+
+    # Bounds cached for the current polygonKey and radius for the pointlist
+    boundsKey = None
+    cachedBounds = None
+    cachedRect = None
+    radiusKey = None
+    cachedRadius = 0
+
     def __init__(self, position, heading, pointlist, angle=0, color=(255, 255, 255)):
         self.position = position
         self.heading = heading
@@ -23,15 +111,24 @@ class VectorSprite:
 
     # rotate each x,y coord by the angle, then translate it to the x,y position
     def rotateAndTransform(self):
-        newPointList = [self.rotatePoint(point) for point in self.pointlist]
+        x = self.position.x
+        y = self.position.y
+        angle = self.angle
         self.transformedPointlist = [
-            self.translatePoint(point) for point in newPointList]
+            [px + x, py + y] for px, py in shapeCache.rotated(self.pointlist, angle)]
+        self.polygonKey = (x, y, angle, self.pointlist)
 
-    # draw the sprite
-    def draw(self):
-        self.rotateAndTransform()
+    # World-space outline, only rebuilt when the sprite moved, turned or
+    # changed shape since the last call. Collision checks rely on this.
+    def worldPolygon(self):
+        if self.polygonKey != (self.position.x, self.position.y, self.angle, self.pointlist):
+            self.rotateAndTransform()
         return self.transformedPointlist
 
+    # draw the sprite (the returned points are in world coordinates)
+    def draw(self):
+        return self.worldPolygon()
+
     # translate each point to the current x, y position
     def translatePoint(self, point):
         newPoint = []
@@ -79,39 +176,56 @@ class VectorSprite:
         else:
             return False
             
+    def getBounds(self):
+        """World-space (min_x, min_y, max_x, max_y) of the outline, or None.
+        Cached until the sprite moves, turns or changes shape."""
+        polygon = self.worldPolygon()
+        if self.boundsKey is not self.polygonKey:
+            if polygon:
+                # Find min/max x,y from transformed points
+                x_coords = [point[0] for point in polygon]
+                y_coords = [point[1] for point in polygon]
+                self.cachedBounds = (min(x_coords), min(y_coords),
+                                     max(x_coords), max(y_coords))
+            else:
+                self.cachedBounds = None
+            self.cachedRect = None
+            self.boundsKey = self.polygonKey
+        return self.cachedBounds
+
+    def getBoundingRadius(self):
+        """Radius around position that contains the outline at any angle"""
+        if self.radiusKey is not self.pointlist:
+            self.cachedRadius = max((math.hypot(x, y) for x, y in self.pointlist), default=0)
+            self.radiusKey = self.pointlist
+        return self.cachedRadius
+
     def getBoundingRect(self):
         """Compute and return bounding rectangle for this sprite"""
-        if not hasattr(self, 'transformedPointlist') or not self.transformedPointlist:
-            # Generate transformed points if they don't exist
-            self.rotateAndTransform()
+        bounds = self.getBounds()
             
-        if not self.transformedPointlist:
+        if bounds is None:
             # Fallback to a small rectangle around the position
             return pygame.Rect(int(self.position.x - 5), int(self.position.y - 5), 10, 10)
             
-        # Find min/max x,y from transformed points
-        x_coords = [point[0] for point in self.transformedPointlist]
-        y_coords = [point[1] for point in self.transformedPointlist]
-        
-        min_x = min(x_coords)
-        max_x = max(x_coords)
-        min_y = min(y_coords)
-        max_y = max(y_coords)
-        
-        width = max_x - min_x
-        height = max_y - min_y
-        
-        return pygame.Rect(int(min_x), int(min_y), int(width) + 1, int(height) + 1)
+        if self.cachedRect is None:
+            min_x, min_y, max_x, max_y = bounds
+            width = max_x - min_x
+            height = max_y - min_y
+            self.cachedRect = pygame.Rect(int(min_x), int(min_y), int(width) + 1, int(height) + 1)
+        return self.cachedRect
 
     # Check each line from pointlist1 for intersection with
     # the lines in pointlist2
     def checkPolygonCollision(self, target):
-        for i in range(0, len(self.transformedPointlist)):
-            for j in range(0, len(target.transformedPointlist)):
-                p1 = self.transformedPointlist[i-1]
-                p2 = self.transformedPointlist[i]
-                p3 = target.transformedPointlist[j-1]
-                p4 = target.transformedPointlist[j]
+        polygon = self.worldPolygon()
+        targetPolygon = target.worldPolygon()
+        for i in range(0, len(polygon)):
+            for j in range(0, len(targetPolygon)):
+                p1 = polygon[i-1]
+                p2 = polygon[i]
+                p3 = targetPolygon[j-1]
+                p4 = targetPolygon[j]
                 p = calculateIntersectPoint(p1, p2, p3, p4)
                 if (p != None):
                     return p